@@ -1,5 +1,12 @@
-from typing import List, Union, Self, Any
+import asyncio
+from typing import List, Union, Self, Any, Tuple, AsyncIterable, Optional
 
+from ..core.builder import Builder
+from ..core.bulk_executor import BulkExecutor
+from ..core.bulk_result import BulkResult
+from ..core.e_query import EQuery
+from ..core.query import Query
+from ..enums.statement_kind import StatementKind
 from ..exceptions.query_builder_exception import QueryBuilderException
 from ..utils.escape import Escape
 
@@ -7,9 +14,16 @@ from ..utils.escape import Escape
 class AddRow(Escape):
     """Class to manage adding rows to a table for SQL operations."""
 
+    _MAX_CHUNK_BYTES = BulkExecutor.MAX_CHUNK_BYTES
+    _MAX_CHUNK_ROWS = BulkExecutor.MAX_CHUNK_ROWS
+
     def __init__(self):
         self._columns: List[str] = []
-        self._rows: List[List[Union[str, bool, int, float]]] = []
+        # Append-only buffer of rows rendered once as "(...)" fragments, with their byte sizes
+        self._rows: List[str] = []
+        self._row_sizes: List[int] = []
+        self._rows_size: int = 0
+        self._return_insert_ids: bool = False
 
     def add_row(self, row: List[Union[Any]], escape_value: bool = True) -> Self:
         """
@@ -30,7 +44,11 @@ class AddRow(Escape):
         if escape_value:
             row = [self._escape(value) for value in row]
 
-        self._rows.append(row)
+        rendered_row = Builder.insert_row(row)
+        row_size = self._rendered_size(rendered_row)
+        self._rows.append(rendered_row)
+        self._row_sizes.append(row_size)
+        self._rows_size += row_size
         return self
 
     def add_rows(self, rows: List[List[Union[Any]]], escape_value: bool = True) -> Self:
@@ -49,3 +67,140 @@ class AddRow(Escape):
             self.add_row(row, escape_value)
 
         return self
+
+    def compile_chunks(self, max_rows: int = _MAX_CHUNK_ROWS, max_bytes: int = _MAX_CHUNK_BYTES) -> List[Union[Query, EQuery]]:
+        """
+        Compile the rows into several statements, each within the row count and byte size limits.
+
+        :param max_rows: Maximum number of rows per statement.
+        :param max_bytes: Maximum statement size in bytes, keep it below the server's max_allowed_packet.
+        :raises QueryBuilderException: If the statement can't be built or a single row exceeds max_bytes.
+        :return: A list of Query or EQuery objects, one per chunk.
+        """
+        return [self._to_query(query) for _, _, query in self._compile_chunks(max_rows, max_bytes)]
+
+    async def execute_chunked(self, max_rows: int = _MAX_CHUNK_ROWS, max_bytes: int = _MAX_CHUNK_BYTES,
+                              concurrency: int = 4, in_transaction: bool = False) -> BulkResult:
+        """
+        Execute the rows as several chunked statements on the write pool.
+
+        :param max_rows: Maximum number of rows per statement.
+        :param max_bytes: Maximum statement size in bytes, keep it below the server's max_allowed_packet.
+        :param concurrency: Maximum number of chunks executed at the same time.
+        :param in_transaction: Run the chunks sequentially inside one transaction instead.
+        :raises QueryBuilderException: If there is no factory or the statement can't be built.
+        :return: BulkResult with the aggregate affected rows, insert ids (every id in row_insert_ids when
+                 insert ids are requested) and per-chunk failures.
+        """
+        if self._factory is None:
+            raise QueryBuilderException("Factory required to execute")
+
+        chunks = self._compile_chunks(max_rows, max_bytes)
+        return await BulkExecutor(self._factory, self._return_insert_ids).execute(chunks, concurrency, in_transaction)
+
+    async def from_async_iterable(self, source: AsyncIterable[List[Any]], batch_rows: int = _MAX_CHUNK_ROWS,
+                                  batch_bytes: int = _MAX_CHUNK_BYTES, escape_value: bool = True) -> BulkResult:
+        """
+        Consume rows lazily from an async iterable and flush them to the write pool in batches.
+
+        At most one batch is in flight while the next one fills, so memory stays bounded to about two
+        batches; when the pool is saturated the flush takes longer and the source is read more slowly.
+        The rows are not kept on the instance.
+
+        :param source: Async iterable of rows (each row is a list of values).
+        :param batch_rows: Maximum number of rows per statement.
+        :param batch_bytes: Maximum statement size in bytes, keep it below the server's max_allowed_packet.
+        :param escape_value: Whether to escape the values.
+        :raises QueryBuilderException: If there is no factory, the statement can't be built or a row is invalid.
+        :return: BulkResult with the aggregate affected rows, insert ids (every id in row_insert_ids when
+                 insert ids are requested) and per-batch failures.
+        """
+        if self._factory is None:
+            raise QueryBuilderException("Factory required to execute")
+
+        if batch_rows < 1:
+            raise QueryBuilderException("Chunk max rows must be positive")
+
+        self._validate_compile(rows_required=False)
+
+        executor = BulkExecutor(self._factory, self._return_insert_ids)
+        bulk_result = BulkResult(is_success=True)
+        max_bytes = batch_bytes - len(self._compile_rows([]).encode())
+        pending: Optional[Tuple[asyncio.Task, int, int]] = None
+        batch = []
+        size = 0
+        start = 0
+        index = 0
+
+        async def wait_pending() -> None:
+            nonlocal pending
+            if pending is not None:
+                task, first, last = pending
+                pending = None
+                executor.add_result(bulk_result, first, last, await task)
+
+        try:
+            async for row in source:
+                if len(row) != len(self._columns):
+                    raise QueryBuilderException("Columns and Rows Must Have same counts")
+
+                if escape_value:
+                    row = [self._escape(value) for value in row]
+
+                rendered_row = Builder.insert_row(row)
+                row_size = self._rendered_size(rendered_row) + 2
+                if row_size > max_bytes:
+                    raise QueryBuilderException(f"Row {index} exceeds the chunk size limit")
+
+                if batch and (len(batch) >= batch_rows or size + row_size > max_bytes):
+                    # Only one batch in flight: waiting for it is the backpressure on the source
+                    await wait_pending()
+                    task = asyncio.ensure_future(executor.execute_chunk(self._compile_rows(batch)))
+                    pending = (task, start, index)
+                    batch = []
+                    size = 0
+                    start = index
+
+                batch.append(rendered_row)
+                size += row_size
+                index += 1
+
+            await wait_pending()
+            if batch:
+                executor.add_result(bulk_result, start, index,
+                                    await executor.execute_chunk(self._compile_rows(batch)))
+        finally:
+            await wait_pending()
+
+        return bulk_result
+
+    def _compile_chunks(self, max_rows: int, max_bytes: int) -> List[Tuple[int, int, str]]:
+        """Split the rows by count and rendered size, returning (start, end, query) tuples."""
+        if max_rows < 1:
+            raise QueryBuilderException("Chunk max rows must be positive")
+
+        self._validate_compile()
+
+        # Statement size without any row, rows add their fragment plus the ", " separator
+        overhead = len(self._compile_rows([]).encode())
+        row_count = len(self._rows)
+        if row_count <= max_rows and overhead + self._rows_size + 2 * row_count <= max_bytes:
+            return [(0, row_count, self._compile_rows(self._rows))]
+
+        chunks = []
+        row_sizes = [row_size + 2 for row_size in self._row_sizes]
+        for start, end in BulkExecutor.chunk_ranges(row_sizes, max_rows, max_bytes - overhead):
+            chunks.append((start, end, self._compile_rows(self._rows[start:end])))
+
+        return chunks
+
+    @staticmethod
+    def _rendered_size(rendered_row: str) -> int:
+        """Size of a rendered row in bytes, skipping the encode for ASCII rows."""
+        return len(rendered_row) if rendered_row.isascii() else len(rendered_row.encode())
+
+    def _to_query(self, query: str) -> Union[Query, EQuery]:
+        if self._factory is None:
+            return Query(query)
+
+        return EQuery(query, self._factory, self._return_insert_ids, StatementKind.WRITE)
@@ -0,0 +1,86 @@
+import asyncio
+import inspect
+import time
+from typing import Callable, Optional
+
+from ..core.bulk_executor import BulkExecutor
+from ..core.bulk_result import BulkResult
+from ..exceptions.query_builder_exception import QueryBuilderException
+
+
+class Batch:
+    """Run a DELETE or UPDATE in small LIMIT-ed batches until it stops matching rows."""
+
+    async def execute_batched(self, batch_size: int = 1000, primary_key: str = 'id', sleep: float = 0.0,
+                              throttle_ratio: Optional[float] = None, on_progress: Optional[Callable] = None,
+                              cancel_event: Optional[asyncio.Event] = None,
+                              max_batches: Optional[int] = None) -> BulkResult:
+        """
+        Execute the statement repeatedly with ORDER BY primary key LIMIT batch_size, until it affects no row.
+
+        Each batch only locks a few rows and commits on its own, so large purges don't hold locks for long
+        or flood the replicas. An UPDATE must stop matching the rows it changed, otherwise it never ends.
+
+        :param batch_size: Rows per statement.
+        :param primary_key: Column ordering the batches, when no order is set.
+        :param sleep: Fixed pause in seconds between batches.
+        :param throttle_ratio: Additional pause of throttle_ratio times the latency of the last batch, so the
+                               pauses grow when the server slows down.
+        :param on_progress: Called (or awaited) with the BulkResult so far after each batch.
+        :param cancel_event: Stop before the next batch once this event is set.
+        :param max_batches: Stop after this many batches.
+        :raises QueryBuilderException: If there is no factory or the batch size isn't positive.
+        :return: BulkResult with the total affected rows, one chunk per batch.
+        """
+        if self._factory is None:
+            raise QueryBuilderException("Factory required to execute")
+
+        if batch_size < 1:
+            raise QueryBuilderException("Batch size must be positive")
+
+        query = self._compile_batch(batch_size, primary_key)
+        executor = BulkExecutor(self._factory)
+        bulk_result = BulkResult(is_success=True)
+
+        while max_batches is None or bulk_result.chunk_count < max_batches:
+            if cancel_event is not None and cancel_event.is_set():
+                bulk_result.message = "Cancelled"
+                break
+
+            started_at = time.monotonic()
+            result = await executor.execute_chunk(query)
+            latency = time.monotonic() - started_at
+
+            affected_rows = result.affected_rows or 0
+            executor.add_result(bulk_result, bulk_result.affected_rows,
+                                bulk_result.affected_rows + affected_rows, result)
+
+            if on_progress is not None:
+                progress = on_progress(bulk_result)
+                if inspect.isawaitable(progress):
+                    await progress
+
+            if not result.is_success or affected_rows == 0:
+                break
+
+            pause = sleep + (throttle_ratio * latency if throttle_ratio else 0.0)
+            if pause > 0:
+                await asyncio.sleep(pause)
+
+        return bulk_result
+
+    def _compile_batch(self, batch_size: int, primary_key: str) -> str:
+        """Compile the statement with the batch limit, leaving the builder unchanged."""
+        if self._count is not None:
+            raise QueryBuilderException("Batched execution sets the limit itself")
+
+        order_by = dict(self._order_by)
+        try:
+            if not self._order_by:
+                self.add_order(primary_key)
+            self._count = batch_size
+
+            return self.compile().get_query_as_string()
+        finally:
+            self._order_by = order_by
+            self._count = None
@@ -9,6 +9,7 @@ class Group(Escape):
 
     def __init__(self):
         self._group_by: List[str] = []
+        self._with_rollup: bool = False
 
     def group_by(self, group_columns: Union[str, List[str]], escape: bool = True) -> Self:
         """
@@ -43,3 +44,13 @@ class Group(Escape):
             raise QueryBuilderException("group_columns must be a string or list of strings")
 
         return self
+
+    def with_rollup(self, enable: bool = True) -> Self:
+        """
+        Add WITH ROLLUP to the GROUP BY clause, producing super-aggregate (total) rows.
+
+        :param enable: Whether to enable the rollup.
+        :return: self, for chaining purposes.
+        """
+        self._with_rollup = enable
+        return self
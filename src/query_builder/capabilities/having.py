@@ -0,0 +1,87 @@
+from typing import List, Self
+
+from ..utils.escape import Escape
+from .where import Where
+
+
+class Having(Escape):
+    """Class to manage HAVING clause for SQL queries.
+
+    The conditions are built with the same operator set as ``Where``, so keys
+    can be aliases (escaped by default) or aggregate expressions such as
+    ``COUNT(*)`` (pass ``escape_key=False``).
+    """
+
+    def __init__(self):
+        self._having = Where()
+
+    @property
+    def _having_statements(self) -> List:
+        return self._having._where_statements
+
+    def having(self, key: str, value, escape_value=True, escape_key=True) -> Self:
+        """Add a HAVING clause with an equality condition."""
+        self._having.where(key, value, escape_value, escape_key)
+        return self
+
+    def having_not_equal(self, key: str, value, escape_value=True, escape_key=True) -> Self:
+        """Add a HAVING clause with a 'not equal' condition."""
+        self._having.where_not_equal(key, value, escape_value, escape_key)
+        return self
+
+    def having_in(self, key: str, values, escape_value=True, escape_key=True) -> Self:
+        """Add a HAVING clause with an 'IN' condition."""
+        self._having.where_in(key, values, escape_value, escape_key)
+        return self
+
+    def having_not_in(self, key: str, values, escape_value=True, escape_key=True) -> Self:
+        """Add a HAVING clause with a 'NOT IN' condition."""
+        self._having.where_not_in(key, values, escape_value, escape_key)
+        return self
+
+    def having_greater(self, key: str, greater_than, greater_equals=False, escape_value=True,
+                       escape_key=True) -> Self:
+        """Add a HAVING clause with a 'greater than' condition."""
+        self._having.where_greater(key, greater_than, greater_equals, escape_value, escape_key)
+        return self
+
+    def having_lesser(self, key: str, lesser_than, lesser_equals=False, escape_value=True,
+                      escape_key=True) -> Self:
+        """Add a HAVING clause with a 'less than' condition."""
+        self._having.where_lesser(key, lesser_than, lesser_equals, escape_value, escape_key)
+        return self
+
+    def having_between(self, key: str, less_value, great_value, escape_value=True, escape_key=True) -> Self:
+        """Add a HAVING clause with a 'BETWEEN' condition."""
+        self._having.where_between(key, less_value, great_value, escape_value, escape_key)
+        return self
+
+    def having_not_between(self, key: str, less_value, great_value, escape_value=True, escape_key=True) -> Self:
+        """Add a HAVING clause with a 'NOT BETWEEN' condition."""
+        self._having.where_not_between(key, less_value, great_value, escape_value, escape_key)
+        return self
+
+    def having_is_null(self, key: str, escape_key=True) -> Self:
+        """Add a HAVING clause with an 'IS NULL' condition."""
+        self._having.where_is_null(key, escape_key)
+        return self
+
+    def having_is_not_null(self, key: str, escape_key=True) -> Self:
+        """Add a HAVING clause with an 'IS NOT NULL' condition."""
+        self._having.where_is_not_null(key, escape_key)
+        return self
+
+    def having_like(self, key: str, value, begin=True, end=True, escape_value=True, escape_key=True) -> Self:
+        """Add a HAVING clause with a 'LIKE' condition."""
+        self._having.where_like(key, value, begin, end, escape_value, escape_key)
+        return self
+
+    def having_query(self, query: str) -> Self:
+        """Add a custom HAVING clause (non-escaped)."""
+        self._having.where_query(query)
+        return self
+
+    def or_having(self) -> Self:
+        """Start a new OR condition group for HAVING."""
+        self._having.or_condition()
+        return self
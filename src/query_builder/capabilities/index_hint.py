@@ -0,0 +1,76 @@
+from typing import Dict, List, Optional, Self, Union
+
+from ..enums.index_hint_scope import IndexHintScope
+from ..enums.index_hint_type import IndexHintType
+from ..exceptions.query_builder_exception import QueryBuilderException
+from ..utils.escape import Escape
+
+
+class IndexHint(Escape):
+    """Class to manage index hints (USE/FORCE/IGNORE INDEX) for SQL queries."""
+
+    def __init__(self):
+        # Hints keyed by target: None is the main table, otherwise a joined table name or alias
+        self._index_hints: Dict[Optional[str], List[str]] = {}
+
+    def use_index(self, indexes: Union[str, List[str]], scope: Union[IndexHintScope, str, None] = None,
+                  table: Optional[str] = None, escape: bool = True) -> Self:
+        """Add a USE INDEX hint. An empty list tells MySQL to use no index."""
+        return self._index_hint(IndexHintType.USE, indexes, scope, table, escape)
+
+    def force_index(self, indexes: Union[str, List[str]], scope: Union[IndexHintScope, str, None] = None,
+                    table: Optional[str] = None, escape: bool = True) -> Self:
+        """Add a FORCE INDEX hint."""
+        return self._index_hint(IndexHintType.FORCE, indexes, scope, table, escape)
+
+    def ignore_index(self, indexes: Union[str, List[str]], scope: Union[IndexHintScope, str, None] = None,
+                     table: Optional[str] = None, escape: bool = True) -> Self:
+        """Add an IGNORE INDEX hint."""
+        return self._index_hint(IndexHintType.IGNORE, indexes, scope, table, escape)
+
+    def _validate_index_hints(self, join_keys: List[str]) -> None:
+        """
+        Ensure every index hint targets the main table or an existing joined table.
+
+        :param join_keys: Names or aliases of the joined tables.
+        :raises QueryBuilderException: If a hint targets an unknown table.
+        """
+        for key in self._index_hints:
+            if key is not None and key not in join_keys:
+                raise QueryBuilderException(f"Index hint target '{key}' is not a joined table")
+
+    def _index_hint(self, hint_type: IndexHintType, indexes: Union[str, List[str]],
+                    scope: Union[IndexHintScope, str, None], table: Optional[str], escape: bool) -> Self:
+        """
+        Add an index hint for the main table or for a joined table.
+
+        :param hint_type: Type of the hint (USE, FORCE, IGNORE).
+        :param indexes: Index name or list of index names.
+        :param scope: Optional scope of the hint (JOIN, ORDER BY, GROUP BY).
+        :param table: Joined table name or alias the hint applies to; None for the main table.
+        :param escape: Whether to escape the index names.
+        :raises QueryBuilderException: If the indexes or scope are invalid.
+        :return: self, for chaining purposes.
+        """
+        if isinstance(indexes, str):
+            indexes = [indexes]
+
+        if len(indexes) == 0 and hint_type != IndexHintType.USE:
+            raise QueryBuilderException(f"{hint_type.value} INDEX requires at least one index")
+
+        if isinstance(scope, str):
+            try:
+                scope = IndexHintScope(scope.upper())
+            except ValueError:
+                raise QueryBuilderException("IndexHintScope Not Valid")
+
+        indexes = [self._key_escape(index) if escape else index for index in indexes]
+
+        hint = f"{hint_type.value} INDEX"
+        if scope is not None:
+            hint += f" FOR {scope.value}"
+        hint += f" ({', '.join(indexes)})"
+
+        key = table.strip() if table is not None else None
+        self._index_hints.setdefault(key, []).append(hint)
+        return self
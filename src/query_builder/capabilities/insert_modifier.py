@@ -0,0 +1,43 @@
+from typing import Self
+
+from ..exceptions.query_builder_exception import QueryBuilderException
+from ..utils.escape import Escape
+
+
+class InsertModifier(Escape):
+    """Class to manage the INSERT IGNORE and REPLACE variants of insert statements."""
+
+    def __init__(self):
+        self._insert_keyword: str = "INSERT"
+
+    def ignore(self, enable: bool = True) -> Self:
+        """
+        Use INSERT IGNORE, turning duplicate-key and conversion errors into warnings.
+
+        :param enable: Whether to enable the modifier.
+        :raises QueryBuilderException: If REPLACE is already set.
+        :return: self, for chaining purposes.
+        """
+        return self._set_insert_keyword("INSERT IGNORE", enable)
+
+    def replace(self, enable: bool = True) -> Self:
+        """
+        Use REPLACE, deleting rows with a duplicate key before inserting the new ones.
+
+        :param enable: Whether to enable the modifier.
+        :raises QueryBuilderException: If IGNORE is already set.
+        :return: self, for chaining purposes.
+        """
+        return self._set_insert_keyword("REPLACE", enable)
+
+    def _set_insert_keyword(self, keyword: str, enable: bool) -> Self:
+        if not enable:
+            if self._insert_keyword == keyword:
+                self._insert_keyword = "INSERT"
+            return self
+
+        if self._insert_keyword not in ("INSERT", keyword):
+            raise QueryBuilderException("IGNORE and REPLACE can't be used together")
+
+        self._insert_keyword = keyword
+        return self
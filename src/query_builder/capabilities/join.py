@@ -1,5 +1,6 @@
-from typing import List, Optional, Self
+from typing import Dict, List, Optional, Self, Union
 
+from ..core.builder import Builder
 from ..enums.join_direction import JoinDirection
 from ..exceptions.query_builder_exception import QueryBuilderException
 from ..utils.escape import Escape
@@ -8,8 +9,10 @@ from ..utils.escape import Escape
 class Join(Escape):
     """Class to manage SQL joins."""
 
+    _ON_OPERATORS = ("=", "!=", "<>", "<", "<=", ">", ">=", "<=>")
+
     def __init__(self):
-        self._joins: List[str] = []
+        self._joins: List[Dict] = []
 
     def left_join(self, table: str, from_on: str, to_on: str, escape_on: bool = True, alias: Optional[str] = None) -> Self:
         """Add a LEFT JOIN clause."""
@@ -24,14 +27,117 @@ class Join(Escape):
         return self._join(JoinDirection.INNER.value, table, from_on, to_on, escape_on, alias)
 
     def full_join(self, table: str, from_on: str, to_on: str, escape_on: bool = True, alias: Optional[str] = None) -> Self:
-        """Add a FULL JOIN clause."""
+        """Add a FULL JOIN clause. MySQL doesn't support it, so compiling the query raises."""
         return self._join(JoinDirection.FULL.value, table, from_on, to_on, escape_on, alias)
 
+    def straight_join(self, table: str, from_on: str, to_on: str, escape_on: bool = True, alias: Optional[str] = None) -> Self:
+        """Add a STRAIGHT_JOIN clause, which reads the left table before the right one."""
+        return self._join(JoinDirection.STRAIGHT.value, table, from_on, to_on, escape_on, alias)
+
+    def cross_join(self, table: str, alias: Optional[str] = None) -> Self:
+        """Add a CROSS JOIN clause."""
+        return self._add_join(JoinDirection.CROSS.value, table, alias)
+
+    def join_using(self, table: str, columns: Union[str, List[str]],
+                   join_type: Union[JoinDirection, str] = JoinDirection.INNER,
+                   escape: bool = True, alias: Optional[str] = None) -> Self:
+        """
+        Add a join clause matching columns with the same name in both tables (JOIN ... USING (...)).
+
+        :param table: The name of the table to join.
+        :param columns: A column or list of columns present in both tables.
+        :param join_type: Type of the join (INNER, LEFT, RIGHT, CROSS).
+        :param escape: Whether to escape the columns.
+        :param alias: Optional alias for the joining table.
+        :raises QueryBuilderException: If the columns or the join type are invalid.
+        :return: self, for chaining purposes.
+        """
+        join_type = self._join_direction(join_type)
+        if join_type == JoinDirection.STRAIGHT:
+            raise QueryBuilderException("STRAIGHT_JOIN doesn't support USING")
+
+        if isinstance(columns, str):
+            columns = [columns]
+
+        if len(columns) == 0:
+            raise QueryBuilderException("Using columns are required")
+
+        using = [self._key_escape(column) if escape else column for column in columns]
+        return self._add_join(join_type.value, table, alias, using=using)
+
+    def join_sub(self, query, alias: str, from_on: str, to_on: str,
+                 join_type: Union[JoinDirection, str] = JoinDirection.INNER, escape_on: bool = True) -> Self:
+        """
+        Join a derived table built from another query.
+
+        :param query: A Select builder, or a compiled Query/EQuery.
+        :param alias: The alias of the derived table (required by MySQL).
+        :param from_on: The column from the base table.
+        :param to_on: The column from the derived table.
+        :param join_type: Type of the join (INNER, LEFT, RIGHT, STRAIGHT).
+        :param escape_on: Whether to escape the ON fields.
+        :raises QueryBuilderException: If the alias is empty.
+        :return: self, for chaining purposes.
+        """
+        if not alias or not alias.strip():
+            raise QueryBuilderException("Derived table alias is required")
+
+        self._add_join(self._join_direction(join_type).value, f"({Builder.sub_query(query)})", alias,
+                       escape_table=False)
+        return self.on(from_on, to_on, escape_on=escape_on)
+
+    def on(self, from_on: str, to_on: str, operator: str = "=", escape_on: bool = True) -> Self:
+        """Add a column comparison to the ON conditions of the last join."""
+        if escape_on:
+            from_on = self._key_escape(from_on)
+            to_on = self._key_escape(to_on)
+
+        return self._append_on(from_on, self._on_operator(operator), to_on)
+
+    def on_value(self, key: str, value, operator: str = "=", escape_value: bool = True, escape_key: bool = True) -> Self:
+        """Add a literal-value comparison to the ON conditions of the last join."""
+        if escape_value:
+            value = self._escape(value)
+
+        if escape_key:
+            key = self._key_escape(key)
+
+        return self._append_on(key, self._on_operator(operator), value)
+
+    def on_in(self, key: str, values, escape_value: bool = True, escape_key: bool = True) -> Self:
+        """Add an 'IN' condition to the ON conditions of the last join."""
+        if escape_value:
+            values = [self._escape(v) for v in values]
+
+        if escape_key:
+            key = self._key_escape(key)
+
+        return self._append_on(key, "IN", f"({', '.join(map(str, values))})")
+
+    def on_between(self, key: str, less_value, great_value, escape_value: bool = True, escape_key: bool = True) -> Self:
+        """Add a 'BETWEEN' condition to the ON conditions of the last join."""
+        if escape_value:
+            less_value = self._escape(less_value)
+            great_value = self._escape(great_value)
+
+        if escape_key:
+            key = self._key_escape(key)
+
+        return self._append_on(key, "BETWEEN", f"{less_value} AND {great_value}")
+
+    def on_is_null(self, key: str, escape_key: bool = True) -> Self:
+        """Add an 'IS NULL' condition to the ON conditions of the last join."""
+        return self._append_on(self._key_escape(key) if escape_key else key, "IS", "NULL")
+
+    def on_is_not_null(self, key: str, escape_key: bool = True) -> Self:
+        """Add an 'IS NOT NULL' condition to the ON conditions of the last join."""
+        return self._append_on(self._key_escape(key) if escape_key else key, "IS NOT", "NULL")
+
     def _join(self, join_type: str, table: str, from_on: str, to_on: str, escape_on: bool = True, alias: Optional[str] = None) -> Self:
         """
         Add a join clause with the specified type.
 
-        :param join_type: Type of the join (LEFT, RIGHT, INNER, FULL).
+        :param join_type: Type of the join (LEFT, RIGHT, INNER, FULL, STRAIGHT).
         :param table: The name of the table to join.
         :param from_on: The column from the base table.
         :param to_on: The column from the joining table.
@@ -40,18 +146,70 @@ class Join(Escape):
         :raises QueryBuilderException: If the table name is invalid.
         :return: self, for chaining purposes.
         """
+        self._add_join(join_type, table, alias)
+        return self.on(from_on, to_on, escape_on=escape_on)
+
+    def _add_join(self, join_type: str, table: str, alias: Optional[str] = None,
+                  using: Optional[List[str]] = None, escape_table: bool = True) -> Self:
+        """Add a join entry without conditions; ON conditions are appended to the last entry."""
         if not table.strip():
             raise QueryBuilderException("Table is required")
 
-        table = self._key_escape(table)
-        if escape_on:
-            from_on = self._key_escape(from_on)
-            to_on = self._key_escape(to_on)
+        key = alias if alias is not None else table.strip()
+        if escape_table:
+            table = self._key_escape(table)
+
+        # Joins are kept structured so index hints and extra ON conditions can be attached
+        self._joins.append({
+            'type': join_type,
+            'table': table,
+            'alias': alias,
+            'key': key,
+            'conditions': [],
+            'using': using,
+        })
+        return self
+
+    def _append_on(self, key, operator, value) -> Self:
+        """Append a condition to the ON clause of the last join."""
+        if len(self._joins) == 0:
+            raise QueryBuilderException("No join to add the condition to")
+
+        join = self._joins[-1]
+        if join['using']:
+            raise QueryBuilderException("Join with USING can't have ON conditions")
+
+        join['conditions'].append(f"{key} {operator} {value}")
+        return self
+
+    def _on_operator(self, operator: str) -> str:
+        if operator not in self._ON_OPERATORS:
+            raise QueryBuilderException("Join operator Not Valid")
 
-        # Construct the join clause string
-        join_clause = f"{join_type} JOIN {table} ON {from_on} = {to_on}"
-        if alias is not None:
-            join_clause = f"{join_type} JOIN {table} AS {alias} ON {from_on} = {to_on}"
+        return operator
+
+    @staticmethod
+    def _join_direction(join_type: Union[JoinDirection, str]) -> JoinDirection:
+        if isinstance(join_type, str):
+            try:
+                return JoinDirection(join_type.upper())
+            except ValueError:
+                raise QueryBuilderException("JoinDirection Not Valid")
+
+        return join_type
+
+    def _validate_joins(self) -> None:
+        """
+        Validate the joins against what MySQL supports.
+
+        :raises QueryBuilderException: On FULL JOIN, or an outer join without ON/USING.
+        """
+        for join in self._joins:
+            if join['type'] == JoinDirection.FULL.value:
+                raise QueryBuilderException(
+                    "FULL JOIN is not supported by MySQL, use a LEFT JOIN and a RIGHT JOIN with UNION"
+                )
 
-        self._joins.append(join_clause)
-        return self
\ No newline at end of file
+            if join['type'] in (JoinDirection.LEFT.value, JoinDirection.RIGHT.value) \
+                    and not join['conditions'] and not join['using']:
+                raise QueryBuilderException(f"{join['type']} JOIN requires ON or USING")
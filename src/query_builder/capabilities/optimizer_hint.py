@@ -0,0 +1,72 @@
+import re
+from typing import List, Optional, Self, Union
+
+from ..exceptions.query_builder_exception import QueryBuilderException
+from ..utils.escape import Escape
+
+
+class OptimizerHint(Escape):
+    """Class to manage optimizer hint comments (/*+ ... */) for SQL queries."""
+
+    _NAME_PATTERN = re.compile(r"^\w+$")
+
+    def __init__(self):
+        self._optimizer_hints: List[str] = []
+
+    def add_optimizer_hint(self, hint: str) -> Self:
+        """
+        Add a raw optimizer hint, e.g. ``BKA(t1)`` (non-escaped).
+
+        :param hint: The hint body without the comment markers.
+        :raises QueryBuilderException: If the hint is empty or contains a comment terminator.
+        :return: self, for chaining purposes.
+        """
+        if not hint.strip():
+            raise QueryBuilderException("Optimizer hint can't be empty")
+
+        if "*/" in hint:
+            raise QueryBuilderException("Optimizer hint can't contain '*/'")
+
+        self._optimizer_hints.append(hint.strip())
+        return self
+
+    def set_var(self, variable: str, value, escape_value: bool = True) -> Self:
+        """
+        Add a SET_VAR hint to set a session variable for this statement only.
+
+        :param variable: The system variable name, e.g. ``sort_buffer_size``.
+        :param value: The value; strings are quoted unless escape_value is False (e.g. ``16M``).
+        :param escape_value: Whether to escape the value.
+        :raises QueryBuilderException: If the variable name is invalid.
+        :return: self, for chaining purposes.
+        """
+        if not self._NAME_PATTERN.match(variable):
+            raise QueryBuilderException("SET_VAR variable name not valid")
+
+        if escape_value:
+            value = self._escape(value)
+
+        return self.add_optimizer_hint(f"SET_VAR({variable} = {value})")
+
+    def no_range_optimization(self, table: str, indexes: Optional[Union[str, List[str]]] = None,
+                              escape: bool = True) -> Self:
+        """
+        Add a NO_RANGE_OPTIMIZATION hint for a table and optionally specific indexes.
+
+        :param table: The table name or alias.
+        :param indexes: Optional index name or list of index names.
+        :param escape: Whether to escape the table and index names.
+        :return: self, for chaining purposes.
+        """
+        if not table.strip():
+            raise QueryBuilderException("Table is required")
+
+        if isinstance(indexes, str):
+            indexes = [indexes]
+
+        table = self._key_escape(table) if escape else table
+        body = table
+        if indexes:
+            body += " " + ", ".join(self._key_escape(index) if escape else index for index in indexes)
+
+        return self.add_optimizer_hint(f"NO_RANGE_OPTIMIZATION({body})")
@@ -0,0 +1,30 @@
+from typing import Any, Optional, Self
+
+from ..exceptions.query_builder_exception import QueryBuilderException
+
+
+class ShardKey:
+    """Class to route a query built from a ShardedFactory to the shard owning a key."""
+
+    def __init__(self):
+        self._shard_key: Optional[Any] = None
+
+    def shard_key(self, value: Any) -> Self:
+        """
+        Run the query on the shard owning this shard-key value, instead of on every shard.
+
+        :param value: The shard-key value, e.g. the tenant id the rows belong to.
+        :raises QueryBuilderException: If the shard key is already set, or the builder doesn't come from a
+                                       ShardedFactory.
+        :raises DBFactoryException: If no shard owns the value.
+        :return: self, for chaining purposes.
+        """
+        if self._shard_key is not None:
+            raise QueryBuilderException("Shard key already set")
+
+        if not hasattr(self._factory, 'get_shard'):
+            raise QueryBuilderException("A shard key requires a builder from a ShardedFactory")
+
+        self._factory = self._factory.get_shard(value)
+        self._shard_key = value
+        return self
@@ -0,0 +1,190 @@
+from typing import Any, Dict, List, Tuple, Union
+
+from ..capabilities.shard_key import ShardKey
+from ..capabilities.table import Table
+from ..capabilities.where import Where
+from ..core.builder import Builder
+from ..core.bulk_executor import BulkExecutor
+from ..core.bulk_result import BulkResult
+from ..core.e_query import EQuery
+from ..core.query import Query
+from ..enums.statement_kind import StatementKind
+from ..exceptions.query_builder_exception import QueryBuilderException
+
+
+class BulkUpdate(Table, Where, ShardKey):
+    """
+    Update many rows with different values in one statement per chunk:
+    UPDATE t SET col = CASE key WHEN k1 THEN v1 ... ELSE col END, ... WHERE key IN (k1, ...).
+    """
+
+    _MAX_CHUNK_BYTES = BulkExecutor.MAX_CHUNK_BYTES
+    _MAX_CHUNK_ROWS = BulkExecutor.MAX_CHUNK_ROWS
+
+    def __init__(self, factory=None):
+        Table.__init__(self)
+        Where.__init__(self)
+        ShardKey.__init__(self)
+
+        self._key: str = self._key_escape('id')
+        self._keys: List[str] = []  # Escaped key of each row, in insertion order
+        self._whens: List[Dict[str, str]] = []  # Per row: escaped column -> rendered "WHEN key THEN value"
+        self._row_sizes: List[int] = []
+        self._row_keys: set = set()
+
+        self._factory = factory
+
+    def set_key(self, column: str, escape: bool = True) -> 'BulkUpdate':
+        """
+        Set the column identifying the rows, usually the primary key (defaults to id).
+
+        :raises QueryBuilderException: If rows were already added.
+        """
+        if len(self._keys) != 0:
+            raise QueryBuilderException("Instance has some rows, so key can't change")
+
+        if not column.strip():
+            raise QueryBuilderException("Key is required")
+
+        self._key = self._key_escape(column) if escape else column
+        return self
+
+    def add_update(self, key, updates: Dict[str, Any], escape_value: bool = True) -> 'BulkUpdate':
+        """
+        Add the new values of one row.
+
+        :param key: The value of the key column identifying the row.
+        :param updates: Column -> new value; columns missing from a row keep their current value.
+        :param escape_value: Whether to escape the key and the values.
+        :raises QueryBuilderException: If the updates are empty or the key was already added.
+        :return: self, for chaining purposes.
+        """
+        if not isinstance(updates, dict) or len(updates) == 0:
+            raise QueryBuilderException("Update requires a key-value format")
+
+        if escape_value:
+            key = self._escape(key)
+
+        key = str(key)
+        if key in self._row_keys:
+            raise QueryBuilderException(f"Key {key} already added")
+
+        whens = {}
+        for column, value in updates.items():
+            if not isinstance(column, str):
+                raise QueryBuilderException("Update requires a key-value format")
+
+            if escape_value:
+                value = self._escape(value)
+
+            whens[self._key_escape(column)] = Builder.case_when(key, value)
+
+        self._row_keys.add(key)
+        self._keys.append(key)
+        self._whens.append(whens)
+        # Every WHEN is followed by a space and the key by the ", " separator of the IN list
+        self._row_sizes.append(
+            sum(len(when.encode()) + 1 for when in whens.values()) + len(key.encode()) + 2
+        )
+        return self
+
+    def add_updates(self, rows: Dict[Any, Dict[str, Any]], escape_value: bool = True) -> 'BulkUpdate':
+        """
+        Add the new values of many rows.
+
+        :param rows: Key value -> {column: new value}.
+        :param escape_value: Whether to escape the keys and the values.
+        :return: self, for chaining purposes.
+        """
+        for key, updates in rows.items():
+            self.add_update(key, updates, escape_value)
+
+        return self
+
+    def compile(self) -> Union[Query, EQuery]:
+        """Compile every row into a single statement."""
+        self._validate_compile()
+
+        return self._to_query(self._compile_rows(0, len(self._keys)))
+
+    def compile_chunks(self, max_rows: int = _MAX_CHUNK_ROWS,
+                       max_bytes: int = _MAX_CHUNK_BYTES) -> List[Union[Query, EQuery]]:
+        """
+        Compile the rows into several statements, each within the row count and byte size limits.
+
+        :param max_rows: Maximum number of rows per statement.
+        :param max_bytes: Maximum statement size in bytes, keep it below the server's max_allowed_packet.
+        :raises QueryBuilderException: If the statement can't be built or a single row exceeds max_bytes.
+        :return: A list of Query or EQuery objects, one per chunk.
+        """
+        return [self._to_query(query) for _, _, query in self._compile_chunks(max_rows, max_bytes)]
+
+    async def execute_chunked(self, max_rows: int = _MAX_CHUNK_ROWS, max_bytes: int = _MAX_CHUNK_BYTES,
+                              concurrency: int = 4, in_transaction: bool = False) -> BulkResult:
+        """
+        Execute the rows as several chunked statements on the write pool.
+
+        :param max_rows: Maximum number of rows per statement.
+        :param max_bytes: Maximum statement size in bytes, keep it below the server's max_allowed_packet.
+        :param concurrency: Maximum number of chunks executed at the same time.
+        :param in_transaction: Run the chunks sequentially inside one transaction instead.
+        :raises QueryBuilderException: If there is no factory or the statement can't be built.
+        :return: BulkResult with the aggregate affected rows and per-chunk failures.
+        """
+        if self._factory is None:
+            raise QueryBuilderException("Factory required to execute")
+
+        chunks = self._compile_chunks(max_rows, max_bytes)
+        return await BulkExecutor(self._factory).execute(chunks, concurrency, in_transaction)
+
+    def _compile_chunks(self, max_rows: int, max_bytes: int) -> List[Tuple[int, int, str]]:
+        if max_rows < 1:
+            raise QueryBuilderException("Chunk max rows must be positive")
+
+        self._validate_compile()
+
+        # A statement with every column and no row bounds the size that doesn't depend on the rows
+        columns = self._columns(0, len(self._keys))
+        overhead = len(self._render(columns, [[] for _ in columns], []).encode())
+        return [
+            (start, end, self._compile_rows(start, end))
+            for start, end in BulkExecutor.chunk_ranges(self._row_sizes, max_rows, max_bytes - overhead)
+        ]
+
+    def _compile_rows(self, start: int, end: int) -> str:
+        columns = self._columns(start, end)
+        whens = [
+            [row[column] for row in self._whens[start:end] if column in row]
+            for column in columns
+        ]
+        return self._render(columns, whens, self._keys[start:end])
+
+    def _render(self, columns: List[str], whens: List[List[str]], keys: List[str]) -> str:
+        base_query = Builder.set_update_table(self._update_table)
+        base_query += Builder.set_updates([
+            Builder.case_update(column, self._key, column_whens)
+            for column, column_whens in zip(columns, whens)
+        ])
+        base_query += Builder.bulk_update_where(self._key, keys, self._where_statements)
+        return base_query
+
+    def _columns(self, start: int, end: int) -> List[str]:
+        """Columns updated by the rows [start, end), in first-seen order."""
+        columns = {}
+        for row in self._whens[start:end]:
+            columns.update(dict.fromkeys(row))
+
+        return list(columns)
+
+    def _validate_compile(self) -> None:
+        if not getattr(self, '_update_table', None) or not self._update_table.strip():
+            raise QueryBuilderException("Table is required")
+
+        if len(self._keys) == 0:
+            raise QueryBuilderException("Updates required")
+
+    def _to_query(self, query: str) -> Union[Query, EQuery]:
+        if self._factory is None:
+            return Query(query)
+
+        return EQuery(query, self._factory, kind=StatementKind.WRITE)
@@ -1,20 +1,54 @@
+from typing import List, Union
+
+from ..capabilities.batch import Batch
 from ..capabilities.from_capability import From
+from ..capabilities.index_hint import IndexHint
+from ..capabilities.join import Join
 from ..capabilities.limit import Limit
+from ..capabilities.optimizer_hint import OptimizerHint
+from ..capabilities.order import Order
+from ..capabilities.shard_key import ShardKey
 from ..capabilities.where import Where
 from ..core.builder import Builder
 from ..core.e_query import EQuery
 from ..core.query import Query
+from ..enums.statement_kind import StatementKind
 from ..exceptions.query_builder_exception import QueryBuilderException
 
 
-class Delete(From, Where, Limit):
+class Delete(From, Where, Join, Limit, Order, IndexHint, OptimizerHint, Batch, ShardKey):
     def __init__(self, factory=None):
         From.__init__(self)
         Where.__init__(self)
+        Join.__init__(self)
         Limit.__init__(self)
+        Order.__init__(self)
+        IndexHint.__init__(self)
+        OptimizerHint.__init__(self)
+        ShardKey.__init__(self)
+
+        self._delete_targets: List[str] = []
 
         self._factory = factory
 
+    def delete_from(self, tables: Union[str, List[str]], escape: bool = True) -> 'Delete':
+        """
+        Choose the tables whose matching rows are deleted in a multi-table delete (defaults to the from table).
+
+        :param tables: A table name or alias, or a list of them, among the from table and the joined tables.
+        :param escape: Whether to escape the table names.
+        :raises QueryBuilderException: If no table is given.
+        :return: self, for chaining purposes.
+        """
+        if isinstance(tables, str):
+            tables = [tables]
+
+        if len(tables) == 0:
+            raise QueryBuilderException("Delete tables are required")
+
+        self._delete_targets = [self._key_escape(table) if escape else table for table in tables]
+        return self
+
     def compile(self):
         if not self.from_table or not self._from_table.strip():
             raise QueryBuilderException("From is required")
@@ -23,8 +57,18 @@ class Delete(From, Where, Limit):
         if not where.strip():
             raise QueryBuilderException("Where is required")
 
-        base_query = Builder.set_delete_table(self._from_table)
+        self._validate_joins()
+        self._validate_index_hints([join['key'] for join in self._joins])
+
+        index_hints = self._index_hints.get(None)
+        if (index_hints or self._joins or self._delete_targets) and (self._count is not None or self._order_by):
+            # Index hints and joins force the multi-table DELETE syntax, which doesn't allow ORDER BY or LIMIT
+            raise QueryBuilderException("Multi-table delete can't be combined with order or limit")
+
+        base_query = Builder.set_delete_table(self._from_table, self._optimizer_hints, index_hints,
+                                              self._delete_targets, Builder.joins(self._joins, self._index_hints))
         base_query += where
+        base_query += Builder.order_by(self._order_by)
 
         if self._count is not None:
             base_query += Builder.count(self._count)
@@ -35,4 +79,4 @@ class Delete(From, Where, Limit):
         if self._factory is None:
             return Query(base_query)
 
-        return EQuery(base_query, self._factory)
+        return EQuery(base_query, self._factory, kind=StatementKind.WRITE)
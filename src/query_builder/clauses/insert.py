@@ -1,17 +1,22 @@
-from typing import List, Union
+from typing import List, Optional, Union
 
 from ..capabilities.addRow import AddRow
+from ..capabilities.insert_modifier import InsertModifier
 from ..capabilities.into import Into
+from ..capabilities.shard_key import ShardKey
 from ..core.builder import Builder
 from ..core.e_query import EQuery
 from ..core.query import Query
 from ..exceptions.query_builder_exception import QueryBuilderException
 
 
-class Insert(Into, AddRow):
+class Insert(Into, AddRow, InsertModifier, ShardKey):
     def __init__(self, factory=None):
         Into.__init__(self)
         AddRow.__init__(self)
+        InsertModifier.__init__(self)
+        ShardKey.__init__(self)
+        self._select: Optional[str] = None
         self._factory = factory
 
     def set_columns(self, columns: List[str], escape_key=True) -> 'Insert':
@@ -25,22 +30,65 @@ class Insert(Into, AddRow):
         ]
         return self
 
+    def from_select(self, select) -> 'Insert':
+        """
+        Insert the rows returned by a select (INSERT INTO t (columns) SELECT ...), copied inside the server.
+
+        :param select: A Select builder, or a compiled Query/EQuery.
+        :raises QueryBuilderException: If rows or a select are already set.
+        :return: self, for chaining purposes.
+        """
+        if len(self._rows) != 0:
+            raise QueryBuilderException("Instance has some rows, so select can't be set")
+
+        if self._select is not None:
+            raise QueryBuilderException("Select already set")
+
+        self._select = Builder.sub_query(select)
+        return self
+
+    def return_insert_ids(self, enable: bool = True) -> 'Insert':
+        """
+        Return every generated id (DBResult.insert_ids), in row order, when the query is committed.
+
+        The ids are derived from the first id, so this is only safe for a plain INSERT ... VALUES that lets
+        the server generate the id of every row; the server side checks are described in DBWorker.query.
+        """
+        self._return_insert_ids = enable
+        return self
+
     def compile(self) -> Union[Query, EQuery]:
         """Compile the insert query."""
+        if self._select is not None:
+            self._validate_compile(rows_required=False)
+
+            if len(self._rows) != 0:
+                raise QueryBuilderException("Insert can't have both rows and select")
+
+            base_query = Builder.set_insert_table(self._into_table, self._insert_keyword)
+            base_query += Builder.set_insert_select(self._columns, self._select)
+            return self._to_query(base_query)
+
+        self._validate_compile()
+
+        return self._to_query(self._compile_rows(self._rows))
+
+    def _validate_compile(self, rows_required: bool = True) -> None:
         if not self._into_table or not self._into_table.strip():
             raise QueryBuilderException("Table Required")
 
         if len(self._columns) == 0:
             raise QueryBuilderException("Columns Required")
 
-        if len(self._rows) == 0:
+        if rows_required and len(self._rows) == 0:
             raise QueryBuilderException("Rows Required")
 
-        base_query = Builder.set_insert_table(self._into_table)
-        base_query += Builder.set_insert_columns(self._columns)
-        base_query += Builder.set_insert_rows(self._rows)
-
-        if self._factory is None:
-            return Query(base_query)
+        if self._return_insert_ids and (self._select is not None or self._insert_keyword != "INSERT"):
+            # Skipped or replaced rows break the mapping from the first id to every row
+            raise QueryBuilderException("Insert ids can only be returned for a plain insert of rows")
 
-        return EQuery(base_query, self._factory)
+    def _compile_rows(self, rows: list) -> str:
+        base_query = Builder.set_insert_table(self._into_table, self._insert_keyword)
+        base_query += Builder.set_insert_columns(self._columns)
+        base_query += Builder.set_insert_rows(rows)
+        return base_query
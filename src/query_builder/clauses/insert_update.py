@@ -1,15 +1,18 @@
 from typing import Dict, List, Any
 
 from ..capabilities.into import Into
+from ..capabilities.shard_key import ShardKey
 from ..core.builder import Builder
 from ..core.e_query import EQuery
 from ..core.query import Query
+from ..enums.statement_kind import StatementKind
 from ..exceptions.query_builder_exception import QueryBuilderException
 
 
-class InsertUpdate(Into):
+class InsertUpdate(Into, ShardKey):
     def __init__(self, factory=None):
         Into.__init__(self)
+        ShardKey.__init__(self)
 
         self._columns: List[str] = []
         self._row: List[Any] = []
@@ -86,10 +89,10 @@ class InsertUpdate(Into):
 
         base_query = Builder.set_insert_table(self._into_table)
         base_query += Builder.set_insert_columns(self._columns)
-        base_query += Builder.set_insert_rows([self._row])
+        base_query += Builder.set_insert_rows([Builder.insert_row(self._row)])
         base_query += Builder.set_on_duplicate_key_update(self._updates)
 
         if self._factory is None:
             return Query(base_query)
 
-        return EQuery(base_query, self._factory)
+        return EQuery(base_query, self._factory, kind=StatementKind.WRITE)
@@ -0,0 +1,122 @@
+import csv
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, List, Optional, Self, Union
+
+from ..capabilities.into import Into
+from ..capabilities.shard_key import ShardKey
+from ..core.builder import Builder
+from ..core.db_result import DBResult
+from ..core.local_infile import LocalInfile
+from ..enums.statement_kind import StatementKind
+from ..exceptions.query_builder_exception import QueryBuilderException
+
+
+class LoadData(Into, ShardKey):
+    """
+    Bulk loader using LOAD DATA LOCAL INFILE, fed from in-memory rows.
+
+    Rows are encoded lazily into a bounded buffer and streamed to the server, so the source is never
+    fully materialized. Requires ``local_infile`` on both the factory and the server. Like any LOAD DATA
+    outside a transaction, rows sent before a failing row stay loaded.
+    """
+
+    _CHUNK_BYTES = 1024 * 1024
+
+    def __init__(self, factory=None):
+        Into.__init__(self)
+        ShardKey.__init__(self)
+
+        self._columns: List[str] = []
+        self._source: Optional[Union[Iterable, AsyncIterable]] = None
+        self._factory = factory
+
+    def set_columns(self, columns: List[str], escape_key=True) -> Self:
+        """Set the columns the loaded fields are assigned to, in order."""
+        if len(columns) == 0:
+            raise QueryBuilderException("Columns Required")
+
+        self._columns = [
+            self._key_escape(column_value) if escape_key else column_value
+            for column_value in columns
+        ]
+        return self
+
+    def set_rows(self, rows: Union[Iterable[List[Any]], AsyncIterable[List[Any]]]) -> Self:
+        """Set an iterable or async iterable of rows (each row is a list of values) as the source."""
+        if self._source is not None:
+            raise QueryBuilderException("Source already set")
+
+        self._source = rows
+        return self
+
+    def set_csv(self, file: Iterable[str], skip_header: bool = False, **fmtparams) -> Self:
+        """
+        Set a CSV-like source, e.g. an open text file or any iterable of lines.
+
+        :param file: The CSV lines.
+        :param skip_header: Whether to skip the first record.
+        :param fmtparams: Formatting parameters passed to csv.reader.
+        :return: self, for chaining purposes.
+        """
+        reader = csv.reader(file, **fmtparams)
+        if skip_header:
+            next(reader, None)
+
+        return self.set_rows(reader)
+
+    def compile(self, file_name: str) -> str:
+        """Compile the LOAD DATA statement for the given (registered) file name."""
+        if not self._into_table or not self._into_table.strip():
+            raise QueryBuilderException("Table Required")
+
+        if len(self._columns) == 0:
+            raise QueryBuilderException("Columns Required")
+
+        return Builder.load_data(self._escape(file_name), self._into_table, self._columns)
+
+    async def execute(self, chunk_bytes: int = _CHUNK_BYTES) -> DBResult:
+        """
+        Stream the source to the server.
+
+        :param chunk_bytes: Size of the encoding buffer flushed to the connection at a time.
+        :raises QueryBuilderException: If there is no factory, source, table or columns.
+        :return: DBResult whose affected_rows is the loaded row count, with the server's warning_count.
+        """
+        if self._factory is None:
+            raise QueryBuilderException("Factory required to execute")
+
+        if self._source is None:
+            raise QueryBuilderException("Rows Required")
+
+        file_name = LocalInfile.register(self._encode(chunk_bytes))
+        try:
+            return await self._factory.query(self.compile(file_name), route=StatementKind.WRITE)
+        finally:
+            LocalInfile.unregister(file_name)
+
+    async def _encode(self, chunk_bytes: int) -> AsyncIterator[bytes]:
+        """Encode rows into the LOAD DATA format, yielding chunks of about chunk_bytes."""
+        buffer = []
+        size = 0
+        async for row in self._iterate():
+            if len(row) != len(self._columns):
+                raise QueryBuilderException("Columns and Rows Must Have same counts")
+
+            line = ("\t".join(self._infile_escape(value) for value in row) + "\n").encode()
+            buffer.append(line)
+            size += len(line)
+
+            if size >= chunk_bytes:
+                yield b"".join(buffer)
+                buffer = []
+                size = 0
+
+        if buffer:
+            yield b"".join(buffer)
+
+    async def _iterate(self) -> AsyncIterator[List[Any]]:
+        if hasattr(self._source, '__aiter__'):
+            async for row in self._source:
+                yield row
+        else:
+            for row in self._source:
+                yield row
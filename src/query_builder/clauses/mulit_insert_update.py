@@ -1,20 +1,23 @@
-from typing import List, Any, Dict, Self, Union
+from typing import Any, Dict, Optional, Self, Union
 
 from ..capabilities.addRow import AddRow
+from ..capabilities.insert_modifier import InsertModifier
 from ..capabilities.into import Into
+from ..capabilities.shard_key import ShardKey
 from ..core.builder import Builder
 from ..core.e_query import EQuery
 from ..core.query import Query
 from ..exceptions.query_builder_exception import QueryBuilderException
 
 
-class MultiInsertUpdate(Into, AddRow):
+class MultiInsertUpdate(Into, AddRow, InsertModifier, ShardKey):
     def __init__(self, factory=None):
         Into.__init__(self)
         AddRow.__init__(self)
+        InsertModifier.__init__(self)
+        ShardKey.__init__(self)
 
-        self._alias: str
-        self._rows: List[Any] = []  # TODO: maybe the type of the list must be str
+        self._alias: Optional[str] = None
         self._updates: Dict[str, Any] = {}
 
         self._factory = factory
@@ -40,9 +43,6 @@ class MultiInsertUpdate(Into, AddRow):
         if len(self._columns) == 0:
             raise QueryBuilderException("Columns not set")
 
-        if len(self._rows) == 0:
-            raise QueryBuilderException("Rows not set")
-
         key = self._key_escape(key) if escape_key else key
         value = self._escape(value) if escape_value or isinstance(value, (bool, type(None))) else value
 
@@ -55,25 +55,39 @@ class MultiInsertUpdate(Into, AddRow):
         return self
 
     def compile(self) -> Union[Query, EQuery]:
+        self._validate_compile()
+
+        return self._to_query(self._compile_rows(self._rows))
+
+    def _validate_compile(self, rows_required: bool = True) -> None:
         if not self._into_table or not self._into_table.strip():
             raise QueryBuilderException("Table required")
 
-        if not self._alias or not self._alias.strip():
-            raise QueryBuilderException("Alias required")
-
         if len(self._columns) == 0:
             raise QueryBuilderException("Columns required")
 
-        if len(self._rows) == 0:
+        if rows_required and len(self._rows) == 0:
             raise QueryBuilderException("Rows required")
 
+        if self._insert_keyword == "REPLACE":
+            # REPLACE deletes the duplicate rows itself, it has no ON DUPLICATE KEY UPDATE part
+            if len(self._updates) != 0:
+                raise QueryBuilderException("Replace can't have updates")
+            return
+
+        if not self._alias or not self._alias.strip():
+            raise QueryBuilderException("Alias required")
+
         if len(self._updates) == 0:
             raise QueryBuilderException("Updates required")
 
-        base_query = Builder.set_insert_table(self._into_table)
+    def _compile_rows(self, rows: list) -> str:
+        base_query = Builder.set_insert_table(self._into_table, self._insert_keyword)
         base_query += Builder.set_insert_columns(self._columns)
-        base_query += Builder.set_insert_rows(self._rows)
+        base_query += Builder.set_insert_rows(rows)
+        if self._insert_keyword == "REPLACE":
+            return base_query
+
         base_query += Builder.as_alias(self._alias)
         base_query += Builder.set_on_duplicate_key_update(self._updates)
-
-        return Query(base_query) if self._factory is None else EQuery(base_query, self._factory)
+        return base_query
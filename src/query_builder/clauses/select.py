@@ -2,27 +2,43 @@ from typing import List, Optional, Union, Self
 
 from ..capabilities.from_capability import From
 from ..capabilities.group import Group
+from ..capabilities.having import Having
+from ..capabilities.index_hint import IndexHint
 from ..capabilities.join import Join
 from ..capabilities.limit import Limit
+from ..capabilities.optimizer_hint import OptimizerHint
 from ..capabilities.order import Order
+from ..capabilities.shard_key import ShardKey
 from ..capabilities.where import Where
 from ..core.builder import Builder
 from ..core.e_query import EQuery
 from ..core.query import Query
+from ..core.transaction import Transaction
+from ..enums.lock_mode import LockMode
+from ..enums.statement_kind import StatementKind
 from ..exceptions.query_builder_exception import QueryBuilderException
 
 
-class Select(Where, From, Limit, Join, Group, Order):
+class Select(Where, From, Limit, Join, Group, Having, Order, IndexHint, OptimizerHint, ShardKey):
     def __init__(self, factory=None):
         Where.__init__(self)
         From.__init__(self)
         Limit.__init__(self)
         Join.__init__(self)
         Group.__init__(self)
+        Having.__init__(self)
         Order.__init__(self)
+        IndexHint.__init__(self)
+        OptimizerHint.__init__(self)
+        ShardKey.__init__(self)
 
         self._statements: List = []
         self._is_distinct: bool = False
+        self._is_straight_join: bool = False
+        self._lock_mode: Optional[LockMode] = None
+        self._lock_of: List[str] = []
+        self._lock_skip_locked: bool = False
+        self._lock_nowait: bool = False
         self._factory = factory
 
     def add_column(self, column: str, escape: bool = True) -> Self:
@@ -72,6 +88,21 @@ class Select(Where, From, Limit, Join, Group, Order):
         else:
             return self.add_column_as_alias(f"COUNT({column})", alias, False, escape_alias)
 
+    def add_column_count_distinct(self, columns: Union[str, List[str]], alias: Optional[str] = None,
+                                  escape_key: bool = True, escape_alias: bool = True) -> Self:
+        """Add a COUNT(DISTINCT ...) aggregate function over one or more columns."""
+        if isinstance(columns, str):
+            columns = [columns]
+
+        if not columns or not all(column.strip() for column in columns):
+            raise QueryBuilderException("Column cannot be empty")
+
+        column = ", ".join(self._key_escape(column) if escape_key else column for column in columns)
+        if alias is None:
+            return self.add_column(f"COUNT(DISTINCT {column})", False)
+        else:
+            return self.add_column_as_alias(f"COUNT(DISTINCT {column})", alias, False, escape_alias)
+
     def add_column_average(self, column: str, alias: Optional[str] = None,
                          escape_key: bool = True, escape_alias: bool = True) -> Self:
         """Add an AVG aggregate function."""
@@ -124,19 +155,75 @@ class Select(Where, From, Limit, Join, Group, Order):
         self._is_distinct = enable
         return self
 
+    def set_straight_join(self, enable: bool = True) -> Self:
+        """Set whether to join tables in the order they are listed (SELECT STRAIGHT_JOIN)."""
+        self._is_straight_join = enable
+        return self
+
+    def max_execution_time(self, milliseconds: int) -> Self:
+        """Add a MAX_EXECUTION_TIME optimizer hint so the server aborts the select after the given time."""
+        if not isinstance(milliseconds, int) or isinstance(milliseconds, bool) or milliseconds <= 0:
+            raise QueryBuilderException("Max execution time must be a positive integer")
+
+        return self.add_optimizer_hint(f"MAX_EXECUTION_TIME({milliseconds})")
+
+    def lock_for_update(self, skip_locked: bool = False, nowait: bool = False,
+                        of: Optional[List[str]] = None, escape: bool = True) -> Self:
+        """Lock the selected rows for update (SELECT ... FOR UPDATE). Requires an active transaction."""
+        return self._lock(LockMode.UPDATE, skip_locked, nowait, of, escape)
+
+    def lock_for_share(self, skip_locked: bool = False, nowait: bool = False,
+                       of: Optional[List[str]] = None, escape: bool = True) -> Self:
+        """Lock the selected rows in share mode (SELECT ... FOR SHARE). Requires an active transaction."""
+        return self._lock(LockMode.SHARE, skip_locked, nowait, of, escape)
+
+    def _lock(self, mode: LockMode, skip_locked: bool, nowait: bool,
+              of: Optional[List[str]], escape: bool) -> Self:
+        """
+        Set the locking read mode of the select.
+
+        :param mode: The lock mode (UPDATE, SHARE).
+        :param skip_locked: Skip rows locked by other transactions instead of waiting.
+        :param nowait: Fail immediately instead of waiting when a row is locked.
+        :param of: Optional tables (or aliases) the lock is limited to.
+        :param escape: Whether to escape the table names in `of`.
+        :raises QueryBuilderException: If the lock is already set or the options conflict.
+        :return: self, for chaining purposes.
+        """
+        if self._lock_mode is not None:
+            raise QueryBuilderException("Lock already set")
+
+        if skip_locked and nowait:
+            raise QueryBuilderException("SKIP LOCKED and NOWAIT can't be used together")
+
+        self._lock_mode = mode
+        self._lock_of = [self._key_escape(table) if escape else table for table in of or []]
+        self._lock_skip_locked = skip_locked
+        self._lock_nowait = nowait
+        return self
+
     def compile(self) -> Union[Query, EQuery]:
         """Compile the select query."""
         if not self._from_table or not self._from_table.strip():
             raise QueryBuilderException("From is Required")
 
+        self._validate_joins()
+        self._validate_index_hints([join['key'] for join in self._joins])
+
+        if self._lock_mode is not None and not (
+                isinstance(self._factory, Transaction) and self._factory.is_active):
+            raise QueryBuilderException("Locking reads are only allowed inside an active transaction")
+
         if not self._statements:
             self.add_all_columns()
 
-        base_query = Builder.select(self._statements, self._is_distinct)
-        base_query += Builder.from_clause(self._from_table)
-        base_query += Builder.joins(self._joins)
+        base_query = Builder.select(self._statements, self._is_distinct, self._optimizer_hints,
+                                    self._is_straight_join)
+        base_query += Builder.from_clause(self._from_table, self._index_hints.get(None))
+        base_query += Builder.joins(self._joins, self._index_hints)
         base_query += Builder.where(self._where_statements)
-        base_query += Builder.group_by(self._group_by)
+        base_query += Builder.group_by(self._group_by, self._with_rollup)
+        base_query += Builder.having(self._having_statements)
         base_query += Builder.order_by(self._order_by)
 
         if self._count is not None:
@@ -144,4 +231,13 @@ class Select(Where, From, Limit, Join, Group, Order):
             if self._offset is not None:
                 base_query += Builder.offset(self._offset)
 
-        return EQuery(base_query, self._factory) if self._factory else Query(base_query)
\ No newline at end of file
+        if self._lock_mode is not None:
+            base_query += Builder.lock(self._lock_mode.value, self._lock_of, self._lock_skip_locked,
+                                       self._lock_nowait)
+
+        if not self._factory:
+            return Query(base_query)
+
+        # Locking reads must run on the primary
+        kind = StatementKind.READ if self._lock_mode is None else StatementKind.WRITE
+        return EQuery(base_query, self._factory, kind=kind)
\ No newline at end of file
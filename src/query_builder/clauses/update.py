@@ -1,17 +1,31 @@
 from typing import List, Any
 
+from ..capabilities.batch import Batch
+from ..capabilities.index_hint import IndexHint
+from ..capabilities.join import Join
+from ..capabilities.limit import Limit
+from ..capabilities.optimizer_hint import OptimizerHint
+from ..capabilities.order import Order
+from ..capabilities.shard_key import ShardKey
 from ..capabilities.table import Table
 from ..capabilities.where import Where
 from ..core.builder import Builder
 from ..core.e_query import EQuery
 from ..core.query import Query
+from ..enums.statement_kind import StatementKind
 from ..exceptions.query_builder_exception import QueryBuilderException
 
 
-class Update(Table, Where):
+class Update(Table, Where, Join, Order, Limit, IndexHint, OptimizerHint, Batch, ShardKey):
     def __init__(self, factory=None):
         Table.__init__(self)
         Where.__init__(self)
+        Join.__init__(self)
+        Order.__init__(self)
+        Limit.__init__(self)
+        IndexHint.__init__(self)
+        OptimizerHint.__init__(self)
+        ShardKey.__init__(self)
 
         self._updates: List[Any] = []  # TODO: maybe the list may be of type str
 
@@ -45,11 +59,24 @@ class Update(Table, Where):
         if len(where) == 0:
             raise QueryBuilderException("Where clause required")
 
-        base_query = Builder.set_update_table(self._update_table)
+        if self._offset is not None:
+            raise QueryBuilderException("Update doesn't support offset")
+
+        self._validate_joins()
+        self._validate_index_hints([join['key'] for join in self._joins])
+
+        if self._joins and (self._count is not None or self._order_by):
+            raise QueryBuilderException("Multi-table update can't be combined with order or limit")
+
+        base_query = Builder.set_update_table(self._update_table, self._optimizer_hints,
+                                              self._index_hints.get(None), Builder.joins(self._joins, self._index_hints))
         base_query += Builder.set_updates(self._updates)
         base_query += where
+        base_query += Builder.order_by(self._order_by)
+        if self._count is not None:
+            base_query += Builder.count(self._count)
 
         if self._factory is None:
             return Query(base_query)
 
-        return EQuery(base_query, self._factory)
+        return EQuery(base_query, self._factory, kind=StatementKind.WRITE)
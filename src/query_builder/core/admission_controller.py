@@ -0,0 +1,123 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from ..enums.priority import Priority
+from ..exceptions.db_factory_exception import DBFactoryException
+
+
+class AdmissionController:
+    """
+    Priority-aware gate in front of a pool: a slot is granted per connection, higher priorities first, FIFO within
+    a priority, with optional per-priority limits on the slots held at the same time.
+    """
+
+    def __init__(self, capacity: Callable[[], int], quotas: Optional[Dict[Priority, int]] = None,
+                 acquire_timeout: Optional[float] = None):
+        """
+        :param capacity: Returns the current number of slots, usually the pool's maxsize.
+        :param quotas: Maximum slots each priority may hold at the same time.
+        :param acquire_timeout: Default seconds to wait for a slot before rejecting, None waits forever.
+        """
+        self._capacity = capacity
+        self._quotas = quotas or {}
+        self._acquire_timeout = acquire_timeout
+
+        self.in_use = 0
+        self.in_use_by_priority: Dict[Priority, int] = {priority: 0 for priority in Priority}
+        self.rejected = 0
+        # Slots granted and the time spent waiting for them, cumulative so several readers can take deltas
+        self.admitted = 0
+        self.total_wait = 0.0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []  # (priority, sequence, future) heap
+        self._sequence = itertools.count()
+
+    @staticmethod
+    def priority(priority: Union[Priority, str, int, None]) -> Priority:
+        """Normalize a priority given as Priority, name ('interactive', 'normal', 'batch') or value."""
+        if priority is None:
+            return Priority.NORMAL
+
+        try:
+            if isinstance(priority, str):
+                return Priority[priority.upper()]
+            return Priority(priority)
+        except (KeyError, ValueError):
+            raise DBFactoryException(f"Unknown priority: {priority!r}")
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: Priority, timeout: Optional[float] = None) -> None:
+        """
+        Wait for a slot.
+
+        :raises DBFactoryException: If no slot was granted within the timeout.
+        """
+        if not self._waiters and self._can_admit(priority):
+            self._admit(priority)
+            return
+
+        started_at = time.monotonic()
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._wake()
+
+        timeout = timeout if timeout is not None else self._acquire_timeout
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # The slot was granted while timing out, give it back
+                self.release(priority)
+            else:
+                future.cancel()
+                self._wake()
+
+            if isinstance(e, asyncio.CancelledError):
+                raise
+
+            self.rejected += 1
+            raise DBFactoryException(f"Timed out after {timeout}s waiting for a connection ({priority.name})")
+
+        self.total_wait += time.monotonic() - started_at
+
+    def release(self, priority: Priority) -> None:
+        self.in_use -= 1
+        self.in_use_by_priority[priority] -= 1
+        self._wake()
+
+    def capacity_changed(self) -> None:
+        """Grant the slots added by a larger capacity, e.g. after a pool grew."""
+        self._wake()
+
+    def _can_admit(self, priority: Priority) -> bool:
+        quota = self._quotas.get(priority)
+        return self.in_use < self._capacity() and (quota is None or self.in_use_by_priority[priority] < quota)
+
+    def _admit(self, priority: Priority) -> None:
+        self.admitted += 1
+        self.in_use += 1
+        self.in_use_by_priority[priority] += 1
+
+    def _wake(self) -> None:
+        """Grant free slots to waiters in priority order, skipping the ones held back by their quota."""
+        blocked = []
+        while self._waiters and self.in_use < self._capacity():
+            entry = heapq.heappop(self._waiters)
+            priority, _, future = entry
+            if future.done():
+                continue
+
+            if not self._can_admit(priority):
+                blocked.append(entry)
+                continue
+
+            self._admit(priority)
+            future.set_result(None)
+
+        for entry in blocked:
+            heapq.heappush(self._waiters, entry)
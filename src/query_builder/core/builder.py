@@ -10,57 +10,137 @@ class Builder:
         return base_query
 
     @staticmethod
-    def set_delete_table(from_table: str) -> str:
-        return f"DELETE FROM {from_table}"
+    def optimizer_hints(hints: list) -> str:
+        return f"/*+ {' '.join(hints)} */ " if hints else ""
 
     @staticmethod
-    def set_insert_rows(rows: list) -> str:
-        return ", ".join(f"({', '.join(map(str, row))})" for row in rows)
+    def index_hints(hints: list) -> str:
+        return f" {' '.join(hints)}" if hints else ""
+
+    @staticmethod
+    def set_delete_table(from_table: str, optimizer_hints: list = None, index_hints: list = None,
+                         targets: list = None, joins: str = "") -> str:
+        if index_hints or joins or targets:
+            # Single-table DELETE does not accept index hints or joins, the multi-table form does
+            return f"DELETE {Builder.optimizer_hints(optimizer_hints)}{', '.join(targets or [from_table])} " \
+                   f"FROM {from_table}{Builder.index_hints(index_hints)}{f' {joins}' if joins else ''}"
+        return f"DELETE {Builder.optimizer_hints(optimizer_hints)}FROM {from_table}"
+
+    @staticmethod
+    def insert_row(row: list) -> str:
+        return f"({', '.join(map(str, row))})"
+
+    @staticmethod
+    def set_insert_rows(rendered_rows: list) -> str:
+        return ", ".join(rendered_rows)
 
     @staticmethod
     def set_insert_columns(columns: list) -> str:
         return f"({', '.join(columns)}) VALUES "
 
     @staticmethod
-    def set_insert_table(into_table: str) -> str:
-        return f"INSERT INTO {into_table} "
+    def set_insert_table(into_table: str, keyword: str = "INSERT") -> str:
+        return f"{keyword} INTO {into_table} "
+
+    @staticmethod
+    def set_insert_select(columns: list, select: str) -> str:
+        return f"({', '.join(columns)}) {select}"
+
+    @staticmethod
+    def sub_query(query) -> str:
+        """Render a builder (compiled on the fly) or a compiled Query/EQuery as SQL."""
+        if hasattr(query, 'compile'):
+            query = query.compile()
+        return query.get_query_as_string()
+
+    @staticmethod
+    def load_data(file_name: str, into_table: str, columns: list) -> str:
+        return f"LOAD DATA LOCAL INFILE {file_name} INTO TABLE {into_table} CHARACTER SET utf8mb4 " \
+               f"({', '.join(columns)})"
 
     @staticmethod
     def set_updates(updates: list) -> str:
         return ", ".join(updates) if updates else ""
 
     @staticmethod
-    def set_update_table(table: str) -> str:
-        return f"UPDATE {table} SET "
+    def set_update_table(table: str, optimizer_hints: list = None, index_hints: list = None, joins: str = "") -> str:
+        return f"UPDATE {Builder.optimizer_hints(optimizer_hints)}{table}{Builder.index_hints(index_hints)}" \
+               f"{f' {joins}' if joins else ''} SET "
+
+    @staticmethod
+    def case_when(key: str, value) -> str:
+        return f"WHEN {key} THEN {value}"
+
+    @staticmethod
+    def case_update(column: str, key_column: str, whens: list) -> str:
+        # ELSE keeps the current value of rows that don't set this column
+        return f"{column} = CASE {key_column} {' '.join(whens)} ELSE {column} END"
 
     @staticmethod
-    def select(statements: list, is_distinct: bool) -> str:
+    def bulk_update_where(key_column: str, keys: list, where_statements: list) -> str:
+        base_query = f" WHERE {key_column} IN ({', '.join(keys)})"
+        if where_statements:
+            base_query += f" AND ({Builder.conditions(where_statements)})"
+        return base_query
+
+    @staticmethod
+    def select(statements: list, is_distinct: bool, optimizer_hints: list = None,
+               straight_join: bool = False) -> str:
         base_query = "SELECT "
+        base_query += Builder.optimizer_hints(optimizer_hints)
         if is_distinct:
             base_query += "DISTINCT "
+        if straight_join:
+            base_query += "STRAIGHT_JOIN "
         base_query += ", ".join(statements)
         return base_query
 
     @staticmethod
-    def from_clause(from_table: str) -> str:
-        return f" FROM {from_table} "
+    def from_clause(from_table: str, index_hints: list = None) -> str:
+        return f" FROM {from_table}{Builder.index_hints(index_hints)} "
+
+    @staticmethod
+    def joins(joins: list, index_hints: dict = None) -> str:
+        if not joins:
+            return ""
+        index_hints = index_hints or {}
+        return " ".join(Builder.join(join, index_hints.get(join['key'])) for join in joins)
+
+    @staticmethod
+    def join(join: dict, index_hints: list = None) -> str:
+        keyword = "STRAIGHT_JOIN" if join['type'] == "STRAIGHT" else f"{join['type']} JOIN"
+        clause = f"{keyword} {join['table']}"
+        if join['alias'] is not None:
+            clause += f" AS {join['alias']}"
+        clause += Builder.index_hints(index_hints)
+        if join['using']:
+            clause += f" USING ({', '.join(join['using'])})"
+        elif join['conditions']:
+            clause += f" ON {' AND '.join(join['conditions'])}"
+        return clause
 
     @staticmethod
-    def joins(joins: list) -> str:
-        return " ".join(joins) if joins else ""
+    def conditions(statements: list) -> str:
+        return " OR ".join(
+            f"({' AND '.join(statement)})" for statement in statements if statement
+        )
 
     @staticmethod
     def where(where_statements: list) -> str:
         if where_statements:
-            conditions = " OR ".join(
-                f"({' AND '.join(statement)})" for statement in where_statements if statement
-            )
-            return f" WHERE {conditions}"
+            return f" WHERE {Builder.conditions(where_statements)}"
         return ""
 
     @staticmethod
-    def group_by(group_by: list) -> str:
-        return f" GROUP BY {', '.join(group_by)}" if group_by else ""
+    def group_by(group_by: list, with_rollup: bool = False) -> str:
+        if not group_by:
+            return ""
+        return f" GROUP BY {', '.join(group_by)}" + (" WITH ROLLUP" if with_rollup else "")
+
+    @staticmethod
+    def having(having_statements: list) -> str:
+        conditions = Builder.conditions(having_statements)
+        return f" HAVING {conditions}" if conditions else ""
 
     @staticmethod
     def order_by(order_by: dict) -> str:
@@ -72,6 +152,17 @@ class Builder:
         )
         return f"{base_query} {ordered}"
 
+    @staticmethod
+    def lock(mode: str, of: list = None, skip_locked: bool = False, nowait: bool = False) -> str:
+        base_query = f" FOR {mode}"
+        if of:
+            base_query += f" OF {', '.join(of)}"
+        if skip_locked:
+            base_query += " SKIP LOCKED"
+        elif nowait:
+            base_query += " NOWAIT"
+        return base_query
+
     @staticmethod
     def offset(offset: int) -> str:
         return f" OFFSET {offset}" if offset else ""
@@ -0,0 +1,157 @@
+import asyncio
+from typing import Iterator, List, Tuple
+
+from .bulk_result import BulkResult
+from .db_result import DBResult
+from ..enums.statement_kind import StatementKind
+from ..exceptions.query_builder_exception import QueryBuilderException
+
+
+class BulkExecutor:
+    """Execute a list of chunked statements on the write pool and aggregate their results."""
+
+    # Default chunk limits of the bulk builders; 4 MiB is the smallest max_allowed_packet default among
+    # supported MySQL versions
+    MAX_CHUNK_BYTES = 4 * 1024 * 1024
+    MAX_CHUNK_ROWS = 1000
+
+    def __init__(self, factory, return_insert_ids: bool = False):
+        """
+        :param factory: The factory (or transaction) running the chunks.
+        :param return_insert_ids: Collect every generated id of the chunks in BulkResult.row_insert_ids.
+        """
+        self._factory = factory
+        self._return_insert_ids = return_insert_ids
+
+    async def execute(self, chunks: List[Tuple[int, int, str]], concurrency: int = 4,
+                      in_transaction: bool = False) -> BulkResult:
+        """
+        Execute the chunks and aggregate affected rows and insert ids.
+
+        :param chunks: (start, end, query) tuples, where [start, end) is the row range of the chunk.
+        :param concurrency: Maximum number of chunks in flight; ignored inside a transaction.
+        :param in_transaction: Run the chunks sequentially inside one transaction (all or nothing).
+        :return: BulkResult with per-chunk failures.
+        """
+        if in_transaction:
+            return await self._execute_in_transaction(chunks)
+
+        return await self._execute_concurrently(chunks, concurrency)
+
+    async def _execute_concurrently(self, chunks: List[Tuple[int, int, str]], concurrency: int) -> BulkResult:
+        if concurrency < 1:
+            concurrency = 1
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(query: str) -> DBResult:
+            async with semaphore:
+                return await self.execute_chunk(query)
+
+        results = await asyncio.gather(*(run(query) for _, _, query in chunks))
+        return self._aggregate(chunks, results)
+
+    async def execute_chunk(self, query: str) -> DBResult:
+        """Execute a single chunk on the factory, turning exceptions into a failed DBResult."""
+        try:
+            if self._return_insert_ids:
+                return await self._factory.query(query, return_insert_ids=True, route=StatementKind.WRITE)
+            return await self._factory.query(query, route=StatementKind.WRITE)
+        except Exception as e:
+            return DBResult(is_success=False, message=str(e))
+
+    async def _execute_in_transaction(self, chunks: List[Tuple[int, int, str]]) -> BulkResult:
+        transaction = None
+        try:
+            transaction = await self._factory.begin_transaction()
+
+            results = []
+            for index, (start, end, query) in enumerate(chunks):
+                result = await transaction.query(query, self._return_insert_ids)
+                if not result.is_success:
+                    await transaction.rollback()
+                    return BulkResult(
+                        is_success=False,
+                        chunk_count=len(chunks),
+                        failed_chunks=[self._failure(index, start, end, result.message)],
+                        message=f"Transaction failed: {result.message}"
+                    )
+                results.append(result)
+
+            result = await transaction.commit()
+            if not result.is_success:
+                return BulkResult(
+                    is_success=False,
+                    chunk_count=len(chunks),
+                    message=f"Transaction failed: {result.message}"
+                )
+
+            return self._aggregate(chunks, results)
+        except Exception as e:
+            if transaction and transaction.is_active:
+                await transaction.rollback()
+            return BulkResult(
+                is_success=False,
+                chunk_count=len(chunks),
+                message=f"Transaction failed: {str(e)}"
+            )
+        finally:
+            if transaction:
+                self._factory.release_transaction(transaction)
+
+    @staticmethod
+    def chunk_ranges(row_sizes: List[int], max_rows: int, max_bytes: int) -> Iterator[Tuple[int, int]]:
+        """
+        Split rows into consecutive [start, end) ranges within the row count and byte size limits.
+
+        :param row_sizes: Rendered size of each row in bytes, including its separator.
+        :param max_rows: Maximum number of rows per range.
+        :param max_bytes: Maximum summed row size per range.
+        :raises QueryBuilderException: If a single row exceeds max_bytes.
+        """
+        start = 0
+        size = 0
+        for index, row_size in enumerate(row_sizes):
+            if row_size > max_bytes:
+                raise QueryBuilderException(f"Row {index} exceeds the chunk size limit")
+
+            if index > start and (index - start >= max_rows or size + row_size > max_bytes):
+                yield start, index
+                start = index
+                size = 0
+
+            size += row_size
+
+        if start < len(row_sizes):
+            yield start, len(row_sizes)
+
+    def _aggregate(self, chunks: List[Tuple[int, int, str]], results: List[DBResult]) -> BulkResult:
+        bulk_result = BulkResult(is_success=True)
+        for (start, end, _), result in zip(chunks, results):
+            self.add_result(bulk_result, start, end, result)
+
+        return bulk_result
+
+    def add_result(self, bulk_result: BulkResult, start: int, end: int, result: DBResult) -> None:
+        """Add the result of the next chunk, covering rows [start, end), to the aggregate."""
+        index = bulk_result.chunk_count
+        bulk_result.chunk_count += 1
+        if self._return_insert_ids and bulk_result.row_insert_ids is None:
+            bulk_result.row_insert_ids = []
+
+        if not result.is_success:
+            bulk_result.is_success = False
+            bulk_result.failed_chunks.append(self._failure(index, start, end, result.message))
+            bulk_result.insert_ids.append(None)
+            if self._return_insert_ids:
+                bulk_result.row_insert_ids.extend([None] * (end - start))
+            return
+
+        bulk_result.affected_rows += result.affected_rows or 0
+        bulk_result.insert_ids.append(result.insert_id)
+        if self._return_insert_ids:
+            bulk_result.row_insert_ids.extend(result.insert_ids or [None] * (end - start))
+
+    @staticmethod
+    def _failure(index: int, start: int, end: int, message) -> dict:
+        return {'index': index, 'start': start, 'end': end, 'message': message}
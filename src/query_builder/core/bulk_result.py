@@ -0,0 +1,13 @@
+from dataclasses import dataclass, field
+from typing import Optional, List, Dict, Any
+
+
+@dataclass
+class BulkResult:
+    is_success: bool
+    affected_rows: int = 0
+    insert_ids: List[Optional[int]] = field(default_factory=list)  # First generated id of each chunk, in chunk order (None for failed chunks)
+    row_insert_ids: Optional[List[Optional[int]]] = None  # Every generated id in row order when requested (None for rows of failed chunks)
+    chunk_count: int = 0
+    failed_chunks: List[Dict[str, Any]] = field(default_factory=list)  # {'index', 'start', 'end', 'message'}, rows are [start, end)
+    message: Optional[str] = None
@@ -0,0 +1,68 @@
+import time
+from typing import Any, Dict, Optional
+
+from ..exceptions.db_factory_exception import DBFactoryException
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a server is unreachable instead of letting every caller wait for its own connect timeout.
+
+    After `failure_threshold` consecutive connection failures the circuit opens and calls are rejected. Once
+    `reset_timeout` seconds passed, one probe call is let through (half-open): its success closes the circuit,
+    its failure opens it again for another `reset_timeout`.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0):
+        if failure_threshold < 1:
+            raise DBFactoryException("failure_threshold must be at least 1")
+
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+
+        self.failures = 0  # Consecutive failures
+        self.rejected = 0
+        self._opened_at: Optional[float] = None
+        self._probe_started_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return CircuitBreaker.CLOSED
+        if time.monotonic() - self._opened_at < self._reset_timeout:
+            return CircuitBreaker.OPEN
+        return CircuitBreaker.HALF_OPEN
+
+    def allow(self) -> bool:
+        """Whether a call may go through now; a rejected call is counted."""
+        state = self.state
+        if state == CircuitBreaker.CLOSED:
+            return True
+
+        now = time.monotonic()
+        # A single probe at a time, unless the previous one never reported back
+        if state == CircuitBreaker.HALF_OPEN and (
+                self._probe_started_at is None or now - self._probe_started_at >= self._reset_timeout):
+            self._probe_started_at = now
+            return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._probe_started_at is not None or self.failures >= self._failure_threshold:
+            self._opened_at = time.monotonic()
+            self._probe_started_at = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {'state': self.state, 'failures': self.failures, 'rejected': self.rejected}
@@ -1,13 +1,33 @@
 import asyncio
-from typing import List, Dict, Any, Optional
+import inspect
+import re
+from contextlib import asynccontextmanager, contextmanager
+from typing import List, Dict, Any, Optional, AsyncIterator, Iterable, Iterator, Set, Tuple, Union, Callable
 
 import aiomysql
+import pymysql
 
 from .db_result import DBResult
 from ..core.db_worker import DBWorker
+from .pool_metrics import PoolMetrics
+from .admission_controller import AdmissionController
+from .circuit_breaker import CircuitBreaker
+from .e_query import EQuery
+from .pool_sizer import AdaptivePoolSizer
+from .query_killer import QueryKiller
+from .read_your_writes import ReadYourWritesSession, read_your_writes_sessions
+from .replica_set import Replica, ReplicaSet
+from .retry_policy import RetryPolicy
+from .statement_classifier import StatementClassifier
+from ..enums.error_code import CONNECTION_ERRORS
+from ..enums.priority import Priority
+from ..enums.statement_kind import StatementKind
+from ..exceptions.connection_acquire_exception import ConnectionAcquireException
 from ..exceptions.db_factory_exception import DBFactoryException
 from .query_builder import QueryBuilder
+from .query import Query
 from .transaction import Transaction
+from ..utils.escape import Escape
 
 
 class DBFactory:
@@ -23,11 +43,81 @@ class DBFactory:
             read_instance_count: int = 2,
             timeout: int = 2,
             charset: str = 'utf8mb4',
-            debug_mode: bool = False
+            debug_mode: bool = False,
+            local_infile: bool = False,
+            read_replicas: Optional[List[Dict[str, Any]]] = None,
+            read_strategy: str = ReplicaSet.LEAST_OUTSTANDING,
+            health_check_interval: float = 5.0,
+            read_your_writes_window: float = 0.0,
+            wait_for_gtid: bool = False,
+            gtid_wait_timeout: float = 1.0,
+            min_instance_count: int = 1,
+            pool_recycle: int = 3600,
+            connect_timeout: Optional[float] = None,
+            warm_up_connections: int = 0,
+            validation_query: Optional[str] = "SELECT 1",
+            session_variables: Optional[Dict[str, Any]] = None,
+            pool_metrics: bool = False,
+            pool_stats_callback: Optional[Callable[[Dict[str, Any]], Any]] = None,
+            pool_stats_interval: float = 10.0,
+            adaptive_pool_sizing: bool = False,
+            max_instance_count: Optional[int] = None,
+            target_acquire_wait: float = 0.05,
+            pool_resize_cooldown: float = 60.0,
+            pool_resize_interval: float = 5.0,
+            priority_lanes: bool = False,
+            priority_quotas: Optional[Dict[Union[Priority, str], int]] = None,
+            acquire_timeout: Optional[float] = None,
+            query_timeout: Optional[float] = None,
+            kill_grace_period: float = 1.0,
+            retry_policy: Optional[RetryPolicy] = None,
+            circuit_breaker_threshold: int = 0,
+            circuit_breaker_reset_timeout: float = 10.0
     ):
+        """
+        :param read_replicas: Optional read replicas as {'host', 'port', 'weight'} dicts (host defaults to `host`,
+                              port to `read_port`, weight to 1); each gets its own read pool of
+                              `read_instance_count` connections and replaces the single read pool.
+        :param read_strategy: 'least_outstanding' or 'weighted' (smooth weighted round-robin).
+        :param health_check_interval: Seconds between replica health checks, 0 disables them.
+        :param read_your_writes_window: When positive, every context reads from the primary for this many seconds
+                                        after its own writes (see read_your_writes for an explicit scope).
+        :param wait_for_gtid: Wait on the replica for the GTID set of the last write instead of using the primary.
+        :param gtid_wait_timeout: Seconds to wait for a replica to apply the GTID set.
+        :param min_instance_count: Connections each pool opens on creation and keeps open.
+        :param pool_recycle: Seconds after which an idle connection is reopened, -1 disables it.
+        :param connect_timeout: Seconds to open a connection (defaults to `timeout`).
+        :param warm_up_connections: Connections per pool opened and validated by create_connections, so the first
+                                    requests after a deploy don't pay for the handshakes (see warm_up).
+        :param validation_query: Query run on every warmed-up connection, None to skip it.
+        :param session_variables: Session variables set on every new connection, e.g.
+                                  {'time_zone': '+00:00', 'transaction_isolation': 'READ-COMMITTED'}.
+        :param pool_metrics: Record acquire wait and hold times per pool, see get_pool_stats.
+        :param pool_stats_callback: Called (or awaited) with get_pool_stats() every `pool_stats_interval` seconds.
+        :param adaptive_pool_sizing: Start every pool at its instance count, grow it up to `max_instance_count` while
+                                     the average acquire wait exceeds `target_acquire_wait` seconds, and shrink it
+                                     back after `pool_resize_cooldown` calm seconds (see AdaptivePoolSizer).
+        :param max_instance_count: Upper bound of adaptive pools (defaults to 4 times the instance count, up to 200).
+        :param priority_lanes: Hand out the connections of the write and read pools by query priority
+                               (interactive, then normal, then batch) instead of first come, first served.
+        :param priority_quotas: Maximum connections per priority held at the same time, e.g. {'batch': 2}.
+        :param acquire_timeout: Seconds a query may wait for a connection before it is rejected.
+        :param query_timeout: Default seconds after which a query is killed on the server, see query.
+        :param kill_grace_period: Seconds to wait for a killed query to return before closing its connection.
+        :param retry_policy: Default policy to rerun queries failing on deadlocks, lock wait timeouts or (reads only)
+                             lost connections, see RetryPolicy.
+        :param circuit_breaker_threshold: Consecutive connection failures after which the write or read pool rejects
+                                          queries at once for `circuit_breaker_reset_timeout` seconds, 0 disables it.
+        """
         if write_instance_count > 200 or read_instance_count > 200:
             raise DBFactoryException("Maximum connection count exceeded (200)")
 
+        if max_instance_count is not None and max_instance_count > 200:
+            raise DBFactoryException("Maximum connection count exceeded (200)")
+
+        if min_instance_count < 0 or min_instance_count > min(write_instance_count, read_instance_count):
+            raise DBFactoryException("Minimum connection count must be between 0 and the instance counts")
+
         self._MAX_CONNECTION_COUNT = 200
         self._write_pool: Optional[aiomysql.Pool] = None
         self._read_pool: Optional[aiomysql.Pool] = None
@@ -44,94 +134,703 @@ class DBFactory:
         self._timeout = timeout
         self._charset = charset
         self._debug_mode = debug_mode
+        self._local_infile = local_infile
+
+        self._replica_set: Optional[ReplicaSet] = None
+        if read_replicas:
+            self._replica_set = ReplicaSet(
+                [
+                    Replica(replica.get('host', host), replica.get('port', read_port), replica.get('weight', 1))
+                    for replica in read_replicas
+                ],
+                read_strategy,
+                health_check_timeout=timeout
+            )
+        self._health_check_interval = health_check_interval
+        self._read_your_writes_window = read_your_writes_window
+        self._wait_for_gtid = wait_for_gtid
+        self._gtid_wait_timeout = gtid_wait_timeout
+
+        self._min_instance_count = min_instance_count
+        self._pool_recycle = pool_recycle
+        self._connect_timeout = connect_timeout if connect_timeout is not None else timeout
+        self._warm_up_connections = warm_up_connections
+        self._validation_query = validation_query
+        self._init_command = self._session_init_command(session_variables)
+
+        # Acquire wait and hold time per pool name ('write', 'read' or 'replica:host:port'), when enabled
+        self._pool_metrics: Dict[str, PoolMetrics] = {}
+        if pool_metrics or pool_stats_callback is not None or adaptive_pool_sizing:
+            self._pool_metrics['write'] = PoolMetrics()
+            if self._replica_set is None:
+                self._pool_metrics['read'] = PoolMetrics()
+            else:
+                for replica in self._replica_set.replicas:
+                    replica.metrics = self._pool_metrics[f"replica:{replica.host}:{replica.port}"] = PoolMetrics()
+        self._pool_stats_callback = pool_stats_callback
+        self._pool_stats_interval = pool_stats_interval
+        self._pool_stats_task: Optional[asyncio.Task] = None
+
+        self._adaptive_pool_sizing = adaptive_pool_sizing
+        self._max_instance_count = max_instance_count
+        self._target_acquire_wait = target_acquire_wait
+        self._pool_resize_cooldown = pool_resize_cooldown
+        self._pool_resize_interval = pool_resize_interval
+        self._pool_sizers: List[AdaptivePoolSizer] = []
+
+        self._query_timeout = query_timeout
+        self._kill_grace_period = kill_grace_period
+        self._retry_policy = retry_policy
+        # Fail fast per pool ('write' and 'read') while the server is unreachable, when enabled
+        self._circuit_breakers: Dict[str, CircuitBreaker] = {}
+        if circuit_breaker_threshold > 0:
+            self._circuit_breakers = {
+                name: CircuitBreaker(circuit_breaker_threshold, circuit_breaker_reset_timeout)
+                for name in ('write', 'read')
+            }
+
+        self._query_killer = QueryKiller(user=username, password=password, charset=charset,
+                                         connect_timeout=self._connect_timeout)
+        # KILL QUERY sent in the background for cancelled callers, awaited by close_connections
+        self._kill_tasks: Set[asyncio.Task] = set()
+
+        # Priority-aware admission per pool ('write' and 'read', replicas share the read one), when enabled
+        self._admission: Dict[str, AdmissionController] = {}
+        self._transaction_priorities: Dict[Transaction, Priority] = {}
+        if priority_lanes or priority_quotas or acquire_timeout is not None:
+            quotas = {
+                AdmissionController.priority(priority): quota for priority, quota in (priority_quotas or {}).items()
+            }
+            self._admission['write'] = AdmissionController(
+                lambda: self._write_pool.maxsize if self._write_pool else 0, quotas, acquire_timeout
+            )
+            self._admission['read'] = AdmissionController(self._read_capacity, quotas, acquire_timeout)
 
     async def create_connections(self):
-        """Create connection pools for write and read operations."""
+        """Create the write and read connection pools concurrently, then warm them up if configured."""
         if self._write_pool or self._read_pool:
             raise DBFactoryException("Connection pools already created")
 
+        readers = self._replica_set.replicas if self._replica_set is not None else [None]
+        pools = await asyncio.gather(
+            self._create_pool(self._host, self._write_port, self._write_instance_count,
+                              local_infile=self._local_infile),
+            *(
+                self._create_pool(self._host, self._read_port, self._read_instance_count) if replica is None
+                else self._create_pool(replica.host, replica.port, self._read_instance_count)
+                for replica in readers
+            ),
+            return_exceptions=True
+        )
+
+        self._write_pool = pools[0] if not isinstance(pools[0], BaseException) else None
+        for replica, pool in zip(readers, pools[1:]):
+            pool = pool if not isinstance(pool, BaseException) else None
+            if replica is None:
+                self._read_pool = pool
+            else:
+                replica.pool = pool
+
         try:
-            # Create write connection pool
-            self._write_pool = await aiomysql.create_pool(
-                host=self._host,
-                port=self._write_port,
-                user=self._username,
-                password=self._password,
-                db=self._db_name,
-                charset=self._charset,
-                autocommit=True,
-                maxsize=self._write_instance_count,
-                minsize=1,
-                pool_recycle=3600
-            )
+            errors = [pool for pool in pools if isinstance(pool, BaseException)]
+            if errors:
+                raise errors[0]
 
-            # Create read connection pool
-            self._read_pool = await aiomysql.create_pool(
-                host=self._host,
-                port=self._read_port,
-                user=self._username,
-                password=self._password,
-                db=self._db_name,
-                charset=self._charset,
-                autocommit=True,
-                maxsize=self._read_instance_count,
-                minsize=1,
-                pool_recycle=3600
-            )
+            if self._warm_up_connections > 0:
+                await self.warm_up(self._warm_up_connections)
+
+            if self._replica_set is not None:
+                self._replica_set.start_health_checks(self._health_check_interval)
+
+            if self._adaptive_pool_sizing:
+                self._start_pool_sizers()
+
+            if self._pool_stats_callback is not None and self._pool_stats_interval > 0:
+                self._pool_stats_task = asyncio.ensure_future(self._report_pool_stats())
 
             print("Connection pools created successfully")
         except Exception as e:
-            # Clean up if one pool was created but the other failed
+            # Clean up the pools that were created
             if self._write_pool:
                 self._write_pool.close()
                 await self._write_pool.wait_closed()
+                self._write_pool = None
             if self._read_pool:
                 self._read_pool.close()
                 await self._read_pool.wait_closed()
+                self._read_pool = None
+            if self._replica_set:
+                await self._replica_set.close()
             raise DBFactoryException(f"Failed to create connection pools: {e}")
 
-    async def query(self, query: str) -> DBResult:
-        """Run a query using either a write or read connection pool."""
+    def _start_pool_sizers(self) -> None:
+        pools = [('write', self._write_pool, self._write_instance_count)]
+        if self._replica_set is None:
+            pools.append(('read', self._read_pool, self._read_instance_count))
+        else:
+            pools.extend(
+                (f"replica:{replica.host}:{replica.port}", replica.pool, self._read_instance_count)
+                for replica in self._replica_set.replicas
+            )
+
+        for name, pool, instance_count in pools:
+            max_size = self._max_instance_count or min(instance_count * 4, self._MAX_CONNECTION_COUNT)
+            sizer = AdaptivePoolSizer(
+                name, pool, self._pool_metrics[name], instance_count, max(max_size, instance_count),
+                target_wait=self._target_acquire_wait, cooldown=self._pool_resize_cooldown,
+                interval=self._pool_resize_interval,
+                on_resize=self._logs.append if self._debug_mode else None,
+                admission=self._admission.get('write' if name == 'write' else 'read')
+            )
+            sizer.start()
+            self._pool_sizers.append(sizer)
+
+    def get_pool_sizing_decisions(self) -> List[Dict[str, Any]]:
+        """Latest adaptive sizing decisions of every pool, oldest first."""
+        return sorted((decision for sizer in self._pool_sizers for decision in sizer.decisions),
+                      key=lambda decision: decision['at'])
+
+    async def warm_up(self, connections: int) -> None:
+        """
+        Open up to `connections` connections in every pool and run the validation query on each of them.
+
+        :raises DBFactoryException: If a connection can't be opened or validated.
+        """
+        pools = [self._write_pool, self._read_pool]
+        if self._replica_set is not None:
+            pools.extend(replica.pool for replica in self._replica_set.replicas)
+
+        await asyncio.gather(*(self._warm_up_pool(pool, connections) for pool in pools if pool))
+
+    async def _warm_up_pool(self, pool: aiomysql.Pool, connections: int) -> None:
+        # Hold the connections at the same time, otherwise the pool keeps reusing the first one
+        acquired = await asyncio.gather(*(pool.acquire() for _ in range(min(connections, pool.maxsize))),
+                                        return_exceptions=True)
+        try:
+            for connection in acquired:
+                if isinstance(connection, BaseException):
+                    raise DBFactoryException(f"Failed to warm up connection: {connection}")
+
+                if self._validation_query:
+                    await DBWorker(connection).execute_query(self._validation_query)
+        finally:
+            for connection in acquired:
+                if not isinstance(connection, BaseException):
+                    pool.release(connection)
+
+    async def _create_pool(self, host: str, port: int, maxsize: int, **kwargs) -> aiomysql.Pool:
+        return await aiomysql.create_pool(
+            host=host,
+            port=port,
+            user=self._username,
+            password=self._password,
+            db=self._db_name,
+            charset=self._charset,
+            autocommit=True,
+            maxsize=maxsize,
+            minsize=self._min_instance_count,
+            pool_recycle=self._pool_recycle,
+            connect_timeout=self._connect_timeout,
+            init_command=self._init_command,
+            **kwargs
+        )
+
+    @staticmethod
+    def _session_init_command(session_variables: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Build the SET statement run by every new connection."""
+        if not session_variables:
+            return None
+
+        escape = Escape()
+        assignments = []
+        for name, value in session_variables.items():
+            if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", name):
+                raise DBFactoryException(f"Invalid session variable: {name}")
+            assignments.append(f"SESSION {name} = {escape._escape(value)}")
+
+        return f"SET {', '.join(assignments)}"
+
+    async def query(self, query: str, return_insert_ids: bool = False,
+                    route: Optional[Union[StatementKind, str]] = None,
+                    priority: Optional[Union[Priority, str]] = None,
+                    timeout: Optional[float] = None,
+                    retry_policy: Optional[RetryPolicy] = None) -> DBResult:
+        """
+        Run a query using either a write or read connection pool.
+
+        The pool is picked from `route` when given ('read' or 'write', builders pass the kind of the statement
+        they compiled), otherwise from the leading keyword of the statement, see StatementClassifier.
+
+        Within a read-your-writes session (see read_your_writes), reads made shortly after a write of the same
+        session go to the primary, or to a replica once it has applied the write's GTID set.
+
+        :param query: The SQL statement.
+        :param return_insert_ids: Return every generated id of a multi-row insert, see DBWorker.query.
+        :param route: Force the read or the write pool.
+        :param priority: Admission priority ('interactive', 'normal' or 'batch') when priority lanes are enabled.
+        :param timeout: Seconds after which the statement is killed on the server and a result with is_timeout
+                        is returned (defaults to the factory's query_timeout).
+        :param retry_policy: Rerun the query on transient errors (defaults to the factory's retry_policy).
+                             Connections that can't be opened are retried for writes too, nothing ran yet.
+                             LOAD DATA statements are never rerun once sent, their stream is consumed.
+        :raises DBFactoryException: If the route or the priority is not valid, no connection was granted
+                                    within the acquire timeout, or the pool's circuit breaker is open.
+        :raises ConnectionAcquireException: If no connection could be opened (after the retries).
+        """
         # Determine if the query is a write operation
-        is_write = not query.lower().strip().startswith(('select', 'show'))
-        pool = self._write_pool if is_write else self._read_pool
+        is_write = self._statement_kind(query, route) == StatementKind.WRITE
+        timeout = timeout if timeout is not None else self._query_timeout
+        retry_policy = retry_policy if retry_policy is not None else self._retry_policy
+        # LOAD DATA LOCAL consumes its stream on the first run, running it again would load nothing
+        replayable = StatementClassifier.leading_keyword(query) != "LOAD"
 
-        if not pool:
-            raise DBFactoryException("Connection pools not initialized")
+        attempt = 1
+        while True:
+            try:
+                result = await self._query_once(query, return_insert_ids, is_write, priority, timeout)
+            except ConnectionAcquireException as e:
+                # Only failures to get a connection are retried here, the statement never reached the server
+                if (retry_policy is None or attempt >= retry_policy.max_attempts
+                        or e.error_code not in CONNECTION_ERRORS):
+                    raise
+            else:
+                if (retry_policy is None or not replayable
+                        or not retry_policy.should_retry(result, attempt, is_write)):
+                    return result
 
-        async with pool.acquire() as connection:
-            worker = DBWorker(connection)
+            await asyncio.sleep(retry_policy.delay(attempt))
+            attempt += 1
 
-            if not self._debug_mode:
-                return await worker.query(query)
+    async def _query_once(self, query: str, return_insert_ids: bool, is_write: bool,
+                          priority: Optional[Union[Priority, str]], timeout: Optional[float]) -> DBResult:
+        session = self._read_your_writes_session(create=is_write)
 
-            # Debug mode
-            start_time = asyncio.get_running_loop().time()
+        if is_write:
+            async with self._acquire(True, priority) as connection:
+                worker = DBWorker(connection)
+                result = await self._execute(worker, query, return_insert_ids, is_write, timeout, 'write')
+                if session is not None and result.is_success:
+                    session.record_write(await self._gtid_after_write(worker) if session.wait_for_gtid else None)
+                return result
+
+        if session is not None and session.is_sticky():
+            if session.gtid_executed is not None:
+                async with self._acquire(False, priority) as connection:
+                    worker = DBWorker(connection)
+                    if await worker.wait_for_gtid(session.gtid_executed, self._gtid_wait_timeout):
+                        return await self._execute(worker, query, return_insert_ids, is_write, timeout,
+                                                   self._pool_name(False))
+
+            # The replica hasn't applied the write yet, or there's no GTID to wait for
+            async with self._acquire(True, priority) as connection:
+                return await self._execute(DBWorker(connection), query, return_insert_ids, is_write, timeout, 'write')
+
+        async with self._acquire(False, priority) as connection:
+            return await self._execute(DBWorker(connection), query, return_insert_ids, is_write, timeout,
+                                       self._pool_name(False))
+
+    async def _gtid_after_write(self, worker: DBWorker) -> Optional[str]:
+        """GTID set of the primary after a write, None if it can't be read: the reads then use the primary."""
+        try:
+            return await worker.get_gtid_executed()
+        except pymysql.err.MySQLError as e:
+            # The write is applied, it must not be reported as failed
+            if self._debug_mode:
+                self._logs.append({'query': "SELECT @@GLOBAL.gtid_executed", 'took': 0, 'isWrite': False,
+                                   'status': False, 'error': str(e)})
+            return None
+
+    async def run_many(self, queries: Iterable[Union[EQuery, Query, str]], concurrency: int = 10,
+                       ordered: bool = True, fail_fast: bool = False,
+                       priority: Optional[Union[Priority, str]] = None,
+                       timeout: Optional[float] = None) -> AsyncIterator[Tuple[int, DBResult]]:
+        """
+        Run many independent queries with at most `concurrency` of them in flight, yielding (index, result) pairs.
+
+        Queries are pulled lazily from `queries` by `concurrency` workers, and each one is routed like query()
+        (compiled builders pass their kind). Workers stay at most 2 * `concurrency` queries ahead of the results
+        the caller consumed, so a slow query doesn't make the buffered results grow without bound.
+        Errors are collected as failed results, unless `fail_fast` is set: the first failure then cancels the
+        queries in flight and raises.
+
+            results = [result async for _, result in factory.run_many(queries, concurrency=20)]
+
+        :param queries: Compiled builders of this factory, Query objects or SQL strings.
+        :param concurrency: Maximum number of queries running at the same time.
+        :param ordered: Yield in input order, otherwise as soon as each query completes.
+        :param fail_fast: Stop at the first failed query instead of yielding it.
+        :param priority: Admission priority of every query, see query.
+        :param timeout: Timeout of every query, see query.
+        :raises DBFactoryException: If concurrency is below 1, a query failed in fail-fast mode, or a compiled
+                                    builder belongs to another factory or a transaction.
+        :raises Exception: Whatever iterating `queries` raised.
+        """
+        if concurrency < 1:
+            raise DBFactoryException("Concurrency must be at least 1")
+
+        pending = enumerate(queries)  # Shared by the workers, each one takes the next query
+        completed: asyncio.Queue = asyncio.Queue()
+        window = asyncio.Semaphore(2 * concurrency)  # Queries taken but not yet yielded to the caller
+
+        async def work() -> None:
             try:
-                result = await worker.query(query)
-                end_time = asyncio.get_running_loop().time()
+                while True:
+                    await window.acquire()
+                    try:
+                        index, query = next(pending)
+                    except StopIteration:
+                        return
+                    if isinstance(query, EQuery) and query.factory is not None and query.factory is not self:
+                        raise DBFactoryException(f"Query {index} was compiled for another factory or a transaction")
+
+                    await completed.put((index, await self._run_one(query, priority, timeout)))
+            except Exception as e:
+                completed.put_nowait(e)  # Raised to the caller
+            finally:
+                completed.put_nowait(None)
+
+        workers = [asyncio.ensure_future(work()) for _ in range(concurrency)]
+        buffered: Dict[int, DBResult] = {}
+        next_index = 0
+        try:
+            running = len(workers)
+            while running:
+                item = await completed.get()
+                if item is None:
+                    running -= 1
+                    continue
 
-                self._logs.append({
-                    'query': query,
-                    'took': end_time - start_time,
-                    'isWrite': is_write,
-                    'status': result.is_success,
-                })
+                if isinstance(item, Exception):
+                    raise item
+
+                index, result = item
+                if fail_fast and not result.is_success:
+                    raise DBFactoryException(f"Query {index} failed: {result.message}")
+
+                if not ordered:
+                    window.release()
+                    yield item
+                    continue
+
+                buffered[index] = result
+                while next_index in buffered:
+                    window.release()
+                    yield next_index, buffered.pop(next_index)
+                    next_index += 1
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _run_one(self, query: Union[EQuery, Query, str], priority: Optional[Union[Priority, str]],
+                       timeout: Optional[float]) -> DBResult:
+        try:
+            if isinstance(query, EQuery):
+                return await self.query(query.query, return_insert_ids=query.return_insert_ids, route=query.kind,
+                                        priority=priority, timeout=timeout)
 
+            sql = query.get_query() if isinstance(query, Query) else query
+            return await self.query(sql, priority=priority, timeout=timeout)
+        except Exception as e:
+            return DBResult(is_success=False, message=str(e), error_code=DBWorker.error_code(e))
+
+    @staticmethod
+    def _statement_kind(query: str, route: Optional[Union[StatementKind, str]]) -> StatementKind:
+        if route is None:
+            return StatementClassifier.classify(query)
+
+        if isinstance(route, StatementKind):
+            return route
+
+        try:
+            return StatementKind(route)
+        except ValueError:
+            raise DBFactoryException(f"Route must be 'read' or 'write', got {route!r}")
+
+    async def _execute(self, worker: DBWorker, query: str, return_insert_ids: bool, is_write: bool,
+                       timeout: Optional[float] = None, pool_name: Optional[str] = None) -> DBResult:
+        if not self._debug_mode:
+            return self._record_outcome(pool_name, await self._run_query(worker, query, return_insert_ids, timeout))
+
+        # Debug mode
+        start_time = asyncio.get_running_loop().time()
+        try:
+            result = self._record_outcome(pool_name, await self._run_query(worker, query, return_insert_ids, timeout))
+            end_time = asyncio.get_running_loop().time()
+
+            self._logs.append({
+                'query': query,
+                'took': end_time - start_time,
+                'isWrite': is_write,
+                'status': result.is_success,
+            })
+
+            return result
+        except Exception as e:
+            end_time = asyncio.get_running_loop().time()
+            self._logs.append({
+                'query': query,
+                'took': end_time - start_time,
+                'isWrite': is_write,
+                'status': False,
+                'error': str(e)
+            })
+            raise
+
+    def _record_outcome(self, pool_name: Optional[str], result: DBResult) -> DBResult:
+        """Feed the pool's circuit breaker: lost connections count as failures, any other answer as a success."""
+        breaker = self._circuit_breakers.get(pool_name)
+        if breaker is not None:
+            if result.error_code in CONNECTION_ERRORS:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        return result
+
+    async def _run_query(self, worker: DBWorker, query: str, return_insert_ids: bool,
+                         timeout: Optional[float]) -> DBResult:
+        """
+        Run the query, stopping it on the server with KILL QUERY once `timeout` seconds have passed.
+
+        Cancelling the coroutine alone would leave the statement running and the connection busy, so the
+        statement is killed over a control connection, then the interrupted query is drained so the
+        connection can go back to the pool; if it doesn't finish in time the connection is closed instead.
+        """
+        if timeout is None:
+            return await worker.query(query, return_insert_ids)
+
+        connection = worker.get_connection()
+        task = asyncio.ensure_future(worker.query(query, return_insert_ids))
+        try:
+            done, _ = await asyncio.wait({task}, timeout=timeout)
+        except asyncio.CancelledError:
+            # The caller gave up: stop the statement in the background and discard the connection
+            task.cancel()
+            kill = asyncio.ensure_future(self._kill_quietly(connection, query))
+            self._kill_tasks.add(kill)
+            kill.add_done_callback(self._kill_tasks.discard)
+            connection.close()
+            raise
+
+        if done:
+            return task.result()
+
+        try:
+            await self._query_killer.kill_query(connection.host, connection.port, connection.thread_id())
+            done, _ = await asyncio.wait({task}, timeout=self._kill_grace_period)
+        except Exception as e:
+            self._log_kill_failure(query, e)
+            done = set()
+
+        if done:
+            result = task.result()
+            if result.is_success:
+                # The statement finished before the KILL reached it
                 return result
+        else:
+            task.cancel()
+            connection.close()
+
+        return DBResult(
+            is_success=False,
+            message=f"Query timed out after {timeout}s",
+            is_timeout=True
+        )
+
+    async def _kill_quietly(self, connection: aiomysql.Connection, query: str) -> None:
+        try:
+            await self._query_killer.kill_query(connection.host, connection.port, connection.thread_id())
+        except Exception as e:
+            self._log_kill_failure(query, e)
+
+    def _log_kill_failure(self, query: str, error: Exception) -> None:
+        """The statement may still run on the server: counted by the killer (see get_pool_stats), logged in debug."""
+        if self._debug_mode:
+            self._logs.append({'query': query, 'took': None, 'isWrite': None, 'status': False,
+                               'error': f"KILL QUERY failed, the statement may still be running: {error}"})
+
+    @contextmanager
+    def read_your_writes(self, window: Optional[float] = None, wait_for_gtid: Optional[bool] = None) -> Iterator[ReadYourWritesSession]:
+        """
+        Route the reads of the current context to the primary for `window` seconds after each of its writes.
+
+        Tasks created inside the block share the session. Other callers keep reading from the replicas.
+
+        :param window: Seconds after a write during which reads must see it (defaults to the factory's window,
+                       or 1 second when the factory has none).
+        :param wait_for_gtid: Instead of using the primary, wait on the replica until it has applied the GTID set
+                              read after the write; reads go to the primary if the wait times out.
+        """
+        session = ReadYourWritesSession(
+            window if window is not None else (self._read_your_writes_window or 1.0),
+            wait_for_gtid if wait_for_gtid is not None else self._wait_for_gtid
+        )
+        token = read_your_writes_sessions.set({**(read_your_writes_sessions.get() or {}), self: session})
+        try:
+            yield session
+        finally:
+            read_your_writes_sessions.reset(token)
+
+    def _read_your_writes_session(self, create: bool) -> Optional[ReadYourWritesSession]:
+        """
+        The session of the current context for this factory, created on a write when the factory enables it by
+        default.
+
+        A created session lasts as long as the current task and is inherited by the tasks it creates afterwards;
+        it only sends reads to the primary during the window following each write.
+        """
+        sessions = read_your_writes_sessions.get() or {}
+        session = sessions.get(self)
+        if session is None and create and self._read_your_writes_window > 0:
+            session = ReadYourWritesSession(self._read_your_writes_window, self._wait_for_gtid)
+            read_your_writes_sessions.set({**sessions, self: session})
+
+        return session
+
+    @asynccontextmanager
+    async def _acquire(self, is_write: bool, priority: Optional[Union[Priority, str]] = None) -> AsyncIterator[aiomysql.Connection]:
+        """Acquire a connection from the write pool, or from the read pool or replicas."""
+        use_replicas = not is_write and self._replica_set is not None and self._replica_set.has_healthy_replica()
+
+        # Reads fall back to the primary when every replica is ejected
+        pool = None
+        if not use_replicas:
+            pool = self._write_pool if is_write or self._replica_set is not None else self._read_pool
+            if not pool:
+                raise DBFactoryException("Connection pools not initialized")
+
+        name = 'write' if pool is not None and pool is self._write_pool else 'read'
+        breaker = self._circuit_breakers.get(name)
+        if breaker is not None and not breaker.allow():
+            raise DBFactoryException(f"Circuit breaker open for the {name} pool, the server is unreachable")
+
+        admission = self._admission.get(name)
+        if admission is not None:
+            priority = admission.priority(priority)
+            await admission.acquire(priority)
+
+        try:
+            if use_replicas:
+                acquired = False
+                try:
+                    async with self._replica_set.acquire() as connection:
+                        acquired = True
+                        yield connection
+                except pymysql.err.MySQLError as e:
+                    if acquired:
+                        raise
+                    raise ConnectionAcquireException(f"Failed to connect to a replica: {e}",
+                                                     DBWorker.error_code(e)) from e
+                return
+
+            try:
+                connection = await self._acquire_connection(pool, name)
+            except pymysql.err.MySQLError as e:
+                if breaker is not None and DBWorker.error_code(e) in CONNECTION_ERRORS:
+                    breaker.record_failure()
+                raise ConnectionAcquireException(f"Failed to connect to the {name} pool: {e}",
+                                                 DBWorker.error_code(e)) from e
+            try:
+                yield connection
+            finally:
+                self._release_connection(pool, name, connection)
+        finally:
+            if admission is not None:
+                admission.release(priority)
+
+    def _pool_name(self, is_write: bool) -> str:
+        """Name of the pool _acquire uses, 'write' or 'read' (replicas included)."""
+        if is_write or (self._replica_set is not None and not self._replica_set.has_healthy_replica()):
+            return 'write'
+        return 'read'
+
+    def _read_capacity(self) -> int:
+        if self._replica_set is None:
+            return self._read_pool.maxsize if self._read_pool else 0
+
+        return sum(replica.pool.maxsize for replica in self._replica_set.replicas if replica.is_healthy and replica.pool)
+
+    async def _acquire_connection(self, pool: aiomysql.Pool, name: str) -> aiomysql.Connection:
+        metrics = self._pool_metrics.get(name)
+        return await (metrics.acquire(pool) if metrics is not None else pool.acquire())
+
+    def _release_connection(self, pool: aiomysql.Pool, name: str, connection: aiomysql.Connection) -> None:
+        metrics = self._pool_metrics.get(name)
+        if metrics is not None:
+            metrics.release(pool, connection)
+        else:
+            pool.release(connection)
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Occupancy of every pool ('write', 'read' or 'replica:host:port'): size, free, in_use, maxsize, utilization.
+
+        With pool metrics enabled, also the acquisitions, acquire_failures, waiting (queue length) and the
+        acquire_wait / hold_time distributions (count, avg, p50, p90, p99, max in seconds).
+        With priority lanes, 'admission:write' and 'admission:read' report the slots held and the queue.
+        With circuit breakers, 'circuit:write' and 'circuit:read' report the state, failures and rejected calls.
+        'query_killer' reports the KILL QUERY sent for timed-out or cancelled queries, and the failed ones.
+        """
+        pools = {'write': self._write_pool}
+        if self._replica_set is None:
+            pools['read'] = self._read_pool
+        else:
+            pools.update(
+                (f"replica:{replica.host}:{replica.port}", replica.pool) for replica in self._replica_set.replicas
+            )
+
+        stats = {
+            name: self._pool_metrics[name].snapshot(pool) if name in self._pool_metrics
+            else PoolMetrics.pool_snapshot(pool)
+            for name, pool in pools.items()
+        }
+
+        for name, breaker in self._circuit_breakers.items():
+            stats[f"circuit:{name}"] = breaker.snapshot()
+
+        stats['query_killer'] = self._query_killer.snapshot()
+
+        # Priority lanes: slots held per priority, queued and rejected callers
+        for name, admission in self._admission.items():
+            stats[f"admission:{name}"] = {
+                'in_use': admission.in_use,
+                'in_use_by_priority': {priority.name.lower(): count
+                                       for priority, count in admission.in_use_by_priority.items()},
+                'waiting': admission.waiting,
+                'rejected': admission.rejected,
+            }
+
+        return stats
+
+    async def _report_pool_stats(self) -> None:
+        while True:
+            await asyncio.sleep(self._pool_stats_interval)
+            try:
+                report = self._pool_stats_callback(self.get_pool_stats())
+                if inspect.isawaitable(report):
+                    await report
             except Exception as e:
-                end_time = asyncio.get_running_loop().time()
-                self._logs.append({
-                    'query': query,
-                    'took': end_time - start_time,
-                    'isWrite': is_write,
-                    'status': False,
-                    'error': str(e)
-                })
-                raise
+                # A failing callback must not stop the reports
+                print(f"Pool stats callback failed: {e}")
 
     async def close_connections(self):
         """Close write and read connection pools."""
+        for sizer in self._pool_sizers:
+            await sizer.stop()
+        self._pool_sizers = []
+
+        if self._pool_stats_task is not None:
+            self._pool_stats_task.cancel()
+            try:
+                await self._pool_stats_task
+            except asyncio.CancelledError:
+                pass
+            self._pool_stats_task = None
+
+        if self._kill_tasks:
+            # Let the pending kills reach the server before their control connections close
+            await asyncio.gather(*self._kill_tasks, return_exceptions=True)
+
         try:
             if self._write_pool:
                 self._write_pool.close()
@@ -143,40 +842,176 @@ class DBFactory:
                 await self._read_pool.wait_closed()
                 self._read_pool = None
 
+            if self._replica_set:
+                await self._replica_set.close()
+
+            await self._query_killer.close()
+
             print("Connection pools closed successfully")
         except Exception as e:
             raise DBFactoryException(f"Failed to close connection pools: {e}")
 
     def get_query_builder(self) -> QueryBuilder:
         """Retrieve a query builder instance."""
-        if not self._read_pool or not self._write_pool:
+        read_pool = self._read_pool if self._replica_set is None else self._replica_set.replicas[0].pool
+        if not read_pool or not self._write_pool:
             raise DBFactoryException("Connection pools not created")
 
         return QueryBuilder(self)
 
-    async def begin_transaction(self) -> Transaction:
-        """Start a new transaction using a write connection."""
+    async def begin_transaction(self, priority: Optional[Union[Priority, str]] = None) -> Transaction:
+        """Start a new transaction using a write connection, admitted with `priority` when lanes are enabled."""
         if not self._write_pool:
             raise DBFactoryException("Write connection pool not initialized")
 
+        breaker = self._circuit_breakers.get('write')
+        if breaker is not None and not breaker.allow():
+            raise DBFactoryException("Circuit breaker open for the write pool, the server is unreachable")
+
+        admission = self._admission.get('write')
+        if admission is not None:
+            priority = admission.priority(priority)
+            await admission.acquire(priority)
+
         connection = None
         try:
-            connection = await self._write_pool.acquire()
+            try:
+                connection = await self._acquire_connection(self._write_pool, 'write')
+            except pymysql.err.MySQLError as e:
+                if breaker is not None and DBWorker.error_code(e) in CONNECTION_ERRORS:
+                    breaker.record_failure()
+                raise
             worker = DBWorker(connection)
             transaction = worker.start_transaction()
             await transaction.begin()
+            transaction.on_release(lambda: self._release_transaction(transaction))
+            if breaker is not None:
+                breaker.record_success()
+            if admission is not None:
+                self._transaction_priorities[transaction] = priority
             return transaction
         except Exception as e:
             if connection:
-                self._write_pool.release(connection)
+                self._release_connection(self._write_pool, 'write', connection)
+            if admission is not None:
+                admission.release(priority)
             raise DBFactoryException(f"Failed to start transaction: {e}")
 
-    async def execute_transaction(self, queries: List[str]) -> DBResult:
-        """Execute multiple queries in a transaction."""
+    def release_transaction(self, transaction: Transaction) -> None:
+        """
+        Return the connection of a finished transaction to the write pool.
+
+        Commit and rollback already do it, so this is only needed for a transaction abandoned while active, and
+        does nothing once released. aiomysql closes the connection instead of reusing it if the server still
+        reports an open transaction.
+        """
+        transaction.release()
+
+    def _release_transaction(self, transaction: Transaction) -> None:
+        self._release_connection(self._write_pool, 'write', transaction._worker.get_connection())
+        if transaction in self._transaction_priorities:
+            self._admission['write'].release(self._transaction_priorities.pop(transaction))
+
+        session = self._read_your_writes_session(create=True)
+        if session is not None:
+            # The GTID isn't read here, so the following reads use the primary
+            session.record_write()
+
+    async def claim_rows(
+            self,
+            table: str,
+            updates: Dict[str, Any],
+            limit: int,
+            where: Optional[Dict[str, Any]] = None,
+            primary_key: str = 'id'
+    ) -> DBResult:
+        """
+        Claim up to `limit` unlocked rows of a work-queue table in one transaction.
+
+        The rows are selected with FOR UPDATE SKIP LOCKED, so concurrent workers never wait on each
+        other's rows, then marked with `updates` before the transaction commits.
+
+        :param table: The queue table.
+        :param updates: Column values that mark the rows as claimed, e.g. {'status': 'running'}.
+        :param limit: Maximum number of rows to claim.
+        :param where: Optional equality conditions the claimable rows must match.
+        :param primary_key: The primary key column used to mark the selected rows.
+        :return: DBResult whose rows are the claimed rows as they were before marking.
+        """
+        if limit <= 0:
+            raise DBFactoryException("Claim limit must be positive")
+
+        if not updates:
+            raise DBFactoryException("Claim updates required")
+
         transaction = None
         try:
             transaction = await self.begin_transaction()
-            
+            query_builder = transaction.get_query_builder()
+
+            select = (
+                query_builder
+                .select()
+                .from_table(table)
+                .add_all_columns()
+                .add_order(primary_key)
+                .set_limit(limit)
+                .lock_for_update(skip_locked=True)
+            )
+            if where:
+                select.where_group(where)
+
+            claimed = await select.compile().commit()
+            if not claimed.is_success:
+                await transaction.rollback()
+                return claimed
+
+            if claimed.rows:
+                result = await (
+                    query_builder
+                    .update()
+                    .table(table)
+                    .set_updates(updates)
+                    .where_in(primary_key, [row[primary_key] for row in claimed.rows])
+                    .compile()
+                    .commit()
+                )
+                if not result.is_success:
+                    await transaction.rollback()
+                    return result
+
+            result = await transaction.commit()
+            return claimed if result.is_success else result
+        except Exception as e:
+            if transaction and transaction.is_active:
+                await transaction.rollback()
+            return DBResult(
+                is_success=False,
+                message=f"Claim failed: {str(e)}"
+            )
+        finally:
+            if transaction:
+                self.release_transaction(transaction)
+
+    async def execute_transaction(self, queries: List[str], batch_size: Optional[int] = None) -> DBResult:
+        """
+        Execute multiple queries in a transaction.
+
+        :param batch_size: Send the queries as multi-statement packets of up to this many statements, see
+                           Transaction.commit.
+        """
+        transaction = None
+        try:
+            transaction = await self.begin_transaction()
+
+            if batch_size:
+                for query in queries:
+                    transaction.add_query(Query(query))
+                result = await transaction.commit(batch_size)
+                if not result.is_success:
+                    result.message = f"Transaction failed: {result.message}"
+                return result
+
             for query in queries:
                 result = await transaction._worker.query(query)
                 if not result.is_success:
@@ -195,3 +1030,6 @@ class DBFactory:
                 is_success=False,
                 message=f"Transaction failed: {str(e)}"
             )
+        finally:
+            if transaction is not None:
+                self.release_transaction(transaction)
@@ -10,3 +10,8 @@ class DBResult:
     insert_id: Optional[int] = None
     affected_rows: Optional[int] = None
     message: Optional[str] = None  # In case of error it represents the error_message, else it may represent the executed query
+    warning_count: Optional[int] = None
+    insert_ids: Optional[List[int]] = None  # Every generated id of a multi-row insert, when requested
+    is_timeout: bool = False  # The query hit its timeout and was killed on the server
+    error_code: Optional[int] = None  # MySQL error number of a failed query (e.g. 1213 deadlock, 2013 lost connection)
+    failed_statement: Optional[int] = None  # Index of the statement that failed, for batched statements
@@ -1,6 +1,8 @@
-from typing import Dict, Any, Optional
+from typing import List, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 import aiomysql
+import pymysql
 
 from .db_result import DBResult
 from .query_result import QueryResult
@@ -8,48 +10,127 @@ from ..exceptions.db_factory_exception import DBFactoryException
 
 
 class DBWorker:
+    # (auto_increment_increment, innodb_autoinc_lock_mode) per connection, read once
+    _auto_increment_settings: WeakKeyDictionary = WeakKeyDictionary()
+
     def __init__(self, connection: aiomysql.Connection):
         self._connection: aiomysql.Connection = connection
         self._jobs: int = 0  # Tracks the number of jobs, for compatibility with existing design
         self._current_transaction = None  # Remove type hint to avoid circular import
 
-    async def query(self, sql: str) -> DBResult:
-        """Execute a query and handle the result."""
+    async def query(self, sql: str, return_insert_ids: bool = False) -> DBResult:
+        """
+        Execute a query and handle the result.
+
+        With return_insert_ids, a multi-row INSERT also returns every generated id, derived from the first id,
+        the affected rows and the session's auto_increment_increment. This is only correct for plain
+        INSERT ... VALUES statements that let the server generate every id, and it is refused (without running
+        the query) when innodb_autoinc_lock_mode is 2, where ids of one statement may not be consecutive.
+        """
         self.start_job()
         try:
+            increment = await self.get_auto_increment_increment() if return_insert_ids else None
             result = await self.execute_query(sql)
             self.end_job()
-            return self.handle_result(result)
+            return self.handle_result(result, increment)
         except Exception as e:
             self.end_job()
             return self.handle_exception(e)
 
+    async def get_auto_increment_increment(self) -> int:
+        """
+        Read the session's auto_increment_increment, cached per connection.
+
+        :raises DBFactoryException: If the server may hand out non-consecutive ids within one statement.
+        """
+        settings: Optional[Tuple[int, int]] = self._auto_increment_settings.get(self._connection)
+        if settings is None:
+            result = await self.execute_query("SELECT @@auto_increment_increment, @@innodb_autoinc_lock_mode")
+            settings = (int(result.result_rows[0][0]), int(result.result_rows[0][1]))
+            self._auto_increment_settings[self._connection] = settings
+
+        increment, lock_mode = settings
+        if lock_mode == 2:
+            raise DBFactoryException("Insert ids can't be derived with innodb_autoinc_lock_mode = 2 (interleaved)")
+
+        return increment
+
+    async def get_gtid_executed(self) -> str:
+        """Read the GTID set executed by the server, e.g. right after a write on the primary."""
+        result = await self.execute_query("SELECT @@GLOBAL.gtid_executed")
+        return str(result.result_rows[0][0])
+
+    async def wait_for_gtid(self, gtid_set: str, timeout: float) -> bool:
+        """
+        Wait until the server has applied a GTID set, e.g. on a replica before reading a write.
+
+        :return: False if the server is still behind after `timeout` seconds.
+        """
+        # GTID sets only hold uuids, numbers, ':', '-', ',' and line breaks
+        gtid_set = "".join(char for char in gtid_set if char.isalnum() or char in ":-,")
+        result = await self.execute_query(f"SELECT WAIT_FOR_EXECUTED_GTID_SET('{gtid_set}', {timeout})")
+        return int(result.result_rows[0][0]) == 0
+
+    async def query_many(self, statements: List[str]) -> List[DBResult]:
+        """
+        Send several statements in one multi-statement packet, one network round trip, and return a result each.
+
+        The server stops at the first failing statement: its result carries the error and the following ones are
+        reported as not executed. Each statement must be a single statement, without its own separators.
+        """
+        results: List[DBResult] = []
+        self.start_job()
+        try:
+            async with self._connection.cursor() as cursor:
+                try:
+                    await cursor.execute(";\n".join(statement.rstrip().rstrip(";") for statement in statements))
+                    while True:
+                        results.append(self.handle_result(await self._read_result(cursor)))
+                        if not await cursor.nextset():
+                            break
+                except Exception as e:
+                    results.append(self.handle_exception(e))
+        finally:
+            self.end_job()
+
+        failed = len(results) - 1
+        for _ in range(len(results), len(statements)):
+            results.append(DBResult(is_success=False, message=f"Not executed, statement {failed} failed"))
+
+        return results
+
     async def execute_query(self, query: str) -> QueryResult:
         """Execute the raw query and return a QueryResult."""
         async with self._connection.cursor() as cursor:
             await cursor.execute(query)
+            return await self._read_result(cursor)
+
+    @staticmethod
+    async def _read_result(cursor: aiomysql.Cursor) -> QueryResult:
+        """Read the current result set of the cursor."""
+        if cursor.description is None:
+            # Non-SELECT queries (e.g., INSERT, UPDATE, DELETE)
+            result_fields = None
+            result_rows = None
+        else:
+            # SELECT queries
+            result_fields = [desc[0] for desc in cursor.description]
+            result_rows = await cursor.fetchall()
+
+        insert_id = cursor.lastrowid
+        affected_rows = cursor.rowcount
+        warning_count = cursor._result.warning_count if cursor._result is not None else None
+
+        return QueryResult(
+            insert_id=insert_id,
+            affected_rows=affected_rows,
+            result_fields=result_fields,
+            result_rows=result_rows,
+            warning_count=warning_count,
+        )
 
-            if cursor.description is None:
-                # Non-SELECT queries (e.g., INSERT, UPDATE, DELETE)
-                result_fields = None
-                result_rows = None
-            else:
-                # SELECT queries
-                result_fields = [desc[0] for desc in cursor.description]
-                result_rows = await cursor.fetchall()
-
-            insert_id = cursor.lastrowid
-            affected_rows = cursor.rowcount
-
-            return QueryResult(
-                insert_id=insert_id,
-                affected_rows=affected_rows,
-                result_fields=result_fields,
-                result_rows=result_rows,
-            )
-
-    def handle_result(self, result: QueryResult) -> DBResult:
-        """Process the QueryResult into a DBResult."""
+    def handle_result(self, result: QueryResult, auto_increment_increment: Optional[int] = None) -> DBResult:
+        """Process the QueryResult into a DBResult, deriving every insert id if the increment is given."""
         if result.result_rows is not None:
             def map_to_dict(row):
                 return {result.result_fields[i]: value for i, value in enumerate(row)}
@@ -61,19 +142,35 @@ class DBWorker:
                 count=len(result.result_rows)
             )
 
+        insert_ids = None
+        if auto_increment_increment is not None and result.insert_id:
+            insert_ids = [
+                result.insert_id + i * auto_increment_increment for i in range(result.affected_rows or 0)
+            ]
+
         return DBResult(
             is_success=True,
             affected_rows=result.affected_rows,
-            insert_id=result.insert_id if result.insert_id is not None else None
+            insert_id=result.insert_id if result.insert_id is not None else None,
+            warning_count=result.warning_count,
+            insert_ids=insert_ids
         )
 
     def handle_exception(self, exception: Exception) -> DBResult:
-        """Handle any exceptions that occur during query execution."""
+        """Handle any exceptions that occur during query execution, keeping the MySQL error number if any."""
         return DBResult(
             is_success=False,
-            message=str(exception)
+            message=str(exception),
+            error_code=DBWorker.error_code(exception)
         )
 
+    @staticmethod
+    def error_code(exception: BaseException) -> Optional[int]:
+        """MySQL error number of a PyMySQL error, raised by the server or the client (e.g. 2003 can't connect)."""
+        if isinstance(exception, pymysql.err.MySQLError) and exception.args and isinstance(exception.args[0], int):
+            return exception.args[0]
+        return None
+
     def start_job(self) -> None:
         """Increment the job counter."""
         self._jobs += 1
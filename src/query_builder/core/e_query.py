@@ -1,22 +1,40 @@
+from typing import Optional
+
 from .db_result import DBResult
+from ..enums.statement_kind import StatementKind
 from ..exceptions.db_factory_exception import DBFactoryException
 
 
 class EQuery:
-    def __init__(self, query: str, factory):
+    def __init__(self, query: str, factory, return_insert_ids: bool = False,
+                 kind: Optional[StatementKind] = None):
         self.query = query
         self.factory = factory
+        self.return_insert_ids = return_insert_ids
+        self.kind = kind  # Set by the builder, so the factory doesn't have to classify the text
+
+    async def commit(self, priority=None, timeout: Optional[float] = None) -> DBResult:
+        """
+        Run the query on the factory.
 
-    async def commit(self) -> DBResult:
+        :param priority: Admission priority ('interactive', 'normal' or 'batch'), see DBFactory.query.
+        :param timeout: Seconds after which the query is killed on the server, see DBFactory.query.
+        """
         try:
-            result = await self.factory.query(self.query)
+            result = await self.factory.query(self.query, return_insert_ids=self.return_insert_ids,
+                                            route=self.kind, priority=priority, timeout=timeout)
             return result
         except DBFactoryException as e:
             return DBResult(
                 is_success=False,
-                message=str(e)
+                message=str(e),
+                error_code=getattr(e, 'error_code', None)
             )
 
+    def get_query_as_string(self) -> str:
+        """Return the query as a string."""
+        return self.query
+
     async def get_query(self) -> DBResult:
         return DBResult(
             is_success=True,
@@ -0,0 +1,66 @@
+import asyncio
+import uuid
+from typing import AsyncIterator, Dict
+
+from aiomysql import connection as aiomysql_connection
+from pymysql.connections import MAX_PACKET_LEN
+
+
+class StreamLoadLocalFile(aiomysql_connection.LoadLocalFile):
+    """LoadLocalFile that sends a registered in-memory stream instead of reading a file from disk."""
+
+    async def send_data(self):
+        """Send the registered stream to the server, falling back to the file behaviour."""
+        filename = self.filename.decode() if isinstance(self.filename, bytes) else self.filename
+        stream = LocalInfile.get(filename)
+        if stream is None:
+            return await super().send_data()
+
+        self.connection._ensure_alive()
+        conn = self.connection
+
+        try:
+            async for chunk in stream:
+                for offset in range(0, len(chunk), MAX_PACKET_LEN - 1):
+                    conn.write_packet(chunk[offset:offset + MAX_PACKET_LEN - 1])
+                # Wait for the socket buffer to drain so the producer is paced by the network
+                await conn._writer.drain()
+        except asyncio.CancelledError:
+            conn._close_on_cancel()
+            raise
+        finally:
+            # send the empty packet to signify we are done sending data
+            conn.write_packet(b"")
+
+
+class LocalInfile:
+    """Registry of in-memory sources for LOAD DATA LOCAL INFILE, keyed by a generated file name."""
+
+    _streams: Dict[str, AsyncIterator[bytes]] = {}
+    _installed: bool = False
+
+    @classmethod
+    def register(cls, stream: AsyncIterator[bytes]) -> str:
+        """Register a stream of encoded chunks and return the file name to use in the statement."""
+        cls.install()
+
+        name = f"query-builder-stream-{uuid.uuid4().hex}"
+        cls._streams[name] = stream
+        return name
+
+    @classmethod
+    def unregister(cls, name: str) -> None:
+        cls._streams.pop(name, None)
+
+    @classmethod
+    def get(cls, name: str):
+        return cls._streams.get(name)
+
+    @classmethod
+    def install(cls) -> None:
+        """Make aiomysql use StreamLoadLocalFile; aiomysql has no public hook for custom infile sources."""
+        if cls._installed:
+            return
+
+        aiomysql_connection.LoadLocalFile = StreamLoadLocalFile
+        cls._installed = True
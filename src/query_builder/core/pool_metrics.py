@@ -0,0 +1,104 @@
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import aiomysql
+
+
+class PoolMetrics:
+    """
+    Measure how long callers wait for a pool connection and how long they hold it.
+
+    Percentiles are computed over the last `sample_size` acquisitions, when a snapshot is taken.
+    """
+
+    def __init__(self, sample_size: int = 1024):
+        self.acquisitions = 0
+        self.acquire_failures = 0
+        self.waiting = 0  # Callers currently waiting for a connection
+
+        self._acquire_waits: Deque[float] = deque(maxlen=sample_size)
+        self._hold_times: Deque[float] = deque(maxlen=sample_size)
+        self._acquired_at: Dict[int, float] = {}
+
+        # Acquire waits since the last drain_window(), for controllers sampling at their own pace
+        self._window_count = 0
+        self._window_wait = 0.0
+
+    async def acquire(self, pool: aiomysql.Pool) -> aiomysql.Connection:
+        """Acquire a connection from the pool, recording the wait."""
+        self.waiting += 1
+        started_at = time.monotonic()
+        try:
+            connection = await pool.acquire()
+        except Exception:
+            self.acquire_failures += 1
+            raise
+        finally:
+            self.waiting -= 1
+
+        acquired_at = time.monotonic()
+        self._acquire_waits.append(acquired_at - started_at)
+        self._window_count += 1
+        self._window_wait += acquired_at - started_at
+        self._acquired_at[id(connection)] = acquired_at
+        self.acquisitions += 1
+        return connection
+
+    def release(self, pool: aiomysql.Pool, connection: aiomysql.Connection) -> None:
+        """Release a connection acquired through acquire, recording how long it was held."""
+        acquired_at = self._acquired_at.pop(id(connection), None)
+        if acquired_at is not None:
+            self._hold_times.append(time.monotonic() - acquired_at)
+
+        pool.release(connection)
+
+    def drain_window(self) -> Tuple[int, float]:
+        """Return the acquisition count and average acquire wait since the previous call."""
+        count, wait = self._window_count, self._window_wait
+        self._window_count = 0
+        self._window_wait = 0.0
+        return count, (wait / count if count else 0.0)
+
+    def snapshot(self, pool: Optional[aiomysql.Pool] = None) -> Dict[str, Any]:
+        """Counters, pool occupancy and acquire wait / hold time percentiles (in seconds)."""
+        stats = PoolMetrics.pool_snapshot(pool)
+        stats.update({
+            'acquisitions': self.acquisitions,
+            'acquire_failures': self.acquire_failures,
+            'waiting': self.waiting,
+            'acquire_wait': self._distribution(self._acquire_waits),
+            'hold_time': self._distribution(self._hold_times),
+        })
+        return stats
+
+    @staticmethod
+    def pool_snapshot(pool: Optional[aiomysql.Pool]) -> Dict[str, Any]:
+        """Occupancy of a pool, available without metrics."""
+        if pool is None:
+            return {'size': 0, 'free': 0, 'in_use': 0, 'maxsize': 0, 'utilization': 0.0}
+
+        in_use = pool.size - pool.freesize
+        return {
+            'size': pool.size,
+            'free': pool.freesize,
+            'in_use': in_use,
+            'maxsize': pool.maxsize,
+            'utilization': in_use / pool.maxsize if pool.maxsize else 0.0,
+        }
+
+    @staticmethod
+    def _distribution(samples: Deque[float]) -> Dict[str, Optional[float]]:
+        if not samples:
+            return {'count': 0, 'avg': None, 'p50': None, 'p90': None, 'p99': None, 'max': None}
+
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return {
+            'count': len(ordered),
+            'avg': sum(ordered) / len(ordered),
+            'p50': ordered[round(last * 0.50)],
+            'p90': ordered[round(last * 0.90)],
+            'p99': ordered[round(last * 0.99)],
+            'max': ordered[last],
+        }
@@ -0,0 +1,140 @@
+import asyncio
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+import aiomysql
+
+from .admission_controller import AdmissionController
+from .pool_metrics import PoolMetrics
+from ..exceptions.db_factory_exception import DBFactoryException
+
+
+class AdaptivePoolSizer:
+    """
+    Grow a pool while callers wait too long for a connection, and shrink it after a calm cool-down.
+
+    Two thresholds give the hysteresis: the pool grows when the average acquire wait of the last interval is above
+    `target_wait` (or callers are queued), and may only shrink once the wait stayed below
+    `target_wait * shrink_ratio` for `cooldown` seconds. Between the thresholds the size is kept.
+
+    With priority lanes, callers queue in the admission controller instead of the pool, so its waits and queue
+    count as well.
+
+    Every decision is kept in `decisions` and passed to `on_resize`, which the factory sets to its debug logs.
+
+    Resizing swaps aiomysql's private idle deque (`_free`) and notifies its condition (`_cond`), checked when the
+    sizer is created so a release of aiomysql that changes them fails loudly instead of leaving the size unchanged.
+    """
+
+    def __init__(self, name: str, pool: aiomysql.Pool, metrics: PoolMetrics, min_size: int, max_size: int,
+                 target_wait: float = 0.05, shrink_ratio: float = 0.25, cooldown: float = 60.0,
+                 grow_step: int = 2, interval: float = 5.0, on_resize: Optional[Callable[[Dict], None]] = None,
+                 admission: Optional[AdmissionController] = None):
+        if not 0 < min_size <= max_size:
+            raise DBFactoryException("Pool sizes must satisfy 0 < min_size <= max_size")
+        if not isinstance(getattr(pool, '_free', None), deque) or not hasattr(pool, '_cond'):
+            raise DBFactoryException(
+                f"aiomysql {aiomysql.__version__} pools no longer expose the _free deque and _cond condition "
+                "the adaptive pool sizer resizes"
+            )
+
+        self.name = name
+        self._pool = pool
+        self._metrics = metrics
+        self._min_size = min_size
+        self._max_size = max_size
+        self._target_wait = target_wait
+        self._shrink_wait = target_wait * shrink_ratio
+        self._cooldown = cooldown
+        self._grow_step = grow_step
+        self._interval = interval
+        self._on_resize = on_resize
+        self._admission = admission
+        self._admission_seen: Tuple[int, float] = (0, 0.0)  # (admitted, total_wait) at the previous tick
+
+        self._calm_since: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self.decisions: Deque[Dict] = deque(maxlen=100)  # Latest sizing decisions, newest last
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.tick()
+
+    async def tick(self) -> None:
+        """Take one sizing decision from the waits observed since the previous tick."""
+        count, average_wait = self._metrics.drain_window()
+        waiting = self._metrics.waiting
+        if self._admission is not None:
+            average_wait = max(average_wait, self._admission_wait())
+            waiting += self._admission.waiting
+        now = time.monotonic()
+        size = self._pool.maxsize
+
+        if average_wait > self._target_wait or waiting > 0:
+            self._calm_since = None
+            if size < self._max_size:
+                await self._resize(min(size + self._grow_step, self._max_size), average_wait, "grow")
+            return
+
+        if average_wait > self._shrink_wait:
+            # Inside the hysteresis band: keep the size and restart the cool-down
+            self._calm_since = None
+            return
+
+        if self._calm_since is None:
+            self._calm_since = now
+            return
+
+        if now - self._calm_since >= self._cooldown and size > self._min_size:
+            self._calm_since = now  # Every further shrink waits for another cool-down
+            await self._resize(size - 1, average_wait, "shrink")
+
+    def _admission_wait(self) -> float:
+        """Average wait for an admission slot since the previous tick."""
+        admitted, total_wait = self._admission.admitted, self._admission.total_wait
+        seen_admitted, seen_wait = self._admission_seen
+        self._admission_seen = (admitted, total_wait)
+        return (total_wait - seen_wait) / (admitted - seen_admitted) if admitted > seen_admitted else 0.0
+
+    async def _resize(self, new_size: int, average_wait: float, action: str) -> None:
+        pool = self._pool
+        old_size = pool.maxsize
+
+        # aiomysql keeps idle connections in a deque bounded by maxsize, so resizing means replacing it
+        while pool.freesize and pool.size > new_size:
+            pool._free.popleft().close()
+        # Never below the connections in use: the deque would silently drop them when they are released
+        new_size = max(new_size, pool.size)
+        if new_size == old_size:
+            return
+
+        pool._free = deque(pool._free, maxlen=new_size)
+        if new_size > old_size:
+            # Waiting callers retry and can now open connections
+            async with pool._cond:
+                pool._cond.notify_all()
+            if self._admission is not None:
+                self._admission.capacity_changed()
+
+        decision = {'pool': self.name, 'action': action, 'from': old_size, 'to': new_size,
+                    'average_wait': average_wait, 'at': time.time()}
+        self.decisions.append(decision)
+        if self._on_resize is not None:
+            self._on_resize(decision)
@@ -1,8 +1,10 @@
 from typing import List, Union
 
+from ..clauses.bulk_update import BulkUpdate
 from ..clauses.delete import Delete
 from ..clauses.insert import Insert
 from ..clauses.insert_update import InsertUpdate
+from ..clauses.load_data import LoadData
 from ..clauses.mulit_insert_update import MultiInsertUpdate
 from ..clauses.select import Select
 from ..clauses.update import Update
@@ -27,6 +29,10 @@ class QueryBuilder:
         """Create a new UPDATE query."""
         return Update(self._factory)
 
+    def bulk_update(self) -> BulkUpdate:
+        """Create a new bulk UPDATE setting different values per row with CASE expressions."""
+        return BulkUpdate(self._factory)
+
     def insert_update(self) -> InsertUpdate:
         """Create a new INSERT ... ON DUPLICATE KEY UPDATE query."""
         return InsertUpdate(self._factory)
@@ -38,3 +44,7 @@ class QueryBuilder:
     def delete(self) -> Delete:
         """Create a new DELETE query."""
         return Delete(self._factory)
+
+    def load_data(self) -> LoadData:
+        """Create a new LOAD DATA LOCAL INFILE bulk loader."""
+        return LoadData(self._factory)
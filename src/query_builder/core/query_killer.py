@@ -0,0 +1,63 @@
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+import aiomysql
+
+
+class QueryKiller:
+    """
+    Stop statements on the server with KILL QUERY, sent over one control connection per server.
+
+    The control connections are opened on first use and kept, so a timeout doesn't wait for a new handshake.
+    """
+
+    def __init__(self, **connect_kwargs: Any):
+        self._connect_kwargs = connect_kwargs
+        self._connections: Dict[Tuple[str, int], aiomysql.Connection] = {}
+        self._lock = asyncio.Lock()
+
+        self.kills = 0
+        self.kill_failures = 0  # Statements possibly still running on the server
+        self.last_failure: Optional[Dict[str, Any]] = None  # {'host', 'port', 'thread_id', 'error'}
+
+    async def kill_query(self, host: str, port: int, thread_id: int) -> None:
+        """
+        Abort the statement running on the connection with this thread id, leaving the connection open.
+
+        :raises Exception: If the control connection can't be opened or the KILL fails.
+        """
+        async with self._lock:
+            try:
+                await self._kill(host, port, thread_id)
+            except Exception as e:
+                self._record_failure(host, port, thread_id, e)
+                raise
+
+            self.kills += 1
+
+    async def _kill(self, host: str, port: int, thread_id: int) -> None:
+        connection = self._connections.get((host, port))
+        if connection is None or connection.closed:
+            connection = await aiomysql.connect(host=host, port=port, autocommit=True, **self._connect_kwargs)
+            self._connections[(host, port)] = connection
+
+        try:
+            async with connection.cursor() as cursor:
+                await cursor.execute(f"KILL QUERY {int(thread_id)}")
+        except Exception:
+            connection.close()
+            del self._connections[(host, port)]
+            raise
+
+    def _record_failure(self, host: str, port: int, thread_id: int, error: Exception) -> None:
+        self.kill_failures += 1
+        self.last_failure = {'host': host, 'port': port, 'thread_id': thread_id, 'error': str(error)}
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {'kills': self.kills, 'kill_failures': self.kill_failures, 'last_failure': self.last_failure}
+
+    async def close(self) -> None:
+        async with self._lock:
+            for connection in self._connections.values():
+                await connection.ensure_closed()
+            self._connections.clear()
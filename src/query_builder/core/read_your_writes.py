@@ -0,0 +1,33 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Mapping, Optional
+
+
+class ReadYourWritesSession:
+    """
+    Tracks the last write of one caller, so its reads can avoid replicas that haven't applied it yet.
+
+    The session object is shared by the tasks spawned from the context that created it, so writes made in
+    child tasks are seen by their parent.
+    """
+
+    def __init__(self, window: float, wait_for_gtid: bool = False):
+        self.window = window
+        self.wait_for_gtid = wait_for_gtid
+        self.last_write_at: Optional[float] = None
+        self.gtid_executed: Optional[str] = None  # GTID set of the primary right after the last write
+
+    def record_write(self, gtid_executed: Optional[str] = None) -> None:
+        self.last_write_at = time.monotonic()
+        self.gtid_executed = gtid_executed
+
+    def is_sticky(self) -> bool:
+        """Whether reads still have to see the last write."""
+        return self.last_write_at is not None and time.monotonic() - self.last_write_at < self.window
+
+
+# Sessions of the current context by factory, so a write through one factory (e.g. one shard) doesn't make the
+# reads of another one wait. The mapping is replaced, never mutated, as contexts copied from this one share it.
+read_your_writes_sessions: ContextVar[Optional[Mapping[Any, ReadYourWritesSession]]] = ContextVar(
+    'read_your_writes_sessions', default=None
+)
@@ -0,0 +1,169 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+import aiomysql
+
+from .pool_metrics import PoolMetrics
+from ..exceptions.db_factory_exception import DBFactoryException
+
+
+class Replica:
+    """A read replica endpoint with its own connection pool."""
+
+    def __init__(self, host: str, port: int, weight: int = 1):
+        if weight < 1:
+            raise DBFactoryException("Replica weight must be positive")
+
+        self.host = host
+        self.port = port
+        self.weight = weight
+        self.pool: Optional[aiomysql.Pool] = None
+        self.metrics: Optional[PoolMetrics] = None
+
+        self.outstanding = 0  # Queries currently running on this replica
+        self.is_healthy = True
+        self.failures = 0  # Consecutive failed checks or acquisitions
+        self.current_weight = 0  # Smooth weighted round-robin state
+
+    def __repr__(self):
+        return f"Replica(host={self.host}, port={self.port}, weight={self.weight}, " \
+               f"outstanding={self.outstanding}, is_healthy={self.is_healthy})"
+
+
+class ReplicaSet:
+    """
+    Route reads across several replicas, ejecting the ones that fail and bringing them back once
+    the health check succeeds again.
+    """
+
+    LEAST_OUTSTANDING = 'least_outstanding'
+    WEIGHTED = 'weighted'
+
+    def __init__(self, replicas: List[Replica], strategy: str = LEAST_OUTSTANDING, failure_threshold: int = 2,
+                 health_check_query: str = "SELECT 1", health_check_timeout: float = 2.0):
+        if not replicas:
+            raise DBFactoryException("At least one replica is required")
+
+        if strategy not in (self.LEAST_OUTSTANDING, self.WEIGHTED):
+            raise DBFactoryException(f"Unknown read strategy: {strategy}")
+
+        self.replicas = replicas
+        self._strategy = strategy
+        self._failure_threshold = failure_threshold
+        self._health_check_query = health_check_query
+        self._health_check_timeout = health_check_timeout
+        self._health_check_task: Optional[asyncio.Task] = None
+
+    def has_healthy_replica(self) -> bool:
+        return any(replica.is_healthy and replica.pool for replica in self.replicas)
+
+    def choose(self) -> Replica:
+        """
+        Pick the replica for the next read.
+
+        :raises DBFactoryException: If no replica is healthy.
+        """
+        replicas = [replica for replica in self.replicas if replica.is_healthy and replica.pool]
+        if not replicas:
+            raise DBFactoryException("No healthy read replica")
+
+        if self._strategy == self.LEAST_OUTSTANDING:
+            # Ties go to the heavier replica, so idle sets still follow the weights
+            return min(replicas, key=lambda replica: (replica.outstanding / replica.weight, -replica.weight))
+
+        # Smooth weighted round-robin: interleaves picks instead of sending bursts to the heaviest replica
+        total = 0
+        best = None
+        for replica in replicas:
+            replica.current_weight += replica.weight
+            total += replica.weight
+            if best is None or replica.current_weight > best.current_weight:
+                best = replica
+
+        best.current_weight -= total
+        return best
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiomysql.Connection]:
+        """Acquire a connection from the chosen replica, counting it as outstanding until released."""
+        replica = self.choose()
+        replica.outstanding += 1
+        try:
+            try:
+                if replica.metrics is not None:
+                    connection = await replica.metrics.acquire(replica.pool)
+                else:
+                    connection = await replica.pool.acquire()
+            except Exception:
+                self.mark_failure(replica)
+                raise
+
+            self.mark_success(replica)
+            try:
+                yield connection
+            finally:
+                if replica.metrics is not None:
+                    replica.metrics.release(replica.pool, connection)
+                else:
+                    replica.pool.release(connection)
+        finally:
+            replica.outstanding -= 1
+
+    def mark_failure(self, replica: Replica) -> None:
+        replica.failures += 1
+        if replica.failures >= self._failure_threshold:
+            replica.is_healthy = False
+
+    def mark_success(self, replica: Replica) -> None:
+        replica.failures = 0
+        replica.is_healthy = True
+
+    async def check_health(self) -> None:
+        """Run the health check query on every replica, ejected ones included."""
+        await asyncio.gather(*(self._check_replica(replica) for replica in self.replicas if replica.pool))
+
+    async def _check_replica(self, replica: Replica) -> None:
+        try:
+            await asyncio.wait_for(self._ping(replica), self._health_check_timeout)
+        except Exception:
+            self.mark_failure(replica)
+        else:
+            self.mark_success(replica)
+
+    async def _ping(self, replica: Replica) -> None:
+        async with replica.pool.acquire() as connection:
+            async with connection.cursor() as cursor:
+                await cursor.execute(self._health_check_query)
+
+    def start_health_checks(self, interval: float) -> None:
+        """Check the replicas every `interval` seconds in a background task."""
+        if self._health_check_task is not None or interval <= 0:
+            return
+
+        async def run() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                await self.check_health()
+
+        self._health_check_task = asyncio.ensure_future(run())
+
+    async def stop_health_checks(self) -> None:
+        if self._health_check_task is None:
+            return
+
+        self._health_check_task.cancel()
+        try:
+            await self._health_check_task
+        except asyncio.CancelledError:
+            pass
+        self._health_check_task = None
+
+    async def close(self) -> None:
+        """Stop the health checks and close every replica pool."""
+        await self.stop_health_checks()
+        for replica in self.replicas:
+            if replica.pool:
+                replica.pool.close()
+                await replica.pool.wait_closed()
+                replica.pool = None
@@ -0,0 +1,56 @@
+import random
+from typing import Iterable, Optional
+
+from .db_result import DBResult
+from ..enums.error_code import CONNECTION_ERRORS, ErrorCode
+from ..exceptions.db_factory_exception import DBFactoryException
+
+
+class RetryPolicy:
+    """
+    Decide whether a failed autocommit statement is run again, and how long to back off before.
+
+    Deadlocks and lock wait timeouts roll the statement back, so every statement may be retried on them. A lost
+    connection leaves a write in an unknown state, so only reads are retried on connection errors.
+    Delays grow exponentially from `base_delay` up to `max_delay`, with full jitter so that callers failing
+    together don't retry together.
+    """
+
+    DEFAULT_WRITE_CODES = frozenset((ErrorCode.DEADLOCK, ErrorCode.LOCK_WAIT_TIMEOUT))
+    DEFAULT_READ_CODES = DEFAULT_WRITE_CODES | CONNECTION_ERRORS
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.05, max_delay: float = 2.0, jitter: bool = True,
+                 read_codes: Optional[Iterable[int]] = None, write_codes: Optional[Iterable[int]] = None):
+        """
+        :param max_attempts: Runs of a statement, including the first one.
+        :param base_delay: Seconds before the first retry, doubled for every further one.
+        :param max_delay: Upper bound of a single delay.
+        :param jitter: Draw each delay uniformly between 0 and its exponential value.
+        :param read_codes: Error codes on which reads are retried (deadlocks, lock wait timeouts, connection errors).
+        :param write_codes: Error codes on which writes are retried (deadlocks and lock wait timeouts).
+        """
+        if max_attempts < 1:
+            raise DBFactoryException("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.read_codes = frozenset(read_codes) if read_codes is not None else RetryPolicy.DEFAULT_READ_CODES
+        self.write_codes = frozenset(write_codes) if write_codes is not None else RetryPolicy.DEFAULT_WRITE_CODES
+
+    def should_retry(self, result: DBResult, attempt: int, is_write: bool) -> bool:
+        """
+        :param result: Result of the attempt.
+        :param attempt: Number of the attempt that produced it, starting at 1.
+        :param is_write: Whether the statement ran as a write.
+        """
+        if result.is_success or result.error_code is None or attempt >= self.max_attempts:
+            return False
+
+        return result.error_code in (self.write_codes if is_write else self.read_codes)
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait after the given failed attempt (starting at 1)."""
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
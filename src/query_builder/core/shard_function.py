@@ -0,0 +1,68 @@
+import bisect
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..exceptions.db_factory_exception import DBFactoryException
+
+
+class HashShardFunction:
+    """
+    Spread shard keys evenly with a stable hash (CRC32 of the key's text), so every process agrees on the shard.
+
+    Adding a shard moves most keys, use RangeShardFunction or LookupShardFunction when shards are added over time.
+    """
+
+    def __init__(self, shard_names: Sequence[str]):
+        if not shard_names:
+            raise DBFactoryException("At least one shard is required")
+
+        self._shard_names = list(shard_names)
+
+    def __call__(self, key: Any) -> str:
+        return self._shard_names[zlib.crc32(str(key).encode('utf-8')) % len(self._shard_names)]
+
+
+class RangeShardFunction:
+    """Assign contiguous key ranges to shards, e.g. [(1_000_000, 'shard_1'), (None, 'shard_2')]."""
+
+    def __init__(self, ranges: Sequence[Tuple[Optional[Any], str]]):
+        """
+        :param ranges: (exclusive upper bound, shard name) pairs in ascending order, the last bound may be None
+                       for an unbounded range.
+        """
+        if not ranges:
+            raise DBFactoryException("At least one range is required")
+
+        self._unbounded: Optional[str] = None
+        if ranges[-1][0] is None:
+            self._unbounded = ranges[-1][1]
+            ranges = ranges[:-1]
+
+        self._bounds: List[Any] = [bound for bound, _ in ranges]
+        self._shard_names: List[str] = [name for _, name in ranges]
+        if self._bounds != sorted(self._bounds):
+            raise DBFactoryException("Range bounds must be in ascending order")
+
+    def __call__(self, key: Any) -> str:
+        index = bisect.bisect_right(self._bounds, key)
+        if index < len(self._shard_names):
+            return self._shard_names[index]
+        if self._unbounded is not None:
+            return self._unbounded
+
+        raise DBFactoryException(f"No shard range covers the key {key!r}")
+
+
+class LookupShardFunction:
+    """Look the shard up in a directory of key to shard name, e.g. loaded from a tenant table."""
+
+    def __init__(self, directory: Dict[Any, str], default: Optional[str] = None):
+        self._directory = directory
+        self._default = default
+
+    def __call__(self, key: Any) -> str:
+        shard_name = self._directory.get(key, self._default)
+        if shard_name is None:
+            raise DBFactoryException(f"No shard registered for the key {key!r}")
+
+        return shard_name
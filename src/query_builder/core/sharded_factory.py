@@ -0,0 +1,155 @@
+import asyncio
+import re
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .db_factory import DBFactory
+from .db_result import DBResult
+from .query_builder import QueryBuilder
+from .statement_classifier import StatementClassifier
+from ..enums.priority import Priority
+from ..enums.statement_kind import StatementKind
+from ..exceptions.db_factory_exception import DBFactoryException
+
+
+class ShardedFactory:
+    """
+    Route queries over several DBFactory instances, one per shard.
+
+    Builders from get_query_builder run on the shard owning the value given to shard_key(). Without a shard key,
+    reads, UPDATE and DELETE are scattered to every shard concurrently and their results merged: rows are
+    concatenated in shard order, counts and affected rows summed. Concatenating can't honour ORDER BY, LIMIT,
+    DISTINCT, grouping or aggregates, so such statements are refused without a shard key.
+    """
+
+    # Writes that can run on every shard without duplicating rows
+    _SCATTER_WRITE_KEYWORDS = frozenset(("UPDATE", "DELETE"))
+    # String literals, quoted identifiers and comments, blanked before looking for the clauses below
+    _QUOTED = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"|`[^`]*`|/\*.*?\*/|(?:--\s|#)[^\n]*", re.S)
+    # Clauses whose result would be wrong once the rows of every shard are concatenated
+    _UNMERGEABLE = re.compile(
+        r"\b(?:ORDER\s+BY|GROUP\s+BY|LIMIT|HAVING|DISTINCT|OVER)\b"
+        r"|\b(?:COUNT|SUM|AVG|MIN|MAX|GROUP_CONCAT|JSON_ARRAYAGG|JSON_OBJECTAGG|BIT_AND|BIT_OR|BIT_XOR"
+        r"|STD|STDDEV|STDDEV_POP|STDDEV_SAMP|VARIANCE|VAR_POP|VAR_SAMP)\s*\(",
+        re.I
+    )
+
+    def __init__(self, shards: Dict[str, DBFactory], shard_function: Callable[[Any], str]):
+        """
+        :param shards: The factory of every shard, by shard name.
+        :param shard_function: Returns the shard name owning a shard-key value, see HashShardFunction,
+                               RangeShardFunction and LookupShardFunction.
+        """
+        if not shards:
+            raise DBFactoryException("At least one shard is required")
+
+        self._shards = shards
+        self._shard_function = shard_function
+
+    @property
+    def shards(self) -> Dict[str, DBFactory]:
+        return self._shards
+
+    async def create_connections(self) -> None:
+        """Create the pools of every shard concurrently, closing them all if one fails."""
+        results = await asyncio.gather(
+            *(factory.create_connections() for factory in self._shards.values()),
+            return_exceptions=True
+        )
+        failures = [result for result in results if isinstance(result, BaseException)]
+        if failures:
+            await self.close_connections()
+            raise DBFactoryException(f"Failed to create the shard pools: {failures[0]}")
+
+    async def close_connections(self) -> None:
+        await asyncio.gather(*(factory.close_connections() for factory in self._shards.values()),
+                             return_exceptions=True)
+
+    def get_shard(self, key: Any) -> DBFactory:
+        """
+        Return the factory of the shard owning a shard-key value.
+
+        :raises DBFactoryException: If the shard function returns an unknown shard.
+        """
+        shard_name = self._shard_function(key)
+        factory = self._shards.get(shard_name)
+        if factory is None:
+            raise DBFactoryException(f"Unknown shard: {shard_name!r}")
+
+        return factory
+
+    def get_query_builder(self) -> QueryBuilder:
+        """Retrieve a query builder running on every shard, or on one with shard_key()."""
+        for factory in self._shards.values():
+            factory.get_query_builder()  # Raises if its pools aren't created
+
+        return QueryBuilder(self)
+
+    async def query(self, query: str, return_insert_ids: bool = False,
+                    route: Optional[Union[StatementKind, str]] = None,
+                    priority: Optional[Union[Priority, str]] = None,
+                    timeout: Optional[float] = None) -> DBResult:
+        """
+        Scatter a query without shard key to every shard concurrently and merge the results.
+
+        :raises DBFactoryException: If the query needs a shard key: a write other than UPDATE or DELETE, or a
+                                    statement with ORDER BY, LIMIT, GROUP BY, HAVING, DISTINCT, window functions
+                                    or aggregates, whose merged result would be wrong.
+        """
+        keyword = StatementClassifier.leading_keyword(query)
+        if (StatementClassifier.classify(query) == StatementKind.WRITE
+                and keyword not in ShardedFactory._SCATTER_WRITE_KEYWORDS):
+            raise DBFactoryException(f"{keyword or 'This statement'} needs a shard key on a sharded factory")
+
+        clause = ShardedFactory._UNMERGEABLE.search(ShardedFactory._QUOTED.sub(" ", query))
+        if clause is not None:
+            raise DBFactoryException(
+                f"{clause.group(0).rstrip('( ').upper()} can't be merged across shards, set a shard key"
+            )
+
+        names = list(self._shards)
+        results = await asyncio.gather(
+            *(
+                self._shards[name].query(query, return_insert_ids=return_insert_ids, route=route,
+                                         priority=priority, timeout=timeout)
+                for name in names
+            ),
+            return_exceptions=True
+        )
+
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, DBFactoryException):
+                raise result
+
+        return ShardedFactory.merge_results(dict(zip(names, results)))
+
+    @staticmethod
+    def merge_results(results: Dict[str, Union[DBResult, DBFactoryException]]) -> DBResult:
+        """Merge the results of a scattered query, failing if any shard failed."""
+        failures = [
+            (name, result) for name, result in results.items()
+            if isinstance(result, DBFactoryException) or not result.is_success
+        ]
+        if failures:
+            return DBResult(
+                is_success=False,
+                message="; ".join(f"{name}: {getattr(result, 'message', None) or result}" for name, result in failures),
+                error_code=next((result.error_code for _, result in failures if isinstance(result, DBResult)
+                                 and result.error_code is not None), None),
+                is_timeout=any(isinstance(result, DBResult) and result.is_timeout for _, result in failures)
+            )
+
+        successes: List[DBResult] = list(results.values())
+        rows = None
+        if any(result.rows is not None for result in successes):
+            rows = [row for result in successes for row in (result.rows or [])]
+
+        return DBResult(
+            is_success=True,
+            rows=rows,
+            count=sum(result.count or 0 for result in successes),
+            affected_rows=sum(result.affected_rows or 0 for result in successes),
+            warning_count=sum(result.warning_count or 0 for result in successes)
+        )
+
+    async def begin_transaction(self, priority: Optional[Union[Priority, str]] = None):
+        raise DBFactoryException("Transactions run on one shard, use get_shard(key).begin_transaction()")
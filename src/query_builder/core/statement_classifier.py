@@ -0,0 +1,82 @@
+from typing import Optional, Tuple
+
+from ..enums.statement_kind import StatementKind
+
+
+class StatementClassifier:
+    """Classify a statement as a read or a write from its leading keyword, without scanning the whole text."""
+
+    _READ_KEYWORDS = frozenset(("SELECT", "SHOW", "EXPLAIN", "DESCRIBE", "DESC", "TABLE", "VALUES", "HELP"))
+    # Statements a WITH clause can introduce, the first one at the top level decides the kind
+    _CTE_KEYWORDS = frozenset(("SELECT", "TABLE", "VALUES", "UPDATE", "DELETE", "INSERT", "REPLACE"))
+
+    @staticmethod
+    def classify(query: str) -> StatementKind:
+        """
+        Return READ for SELECT, SHOW, EXPLAIN, DESCRIBE, TABLE, VALUES and WITH ... SELECT, WRITE otherwise.
+
+        Leading whitespace, comments and opening parentheses are skipped. Locking reads (FOR UPDATE/SHARE) can't be
+        told apart without scanning the statement; builders pass their kind instead.
+        """
+        keyword = StatementClassifier.leading_keyword(query)
+        return StatementKind.READ if keyword in StatementClassifier._READ_KEYWORDS else StatementKind.WRITE
+
+    @staticmethod
+    def leading_keyword(query: str) -> Optional[str]:
+        """Return the upper-cased statement keyword, the one after the common table expressions for WITH."""
+        keyword, position = StatementClassifier._next_keyword(query, 0)
+        if keyword == "WITH":
+            keyword = StatementClassifier._cte_statement(query, position)
+
+        return keyword
+
+    @staticmethod
+    def _next_keyword(query: str, position: int, skip_parentheses: bool = True) -> Tuple[Optional[str], int]:
+        """Skip whitespace, comments and parentheses, then return the upper-cased word found and its end."""
+        length = len(query)
+        while position < length:
+            char = query[position]
+            if char.isspace() or skip_parentheses and char == "(":
+                position += 1
+            elif query.startswith("/*", position):
+                end = query.find("*/", position + 2)
+                position = length if end == -1 else end + 2
+            elif char == "#" or query.startswith("--", position) and query[position + 2:position + 3] in ("", " ", "\t", "\n", "\r"):
+                end = query.find("\n", position)
+                position = length if end == -1 else end + 1
+            else:
+                break
+
+        end = position
+        while end < length and (query[end].isalnum() or query[end] == "_"):
+            end += 1
+
+        return (query[position:end].upper() or None), end
+
+    @staticmethod
+    def _cte_statement(query: str, position: int) -> Optional[str]:
+        """Find the statement following the common table expressions, skipping their bodies and quoted text."""
+        length = len(query)
+        depth = 0
+        while position < length:
+            char = query[position]
+            if char in "'\"`":
+                end = position + 1
+                while end < length and query[end] != char:
+                    end += 2 if query[end] == "\\" else 1
+                position = end + 1
+            elif char == "(":
+                depth += 1
+                position += 1
+            elif char == ")":
+                depth -= 1
+                position += 1
+            elif depth == 0 and (char.isalpha() or char in "/#-"):
+                keyword, end = StatementClassifier._next_keyword(query, position, skip_parentheses=False)
+                if keyword in StatementClassifier._CTE_KEYWORDS:
+                    return keyword
+                position = max(end, position + 1)
+            else:
+                position += 1
+
+        return None
@@ -1,4 +1,4 @@
-from typing import Optional, List, Union
+from typing import Optional, List, Union, Callable
 from .db_result import DBResult
 from .query import Query
 from .e_query import EQuery
@@ -13,6 +13,7 @@ class Transaction:
         self._is_committed: bool = False
         self._is_rolled_back: bool = False
         self._error: Optional[str] = None
+        self._on_release: Optional[Callable[[], None]] = None
 
     async def begin(self) -> DBResult:
         """Start a new transaction."""
@@ -37,14 +38,23 @@ class Transaction:
                 message=f"Failed to start transaction: {str(e)}"
             )
 
-    async def commit(self) -> DBResult:
-        """Commit the current transaction."""
+    async def commit(self, batch_size: Optional[int] = None) -> DBResult:
+        """
+        Commit the current transaction.
+
+        :param batch_size: Send the queued queries as multi-statement packets of up to this many statements,
+                           the last one also carrying the COMMIT, instead of one round trip per query. The index of
+                           a failing query is reported in the result's failed_statement.
+        """
         if not self._is_active:
             return DBResult(
                 is_success=False,
                 message="No active transaction to commit"
             )
 
+        if batch_size:
+            return await self._commit_batched(batch_size)
+
         try:
             # Execute all queued queries
             for query in self._queries:
@@ -78,7 +88,44 @@ class Transaction:
                 self._is_committed = True
                 self._queries.clear()
                 self._error = None
+                self.release()
+
+            return result
+        except Exception as e:
+            self._error = str(e)
+            await self.rollback()
+            return DBResult(
+                is_success=False,
+                message=f"Commit failed: {str(e)}"
+            )
+
+    async def _commit_batched(self, batch_size: int) -> DBResult:
+        try:
+            statements = [
+                query.get_query() if isinstance(query, Query) else query.get_query_as_string()
+                for query in self._queries
+            ]
+            statements.append("COMMIT")
+
+            result = None
+            for start in range(0, len(statements), batch_size):
+                results = await self._worker.query_many(statements[start:start + batch_size])
+                failed = next((index for index, result in enumerate(results) if not result.is_success), None)
+                if failed is not None:
+                    await self.rollback()
+                    return DBResult(
+                        is_success=False,
+                        message=f"Statement {start + failed} failed: {results[failed].message}",
+                        error_code=results[failed].error_code,
+                        failed_statement=start + failed
+                    )
+                result = results[-1]
 
+            self._is_active = False
+            self._is_committed = True
+            self._queries.clear()
+            self._error = None
+            self.release()
             return result
         except Exception as e:
             self._error = str(e)
@@ -102,17 +149,50 @@ class Transaction:
                 self._is_active = False
                 self._is_rolled_back = True
                 self._queries.clear()
+                self.release()
             return result
         except Exception as e:
             self._error = str(e)
             self._is_active = False  # Force inactive state on error
             self._is_rolled_back = True
             self._queries.clear()
+            self.release()
             return DBResult(
                 is_success=False,
                 message=f"Rollback failed: {str(e)}"
             )
 
+    async def query(self, query: str, return_insert_ids: bool = False, route=None, priority=None,
+                    timeout=None) -> DBResult:
+        """
+        Execute a query immediately on the transaction's connection, whatever its route or priority.
+
+        The timeout is not applied: killing a statement inside a transaction is left to the caller's rollback.
+        """
+        if not self._is_active:
+            return DBResult(
+                is_success=False,
+                message="No active transaction to run the query"
+            )
+
+        return await self._worker.query(query, return_insert_ids)
+
+    def on_release(self, callback: Optional[Callable[[], None]]) -> None:
+        """Set the callback returning the transaction's resources, run once when it commits or rolls back."""
+        self._on_release = callback
+
+    def release(self) -> None:
+        """Run the release callback, if it hasn't run yet."""
+        callback, self._on_release = self._on_release, None
+        if callback is not None:
+            callback()
+
+    def get_query_builder(self):
+        """Retrieve a query builder whose compiled queries run inside this transaction."""
+        # Import here to avoid circular import
+        from .query_builder import QueryBuilder
+        return QueryBuilder(self)
+
     def add_query(self, query: Union[Query, EQuery]) -> None:
         """Add a query to the transaction queue."""
         if not self._is_active:
@@ -0,0 +1,19 @@
+from enum import IntEnum
+
+
+class ErrorCode(IntEnum):
+    """MySQL server and client error codes the factory reacts to, see DBResult.error_code."""
+    LOCK_WAIT_TIMEOUT = 1205
+    DEADLOCK = 1213
+    CONNECTION_ERROR = 2002
+    CONN_HOST_ERROR = 2003
+    SERVER_GONE = 2006
+    SERVER_LOST = 2013
+    SERVER_LOST_EXTENDED = 2055
+
+
+# The server couldn't be reached, or the connection was lost mid-statement
+CONNECTION_ERRORS = frozenset((
+    ErrorCode.CONNECTION_ERROR, ErrorCode.CONN_HOST_ERROR, ErrorCode.SERVER_GONE,
+    ErrorCode.SERVER_LOST, ErrorCode.SERVER_LOST_EXTENDED,
+))
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class IndexHintScope(Enum):
+    JOIN = "JOIN"
+    ORDER_BY = "ORDER BY"
+    GROUP_BY = "GROUP BY"
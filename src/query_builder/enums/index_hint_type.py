@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class IndexHintType(Enum):
+    USE = "USE"
+    FORCE = "FORCE"
+    IGNORE = "IGNORE"
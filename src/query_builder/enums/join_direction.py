@@ -6,3 +6,5 @@ class JoinDirection(Enum):
     LEFT = "LEFT"
     RIGHT = "RIGHT"
     FULL = "FULL"
+    CROSS = "CROSS"
+    STRAIGHT = "STRAIGHT"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class LockMode(Enum):
+    UPDATE = "UPDATE"
+    SHARE = "SHARE"
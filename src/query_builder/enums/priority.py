@@ -0,0 +1,8 @@
+from enum import IntEnum
+
+
+class Priority(IntEnum):
+    """Admission priority of a query, lower values are admitted first."""
+    INTERACTIVE = 0
+    NORMAL = 1
+    BATCH = 2
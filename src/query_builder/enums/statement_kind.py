@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class StatementKind(Enum):
+    READ = "read"
+    WRITE = "write"
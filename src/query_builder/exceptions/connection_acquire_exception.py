@@ -0,0 +1,11 @@
+from typing import Optional
+
+from .db_factory_exception import DBFactoryException
+
+
+class ConnectionAcquireException(DBFactoryException):
+    """Exception raised when a pool couldn't hand out a connection, before anything ran on the server."""
+
+    def __init__(self, message: str, error_code: Optional[int] = None):
+        super().__init__(message)
+        self.error_code = error_code  # MySQL error number of the failed connect, e.g. 2003
@@ -30,6 +30,24 @@ class Escape:
 
         return f"'{self._escape_string(str(value))}'"
 
+    def _infile_escape(self, value) -> str:
+        """Encode a value as a LOAD DATA field (tab separated, backslash escaped, \\N for NULL)."""
+        if value is None:
+            return '\\N'
+
+        if isinstance(value, bool):
+            return str(int(value))
+
+        if isinstance(value, (int, float)):
+            return str(value)
+
+        # The backslash must be escaped first, so the escapes added after it stay intact
+        value = str(value)
+        for char, replacement in (('\\', '\\\\'), ('\t', '\\t'), ('\n', '\\n'), ('\0', '\\0')):
+            value = value.replace(char, replacement)
+
+        return value
+
     def _escape_string(self, query: str) -> str:
         """Escape special characters in a string for SQL use."""
         replacement_map = {
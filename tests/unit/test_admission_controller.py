@@ -0,0 +1,48 @@
+import asyncio
+import pytest
+from src.query_builder.core.admission_controller import AdmissionController
+from src.query_builder.enums.priority import Priority
+from src.query_builder.exceptions.db_factory_exception import DBFactoryException
+
+
+class TestAdmissionController:
+    """Test suite for priority lanes in front of a pool."""
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self):
+        """Test a released slot goes to the highest priority waiter, FIFO within a priority."""
+        admission = AdmissionController(lambda: 1)
+        await admission.acquire(Priority.BATCH)
+        admitted = []
+
+        async def wait(priority, name):
+            await admission.acquire(priority)
+            admitted.append(name)
+            admission.release(priority)
+
+        tasks = [
+            asyncio.ensure_future(wait(Priority.BATCH, 'batch')),
+            asyncio.ensure_future(wait(Priority.NORMAL, 'normal')),
+            asyncio.ensure_future(wait(Priority.INTERACTIVE, 'interactive-1')),
+            asyncio.ensure_future(wait(Priority.INTERACTIVE, 'interactive-2')),
+        ]
+        await asyncio.sleep(0)
+        admission.release(Priority.BATCH)
+        await asyncio.gather(*tasks)
+
+        assert admitted == ['interactive-1', 'interactive-2', 'normal', 'batch']
+        assert admission.in_use == 0
+
+    @pytest.mark.asyncio
+    async def test_quota_and_timeout(self):
+        """Test a class over its quota waits without blocking others, and is rejected after the timeout."""
+        admission = AdmissionController(lambda: 3, quotas={Priority.BATCH: 1}, acquire_timeout=0.01)
+        await admission.acquire(Priority.BATCH)
+
+        with pytest.raises(DBFactoryException):
+            await admission.acquire(Priority.BATCH)
+
+        await admission.acquire(AdmissionController.priority('interactive'))
+        assert admission.in_use == 2
+        assert admission.rejected == 1
+        assert admission.waiting == 0
@@ -0,0 +1,64 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.query_builder.clauses.delete import Delete
+from src.query_builder.clauses.update import Update
+from src.query_builder.core.db_result import DBResult
+from src.query_builder.exceptions.query_builder_exception import QueryBuilderException
+
+
+class TestBatch:
+    """Test suite for ordered/limited writes and the batched runner."""
+
+    @staticmethod
+    def _factory(*affected_rows):
+        factory = MagicMock()
+        factory.query = AsyncMock(side_effect=[
+            DBResult(is_success=True, affected_rows=rows) for rows in affected_rows
+        ])
+        return factory
+
+    def test_update_order_and_limit(self):
+        """Test Update renders ORDER BY and LIMIT, and rejects OFFSET."""
+        update = Update().table('users').set_update('active', 0).where('deleted', 1).add_order('id').set_limit(10)
+        assert update.compile().get_query() == (
+            "UPDATE `users` SET `active` = 0 WHERE (`deleted` = 1) ORDER BY `id` LIMIT 10"
+        )
+
+        with pytest.raises(QueryBuilderException):
+            update.set_offset(5).compile()
+
+    @pytest.mark.asyncio
+    async def test_delete_batched_until_no_rows(self):
+        """Test batches run until one affects no row, leaving the builder unchanged."""
+        factory = self._factory(100, 100, 40, 0)
+        delete = Delete(factory).from_table('logs').where_lesser('created_at', '2024-01-01')
+        progress = []
+
+        result = await delete.execute_batched(batch_size=100, on_progress=lambda r: progress.append(r.affected_rows))
+
+        assert result.is_success
+        assert result.affected_rows == 240
+        assert result.chunk_count == 4
+        assert progress == [100, 200, 240, 240]
+        assert factory.query.await_args_list[0].args[0] == (
+            "DELETE FROM `logs` WHERE (`created_at` < '2024-01-01') ORDER BY `id` LIMIT 100"
+        )
+        assert delete._count is None and delete._order_by == {}
+
+    @pytest.mark.asyncio
+    async def test_batched_cancel_and_failure(self):
+        """Test the runner stops when cancelled and on the first failed batch."""
+        cancel_event = asyncio.Event()
+        factory = self._factory(10, 10)
+        delete = Delete(factory).from_table('logs').where('kind', 'debug')
+
+        result = await delete.execute_batched(batch_size=10, on_progress=lambda r: cancel_event.set(),
+                                              cancel_event=cancel_event)
+        assert result.message == "Cancelled"
+        assert result.affected_rows == 10
+
+        factory.query = AsyncMock(return_value=DBResult(is_success=False, message='Lock wait timeout'))
+        result = await delete.execute_batched(batch_size=10)
+        assert not result.is_success
+        assert result.failed_chunks[0]['message'] == 'Lock wait timeout'
@@ -0,0 +1,78 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.query_builder.clauses.bulk_update import BulkUpdate
+from src.query_builder.core.db_result import DBResult
+from src.query_builder.exceptions.query_builder_exception import QueryBuilderException
+
+
+class TestBulkUpdate:
+    """Test suite for the CASE based bulk update."""
+
+    @pytest.fixture
+    def bulk_update(self):
+        """Return a bulk update of three rows, the last one setting a single column."""
+        return (
+            BulkUpdate()
+            .table('users')
+            .add_updates({
+                1: {'name': 'a', 'age': 10},
+                2: {'name': 'b', 'age': 20},
+                3: {'age': 30},
+            })
+        )
+
+    def test_compile(self, bulk_update):
+        """Test every column gets a CASE keeping the current value of rows that don't set it."""
+        assert bulk_update.compile().get_query() == (
+            "UPDATE `users` SET "
+            "`name` = CASE `id` WHEN 1 THEN 'a' WHEN 2 THEN 'b' ELSE `name` END, "
+            "`age` = CASE `id` WHEN 1 THEN 10 WHEN 2 THEN 20 WHEN 3 THEN 30 ELSE `age` END "
+            "WHERE `id` IN (1, 2, 3)"
+        )
+
+    def test_compile_with_key_and_where(self):
+        """Test a custom key column and extra conditions on the updated rows."""
+        query = (
+            BulkUpdate()
+            .table('users')
+            .set_key('email')
+            .add_update('a@x.io', {'name': 'a'})
+            .where('active', 1)
+            .compile()
+            .get_query()
+        )
+        assert query == (
+            "UPDATE `users` SET `name` = CASE `email` WHEN 'a@x.io' THEN 'a' ELSE `name` END "
+            "WHERE `email` IN ('a@x.io') AND ((`active` = 1))"
+        )
+
+    def test_compile_chunks(self, bulk_update):
+        """Test chunks only update the columns set by their rows and stay within the byte limit."""
+        chunks = bulk_update.compile_chunks(max_rows=2)
+        assert len(chunks) == 2
+        assert chunks[1].get_query() == (
+            "UPDATE `users` SET `age` = CASE `id` WHEN 3 THEN 30 ELSE `age` END WHERE `id` IN (3)"
+        )
+
+        max_bytes = len(bulk_update.compile().get_query()) - 1
+        chunks = bulk_update.compile_chunks(max_bytes=max_bytes)
+        assert len(chunks) == 2
+        assert all(len(chunk.get_query().encode()) <= max_bytes for chunk in chunks)
+
+    def test_duplicate_key(self, bulk_update):
+        """Test a row can only be added once."""
+        with pytest.raises(QueryBuilderException):
+            bulk_update.add_update(1, {'name': 'c'})
+
+    @pytest.mark.asyncio
+    async def test_execute_chunked(self):
+        """Test chunks run on the factory and their affected rows are summed."""
+        factory = MagicMock()
+        factory.query = AsyncMock(return_value=DBResult(is_success=True, affected_rows=2))
+        bulk_update = BulkUpdate(factory).table('users').add_updates({i: {'name': str(i)} for i in range(4)})
+
+        result = await bulk_update.execute_chunked(max_rows=2)
+
+        assert result.is_success
+        assert result.chunk_count == 2
+        assert result.affected_rows == 4
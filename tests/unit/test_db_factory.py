@@ -1,10 +1,46 @@
+import asyncio
+import re
+import pymysql
 import pytest
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch, AsyncMock, MagicMock
+from src.query_builder.clauses.load_data import LoadData
 from src.query_builder.core.db_factory import DBFactory
+from src.query_builder.core.db_result import DBResult
+from src.query_builder.core.db_worker import DBWorker
+from src.query_builder.core.e_query import EQuery
+from src.query_builder.core.local_infile import LocalInfile
+from src.query_builder.core.retry_policy import RetryPolicy
+from src.query_builder.core.statement_classifier import StatementClassifier
+from src.query_builder.enums.statement_kind import StatementKind
+from src.query_builder.exceptions.connection_acquire_exception import ConnectionAcquireException
 from src.query_builder.exceptions.db_factory_exception import DBFactoryException
 from src.query_builder.core.query_builder import QueryBuilder
 
 
+def _mock_pool():
+    """A pool handing out the same mock connection on every acquire."""
+    pool = MagicMock()
+    pool.acquire = AsyncMock(return_value=MagicMock())
+    return pool
+
+
+@pytest.fixture
+def make_factory():
+    """Build a DBFactory with the given options, whose write and read pools are mocks."""
+    def make(**options):
+        factory = DBFactory('localhost', 'test_db', 'test_user', 'test_pass', **options)
+        factory._write_pool = _mock_pool()
+        factory._read_pool = _mock_pool()
+        return factory
+
+    return make
+
+
+@pytest.fixture
+def factory(make_factory):
+    return make_factory()
+
+
 class TestDBFactory:
     """Unit tests for DBFactory class."""
 
@@ -62,6 +98,24 @@ class TestDBFactory:
 
             assert "Failed to create connection pools" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    async def test_create_connections_with_warm_up(self, db_config):
+        """Test pool settings are passed through and every pool is warmed up."""
+        pool = MagicMock(maxsize=2)
+        pool.acquire = AsyncMock(return_value=MagicMock())
+        with patch('aiomysql.create_pool', new=AsyncMock(return_value=pool)) as mock_create_pool, \
+                patch.object(DBWorker, 'execute_query', AsyncMock()) as execute_query:
+            factory = DBFactory(**db_config, min_instance_count=2, pool_recycle=600, warm_up_connections=5,
+                                session_variables={'time_zone': '+00:00', 'sql_mode': 'STRICT_ALL_TABLES'})
+            await factory.create_connections()
+
+        kwargs = mock_create_pool.call_args.kwargs
+        assert (kwargs['minsize'], kwargs['pool_recycle'], kwargs['connect_timeout']) == (2, 600, 2)
+        assert kwargs['init_command'] == "SET SESSION time_zone = '+00:00', SESSION sql_mode = 'STRICT_ALL_TABLES'"
+        assert pool.acquire.await_count == 4  # Capped at the pool size, for both pools
+        execute_query.assert_awaited_with("SELECT 1")
+        assert pool.release.call_count == 4
+
     def test_get_query_builder_without_connections(self, db_config):
         """Test getting query builder without connections."""
         factory = DBFactory(**db_config)
@@ -103,4 +157,485 @@ class TestDBFactory:
 
             # Verify pools were set to None
             assert factory._write_pool is None
-            assert factory._read_pool is None 
\ No newline at end of file
+            assert factory._read_pool is None 
+
+
+class TestReadYourWrites:
+    """Unit tests for read-your-writes routing."""
+
+    @pytest.mark.asyncio
+    async def test_reads_follow_own_writes(self, factory):
+        """Test reads go to the primary after a write of the same session only."""
+        with patch.object(DBWorker, 'query', AsyncMock(return_value=DBResult(is_success=True))):
+            with factory.read_your_writes(window=60):
+                await factory.query("SELECT 1")
+                assert factory._read_pool.acquire.call_count == 1
+
+                await factory.query("INSERT INTO t (a) VALUES (1)")
+                await factory.query("SELECT 1")
+                assert factory._write_pool.acquire.call_count == 2
+
+            await factory.query("SELECT 1")
+            assert factory._read_pool.acquire.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reads_wait_for_gtid_on_replica(self, factory):
+        """Test a replica that applied the write's GTID set serves the read."""
+        with patch.object(DBWorker, 'query', AsyncMock(return_value=DBResult(is_success=True))), \
+                patch.object(DBWorker, 'get_gtid_executed', AsyncMock(return_value='uuid:1-5')), \
+                patch.object(DBWorker, 'wait_for_gtid', AsyncMock(return_value=True)) as wait_for_gtid:
+            with factory.read_your_writes(window=60, wait_for_gtid=True):
+                await factory.query("UPDATE t SET a = 1 WHERE id = 1")
+                await factory.query("SELECT a FROM t WHERE id = 1")
+
+        wait_for_gtid.assert_awaited_once_with('uuid:1-5', 1.0)
+        assert factory._read_pool.acquire.call_count == 1
+        assert factory._write_pool.acquire.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_per_factory(self, factory, make_factory):
+        """Test a write through one factory doesn't send the reads of another one to its primary."""
+        other = make_factory(read_your_writes_window=60)
+
+        async def write_then_read():
+            await other.query("INSERT INTO t (a) VALUES (1)")
+            await factory.query("SELECT 1")
+            await other.query("SELECT 1")
+
+        with patch.object(DBWorker, 'query', AsyncMock(return_value=DBResult(is_success=True))):
+            await asyncio.ensure_future(write_then_read())
+
+        assert factory._read_pool.acquire.call_count == 1
+        assert other._write_pool.acquire.call_count == 2
+
+
+class TestStatementRouting:
+    """Unit tests for the statement classifier and explicit routes."""
+
+    @pytest.mark.parametrize('query, kind', [
+        ("select 1", StatementKind.READ),
+        ("  /* note */ -- why\n(SELECT 1) UNION (SELECT 2)", StatementKind.READ),
+        ("WITH a AS (SELECT ')') SELECT * FROM a", StatementKind.READ),
+        ("WITH a AS (SELECT 1) UPDATE t JOIN a ON t.id = a.id SET t.x = 1", StatementKind.WRITE),
+        ("EXPLAIN SELECT 1", StatementKind.READ),
+        ("DESCRIBE t", StatementKind.READ),
+        ("# comment\nSHOW TABLES", StatementKind.READ),
+        ("INSERT INTO t VALUES (1)", StatementKind.WRITE),
+        ("selected_rows()", StatementKind.WRITE),
+    ])
+    def test_classify(self, query, kind):
+        """Test the leading keyword decides the kind, after comments and parentheses."""
+        assert StatementClassifier.classify(query) == kind
+
+    @pytest.mark.asyncio
+    async def test_explicit_route(self, factory):
+        """Test the route overrides the statement text, and builders pass their kind."""
+
+        with patch.object(DBWorker, 'query', AsyncMock(return_value=DBResult(is_success=True))):
+            await factory.query("SELECT GET_LOCK('job', 10)", route='write')
+            await EQuery("SELECT 1 FROM t FOR UPDATE", factory, kind=StatementKind.WRITE).commit()
+            assert factory._write_pool.acquire.call_count == 2
+
+            with pytest.raises(DBFactoryException):
+                await factory.query("SELECT 1", route='primary')
+
+
+class TestPoolStats:
+    """Unit tests for pool instrumentation."""
+
+    @pytest.mark.asyncio
+    async def test_get_pool_stats(self):
+        """Test acquire waits and hold times are recorded only when metrics are enabled."""
+        factory = DBFactory('localhost', 'test_db', 'test_user', 'test_pass', pool_metrics=True)
+        factory._write_pool = MagicMock(size=2, freesize=1, maxsize=4)
+        factory._write_pool.acquire = AsyncMock(return_value=MagicMock())
+        factory._read_pool = MagicMock(size=1, freesize=1, maxsize=2)
+
+        with patch.object(DBWorker, 'query', AsyncMock(return_value=DBResult(is_success=True))):
+            await factory.query("DELETE FROM t WHERE id = 1")
+            await factory.query("DELETE FROM t WHERE id = 2")
+
+        stats = factory.get_pool_stats()
+        assert stats['write']['acquisitions'] == 2
+        assert stats['write']['acquire_wait']['count'] == 2
+        assert stats['write']['hold_time']['p99'] is not None
+        assert stats['write']['utilization'] == 0.25
+        assert stats['read']['acquisitions'] == 0
+        assert factory._write_pool.release.call_count == 2
+
+        assert 'acquire_wait' not in DBFactory('localhost', 'test_db', 'u', 'p').get_pool_stats()['write']
+
+
+class TestQueryTimeout:
+    """Unit tests for per-query timeouts, with a fake server whose statements only stop when killed."""
+
+    @pytest.fixture
+    def factory(self, make_factory):
+        factory = make_factory(kill_grace_period=0.1)
+        connection = factory._read_pool.acquire.return_value
+        connection.host, connection.port = 'replica', 3307
+        connection.thread_id.return_value = 42
+        return factory
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_query(self, factory):
+        """Test the statement is killed on the server and the drained connection is kept."""
+        killed = asyncio.Event()
+
+        async def slow_query(sql, return_insert_ids=False):
+            await killed.wait()
+            return DBResult(is_success=False, message='Query execution was interrupted')
+
+        async def kill_query(host, port, thread_id):
+            assert (host, port, thread_id) == ('replica', 3307, 42)
+            killed.set()
+
+        factory._query_killer.kill_query = AsyncMock(side_effect=kill_query)
+        with patch.object(DBWorker, 'query', side_effect=slow_query):
+            result = await factory.query("SELECT SLEEP(60)", timeout=0.01)
+
+        assert not result.is_success
+        assert result.is_timeout
+        factory._read_pool.release.assert_called_once()
+        factory._read_pool.acquire.return_value.close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unresponsive_connection_is_closed(self, factory):
+        """Test a connection whose query doesn't return after the kill is closed."""
+        async def stuck_query(sql, return_insert_ids=False):
+            await asyncio.sleep(60)
+
+        factory._query_killer.kill_query = AsyncMock()
+        with patch.object(DBWorker, 'query', side_effect=stuck_query):
+            result = await factory.query("SELECT SLEEP(60)", timeout=0.01)
+
+        assert result.is_timeout
+        factory._read_pool.acquire.return_value.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_kill_is_recorded(self, factory):
+        """Test a KILL that couldn't be sent shows up in the pool stats, as the statement may still run."""
+        async def stuck_query(sql, return_insert_ids=False):
+            await asyncio.sleep(60)
+
+        factory._query_killer._kill = AsyncMock(side_effect=OSError("Can't connect"))
+        with patch.object(DBWorker, 'query', side_effect=stuck_query):
+            assert (await factory.query("SELECT SLEEP(60)", timeout=0.01)).is_timeout
+
+        stats = factory.get_pool_stats()['query_killer']
+        assert stats['kill_failures'] == 1
+        assert stats['last_failure']['thread_id'] == 42
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_background_kill(self, factory):
+        """Test the KILL of a cancelled caller is kept until it's done and awaited when the factory closes."""
+        kill_sent = asyncio.Event()
+        release_kill = asyncio.Event()
+
+        async def kill_query(host, port, thread_id):
+            kill_sent.set()
+            await release_kill.wait()
+
+        async def stuck_query(sql, return_insert_ids=False):
+            await asyncio.sleep(60)
+
+        factory._query_killer.kill_query = AsyncMock(side_effect=kill_query)
+        with patch.object(DBWorker, 'query', side_effect=stuck_query):
+            caller = asyncio.ensure_future(factory.query("SELECT SLEEP(60)", timeout=30))
+            await asyncio.sleep(0.01)
+            caller.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await caller
+
+        await asyncio.wait_for(kill_sent.wait(), 1)
+        assert len(factory._kill_tasks) == 1
+
+        factory._write_pool = factory._read_pool = None
+        closing = asyncio.ensure_future(factory.close_connections())
+        await asyncio.sleep(0.01)
+        assert not closing.done()
+
+        release_kill.set()
+        await asyncio.wait_for(closing, 1)
+        assert not factory._kill_tasks
+
+
+class TestRetriesAndCircuitBreaker:
+    """Unit tests for retry policies and the per-pool circuit breaker."""
+
+    @pytest.fixture
+    def factory(self, make_factory):
+        return make_factory(retry_policy=RetryPolicy(max_attempts=3, base_delay=0.0),
+                            circuit_breaker_threshold=3, circuit_breaker_reset_timeout=60.0)
+
+    @pytest.mark.asyncio
+    async def test_deadlock_is_retried(self, factory):
+        """Test a write failing on a deadlock is run again until it succeeds."""
+        deadlock = DBResult(is_success=False, message='Deadlock found', error_code=1213)
+        with patch.object(DBWorker, 'query', side_effect=[deadlock, DBResult(is_success=True)]) as query:
+            result = await factory.query("UPDATE t SET a = 1")
+
+        assert result.is_success
+        assert query.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_lost_connection_only_retried_for_reads(self, factory):
+        """Test a lost connection is retried for a read but not for a write, which may have been applied."""
+        lost = DBResult(is_success=False, message='Lost connection', error_code=2013)
+        with patch.object(DBWorker, 'query', side_effect=[lost, lost, DBResult(is_success=True)]) as query:
+            assert (await factory.query("SELECT 1")).is_success
+            assert query.call_count == 3
+
+        with patch.object(DBWorker, 'query', return_value=lost) as query:
+            result = await factory.query("UPDATE t SET a = 1")
+
+        assert result.error_code == 2013
+        assert query.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_syntax_error_is_not_retried(self, factory):
+        """Test errors that aren't transient are returned at once."""
+        error = DBResult(is_success=False, message='You have an error in your SQL syntax', error_code=1064)
+        with patch.object(DBWorker, 'query', return_value=error) as query:
+            assert (await factory.query("SELECT FROM")).error_code == 1064
+
+        query.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_load_data_is_not_retried(self, factory):
+        """Test a deadlocked LOAD DATA LOCAL isn't run again with its stream already consumed."""
+        sent = []
+
+        async def query(sql, return_insert_ids=False):
+            name = re.search(r"INFILE '([^']+)'", sql).group(1)
+            async for chunk in LocalInfile.get(name):
+                sent.append(chunk)
+            return DBResult(is_success=False, message='Deadlock found', error_code=1213)
+
+        async def rows():
+            yield [1]
+            yield [2]
+
+        with patch.object(DBWorker, 'query', side_effect=query) as worker_query:
+            result = await LoadData(factory).into('events').set_columns(['id']).set_rows(rows()).execute()
+
+        assert result.error_code == 1213
+        worker_query.assert_called_once()
+        assert b"".join(sent) == b"1\n2\n"
+
+    @pytest.mark.asyncio
+    async def test_applied_write_is_not_retried(self, factory):
+        """Test a connection lost after the write ran, while reading its GTID, doesn't run the write again."""
+        factory._read_your_writes_window = 1.0
+        with patch.object(DBWorker, 'query', return_value=DBResult(is_success=True)) as query, \
+                patch.object(DBWorker, 'get_gtid_executed',
+                             side_effect=pymysql.err.OperationalError(2013, 'Lost connection')):
+            with factory.read_your_writes(wait_for_gtid=True) as session:
+                assert (await factory.query("INSERT INTO t (a) VALUES (1)")).is_success
+
+        query.assert_called_once()
+        # Without a GTID set, the reads of the window go to the primary
+        assert session.is_sticky() and session.gtid_executed is None
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_after_connection_failures(self, factory):
+        """Test the pool fails fast once the server couldn't be reached often enough."""
+        factory._write_pool.acquire.side_effect = pymysql.err.OperationalError(2003, "Can't connect")
+
+        with pytest.raises(ConnectionAcquireException) as raised:
+            await factory.query("UPDATE t SET a = 1")
+
+        assert raised.value.error_code == 2003
+        # The policy retried within the call, which opened the circuit
+        assert factory._write_pool.acquire.call_count == 3
+        with pytest.raises(DBFactoryException):
+            await factory.query("UPDATE t SET a = 1")
+
+        assert factory._write_pool.acquire.call_count == 3
+        assert factory.get_pool_stats()['circuit:write']['state'] == 'open'
+        # The read pool has its own breaker
+        with patch.object(DBWorker, 'query', return_value=DBResult(is_success=True)):
+            assert (await factory.query("SELECT 1")).is_success
+
+
+class TestRunMany:
+    """Unit tests for the bounded-concurrency fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_ordered_with_bounded_concurrency(self, factory):
+        """Test results come back in input order while at most `concurrency` queries run."""
+        running, peak = 0, 0
+
+        async def query(sql, return_insert_ids=False):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001 * (10 - int(sql.split()[-1])))
+            running -= 1
+            return DBResult(is_success=True, message=sql)
+
+        queries = [f"SELECT {index}" for index in range(10)]
+        with patch.object(DBWorker, 'query', side_effect=query):
+            results = [item async for item in factory.run_many(queries, concurrency=3)]
+
+        assert [index for index, _ in results] == list(range(10))
+        assert [result.message for _, result in results] == queries
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_routes_each_query(self, factory):
+        """Test compiled writes go to the write pool and reads to the read pool."""
+        queries = [EQuery("UPDATE t SET a = 1", factory, kind=StatementKind.WRITE), "SELECT 1"]
+        with patch.object(DBWorker, 'query', return_value=DBResult(is_success=True)):
+            results = [result async for _, result in factory.run_many(queries, ordered=False)]
+
+        assert len(results) == 2
+        factory._write_pool.acquire.assert_awaited_once()
+        factory._read_pool.acquire.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_collect_errors_and_fail_fast(self, factory):
+        """Test failures are yielded by default, and raised in fail-fast mode."""
+        failure = DBResult(is_success=False, message='Unknown column', error_code=1054)
+        with patch.object(DBWorker, 'query', side_effect=[DBResult(is_success=True), failure]):
+            results = [result async for _, result in factory.run_many(["SELECT 1", "SELECT x"], concurrency=1)]
+        assert [result.is_success for result in results] == [True, False]
+
+        with patch.object(DBWorker, 'query', return_value=failure):
+            with pytest.raises(DBFactoryException):
+                async for _ in factory.run_many(["SELECT x"] * 5, fail_fast=True):
+                    pass
+
+    @pytest.mark.asyncio
+    async def test_slow_head_bounds_lookahead(self, factory):
+        """Test a slow first query stops the workers from pulling far ahead of the yielded results."""
+        head_done = asyncio.Event()
+        pulled = 0
+
+        def queries():
+            nonlocal pulled
+            for index in range(100):
+                pulled += 1
+                yield f"SELECT {index}"
+
+        async def query(sql, return_insert_ids=False):
+            if sql == "SELECT 0":
+                await head_done.wait()
+            return DBResult(is_success=True)
+
+        with patch.object(DBWorker, 'query', side_effect=query):
+            results = factory.run_many(queries(), concurrency=2)
+            first = asyncio.ensure_future(results.__anext__())
+            await asyncio.sleep(0.01)
+            assert pulled == 4
+
+            head_done.set()
+            assert (await first)[0] == 0
+            assert len([item async for item in results]) == 99
+
+    @pytest.mark.asyncio
+    async def test_iterable_and_foreign_query_errors_are_raised(self, factory):
+        """Test an error of the query iterable, or a query compiled for a transaction, reaches the caller."""
+        def queries():
+            yield "SELECT 1"
+            raise ValueError("source failed")
+
+        with patch.object(DBWorker, 'query', return_value=DBResult(is_success=True)):
+            with pytest.raises(ValueError):
+                async for _ in factory.run_many(queries()):
+                    pass
+
+            with pytest.raises(DBFactoryException):
+                async for _ in factory.run_many([EQuery("SELECT 1", MagicMock())]):
+                    pass
+
+
+class TestTransactionRelease:
+    @pytest.fixture
+    def factory(self, make_factory):
+        factory = make_factory(priority_lanes=True)
+        factory._write_pool.maxsize = 2
+        return factory
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('finish', ['commit', 'rollback'])
+    async def test_finished_transaction_returns_its_slot(self, factory, finish):
+        """Test commit and rollback give back the write slot and connection, without calling release_transaction."""
+        with patch.object(DBWorker, 'query', return_value=DBResult(is_success=True)):
+            for _ in range(5):
+                transaction = await asyncio.wait_for(factory.begin_transaction(), 1)
+                assert (await getattr(transaction, finish)()).is_success
+
+        assert factory._write_pool.release.call_count == 5
+        assert factory.get_pool_stats()['admission:write']['in_use'] == 0
+
+    @pytest.mark.asyncio
+    async def test_release_after_commit_is_ignored(self, factory):
+        """Test release_transaction after a commit doesn't release the connection or the slot a second time."""
+        with patch.object(DBWorker, 'query', return_value=DBResult(is_success=True)):
+            transaction = await factory.begin_transaction()
+            await transaction.commit()
+            factory.release_transaction(transaction)
+
+        factory._write_pool.release.assert_called_once()
+        assert factory.get_pool_stats()['admission:write']['in_use'] == 0
+
+
+class TestClaimRows:
+    @staticmethod
+    def _worker(statements, claimed, update_result=None):
+        """A DBWorker.query side effect recording the statements and answering the claim's SELECT with `claimed`."""
+        async def query(sql, return_insert_ids=False):
+            statements.append(sql)
+            if sql.startswith("SELECT"):
+                return DBResult(is_success=True, rows=claimed, count=len(claimed))
+            if sql.startswith("UPDATE") and update_result is not None:
+                return update_result
+            return DBResult(is_success=True)
+
+        return query
+
+    @pytest.mark.asyncio
+    async def test_claims_and_marks_rows(self, factory):
+        """Test the rows are locked with SKIP LOCKED, marked by id and the transaction committed and released."""
+        statements = []
+        claimed = [{'id': 3, 'status': 'queued'}, {'id': 7, 'status': 'queued'}]
+        with patch.object(DBWorker, 'query', side_effect=self._worker(statements, claimed)):
+            result = await factory.claim_rows('jobs', {'status': 'running'}, 2, where={'status': 'queued'})
+
+        assert result.is_success
+        assert result.rows == claimed
+        assert statements[0] == "START TRANSACTION"
+        assert statements[1].startswith("SELECT")
+        assert "FOR UPDATE SKIP LOCKED" in statements[1]
+        assert "LIMIT 2" in statements[1]
+        assert statements[2] == "UPDATE `jobs` SET `status` = 'running' WHERE (`id` IN (3, 7))"
+        assert statements[-1] == "COMMIT"
+        factory._write_pool.release.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_claim_skips_update(self, factory):
+        """Test nothing is updated when no row could be claimed."""
+        statements = []
+        with patch.object(DBWorker, 'query', side_effect=self._worker(statements, [])):
+            result = await factory.claim_rows('jobs', {'status': 'running'}, 5)
+
+        assert result.is_success
+        assert result.rows == []
+        assert not any(sql.startswith("UPDATE") for sql in statements)
+        assert statements[-1] == "COMMIT"
+        factory._write_pool.release.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_update_rolls_back_and_releases(self, factory):
+        """Test a failing UPDATE rolls the claim back and still releases the connection."""
+        statements = []
+        failure = DBResult(is_success=False, message='Lock wait timeout exceeded', error_code=1205)
+        with patch.object(DBWorker, 'query', side_effect=self._worker(statements, [{'id': 3}], failure)):
+            result = await factory.claim_rows('jobs', {'status': 'running'}, 1)
+
+        assert not result.is_success
+        assert result.error_code == 1205
+        assert statements[-1] == "ROLLBACK"
+        assert "COMMIT" not in statements
+        factory._write_pool.release.assert_called_once()
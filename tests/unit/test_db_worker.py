@@ -0,0 +1,106 @@
+import pymysql
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.query_builder.core.db_result import DBResult
+from src.query_builder.core.db_worker import DBWorker
+from src.query_builder.core.e_query import EQuery
+from src.query_builder.core.transaction import Transaction
+
+
+class TestDBWorker:
+    """Unit tests for DBWorker class."""
+
+    @staticmethod
+    def _script_cursor(cursor, lock_mode):
+        """Answer the settings select with a row, and the insert with 3 rows starting at id 10."""
+        async def execute(query):
+            if query.startswith("SELECT @@"):
+                cursor.description = (('increment',), ('lock_mode',))
+                cursor.fetchall = AsyncMock(return_value=[(2, lock_mode)])
+            else:
+                cursor.description = None
+                cursor.lastrowid = 10
+                cursor.rowcount = 3
+
+        cursor.execute = AsyncMock(side_effect=execute)
+        cursor._result = None
+
+    @pytest.mark.asyncio
+    async def test_return_insert_ids(self, mock_connection):
+        """Test every generated id is derived from the first id and the cached increment."""
+        connection, cursor = mock_connection
+        self._script_cursor(cursor, lock_mode=1)
+        worker = DBWorker(connection)
+
+        result = await worker.query("INSERT INTO t (a) VALUES (1), (2), (3)", return_insert_ids=True)
+        assert result.is_success
+        assert result.insert_ids == [10, 12, 14]
+
+        await worker.query("INSERT INTO t (a) VALUES (1), (2), (3)", return_insert_ids=True)
+        assert cursor.execute.await_count == 3  # settings are read once per connection
+
+    @pytest.mark.asyncio
+    async def test_return_insert_ids_refused_with_interleaved_lock_mode(self, mock_connection):
+        """Test the insert is not executed when ids may not be consecutive."""
+        connection, cursor = mock_connection
+        self._script_cursor(cursor, lock_mode=2)
+
+        result = await DBWorker(connection).query("INSERT INTO t (a) VALUES (1), (2)", return_insert_ids=True)
+
+        assert not result.is_success
+        assert "innodb_autoinc_lock_mode" in result.message
+        assert cursor.execute.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_query_many_splits_results(self, mock_connection):
+        """Test the statements go in one packet and the result of each one is read with nextset."""
+        connection, cursor = mock_connection
+        cursor._result = None
+        cursor.description = None
+        cursor.lastrowid = 0
+        cursor.rowcount = 2
+
+        async def nextset():
+            if cursor.description is None:
+                cursor.description = (('id',),)
+                cursor.fetchall = AsyncMock(return_value=[(1,), (2,)])
+                return True
+            raise pymysql.err.IntegrityError(1062, "Duplicate entry '1' for key 'PRIMARY'")
+
+        cursor.execute = AsyncMock()
+        cursor.nextset = AsyncMock(side_effect=nextset)
+
+        results = await DBWorker(connection).query_many([
+            "UPDATE t SET a = 1;", "SELECT id FROM t", "INSERT INTO t (id) VALUES (1)", "COMMIT"
+        ])
+
+        cursor.execute.assert_awaited_once_with(
+            "UPDATE t SET a = 1;\nSELECT id FROM t;\nINSERT INTO t (id) VALUES (1);\nCOMMIT"
+        )
+        assert results[0].affected_rows == 2
+        assert results[1].rows == [{'id': 1}, {'id': 2}]
+        assert results[2].error_code == 1062
+        assert not results[3].is_success
+        assert results[3].message == "Not executed, statement 2 failed"
+
+    @pytest.mark.asyncio
+    async def test_batched_commit_reports_failed_statement(self):
+        """Test a batched commit sends the COMMIT with the last packet and reports the failing query."""
+        worker = MagicMock()
+        worker.query = AsyncMock(return_value=DBResult(is_success=True))
+        worker.query_many = AsyncMock(side_effect=[
+            [DBResult(is_success=True), DBResult(is_success=True)],
+            [DBResult(is_success=False, message='Deadlock', error_code=1213),
+             DBResult(is_success=False, message='Not executed, statement 0 failed')],
+        ])
+        transaction = Transaction(worker)
+        await transaction.begin()
+        for index in range(3):
+            transaction.add_query(EQuery(f"UPDATE t SET a = {index}", None))
+
+        result = await transaction.commit(batch_size=2)
+
+        assert worker.query_many.await_args_list[1].args[0] == ["UPDATE t SET a = 2", "COMMIT"]
+        assert result.failed_statement == 2
+        assert result.error_code == 1213
+        assert transaction.is_rolled_back
@@ -0,0 +1,153 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.query_builder.clauses.insert import Insert
+from src.query_builder.clauses.select import Select
+from src.query_builder.core.db_result import DBResult
+from src.query_builder.exceptions.query_builder_exception import QueryBuilderException
+
+
+class TestInsertClause:
+    """Test suite for Insert clause compilation and bulk execution."""
+
+    @pytest.fixture
+    def insert(self):
+        """Return an insert with five rows."""
+        return (
+            Insert()
+            .into('users')
+            .set_columns(['id', 'name'])
+            .add_rows([[i, f'user{i}'] for i in range(5)])
+        )
+
+    def test_compile(self, insert):
+        """Test all rows are rendered into one statement."""
+        assert insert.compile().get_query() == (
+            "INSERT INTO `users` (`id`, `name`) VALUES "
+            "(0, 'user0'), (1, 'user1'), (2, 'user2'), (3, 'user3'), (4, 'user4')"
+        )
+
+    def test_compile_chunks_by_row_count(self, insert):
+        """Test chunks honour the row count limit."""
+        chunks = insert.compile_chunks(max_rows=2)
+        assert [chunk.get_query().count('(') - 1 for chunk in chunks] == [2, 2, 1]
+        assert chunks[2].get_query().endswith("VALUES (4, 'user4')")
+
+    def test_compile_chunks_by_byte_size(self, insert):
+        """Test every chunk stays within the byte limit."""
+        max_bytes = len(insert.compile().get_query()) // 2 + 10
+        chunks = insert.compile_chunks(max_bytes=max_bytes)
+        assert len(chunks) > 1
+        assert all(len(chunk.get_query().encode()) <= max_bytes for chunk in chunks)
+
+    def test_compile_chunks_counts_multibyte_rows_in_bytes(self):
+        """Test rows are rendered once and non-ASCII rows are sized by their encoded length."""
+        insert = Insert().into('users').set_columns(['name']).add_rows([['é' * 10] for _ in range(4)])
+        assert insert._rows[0] == "('" + 'é' * 10 + "')"
+        assert insert._row_sizes == [24] * 4
+
+        max_bytes = len(insert.compile().get_query().encode()) - 1
+        chunks = insert.compile_chunks(max_bytes=max_bytes)
+        assert len(chunks) == 2
+        assert all(len(chunk.get_query().encode()) <= max_bytes for chunk in chunks)
+
+    def test_compile_chunks_row_too_large(self, insert):
+        """Test a row larger than the byte limit is rejected."""
+        with pytest.raises(QueryBuilderException):
+            insert.compile_chunks(max_bytes=50)
+
+    @pytest.mark.asyncio
+    async def test_execute_chunked_aggregates_and_reports_failures(self):
+        """Test affected rows, insert ids and failed chunks are aggregated."""
+        factory = MagicMock()
+        factory.query = AsyncMock(side_effect=[
+            DBResult(is_success=True, affected_rows=2, insert_id=1),
+            DBResult(is_success=False, message='Deadlock found'),
+            DBResult(is_success=True, affected_rows=1, insert_id=5),
+        ])
+        insert = Insert(factory).into('users').set_columns(['name']).add_rows([['a'], ['b'], ['c'], ['d'], ['e']])
+
+        result = await insert.execute_chunked(max_rows=2, concurrency=1)
+
+        assert not result.is_success
+        assert result.chunk_count == 3
+        assert result.affected_rows == 3
+        assert result.insert_ids == [1, None, 5]
+        assert result.failed_chunks == [{'index': 1, 'start': 2, 'end': 4, 'message': 'Deadlock found'}]
+
+    @pytest.mark.asyncio
+    async def test_execute_chunked_returns_every_insert_id(self):
+        """Test requested insert ids are forwarded to every chunk and concatenated in row order."""
+        factory = MagicMock()
+        factory.query = AsyncMock(side_effect=[
+            DBResult(is_success=True, affected_rows=2, insert_id=1, insert_ids=[1, 2]),
+            DBResult(is_success=False, message='Deadlock found'),
+            DBResult(is_success=True, affected_rows=1, insert_id=7, insert_ids=[7]),
+        ])
+        insert = (
+            Insert(factory).into('users').set_columns(['name']).return_insert_ids()
+            .add_rows([['a'], ['b'], ['c'], ['d'], ['e']])
+        )
+
+        result = await insert.execute_chunked(max_rows=2, concurrency=1)
+
+        assert result.row_insert_ids == [1, 2, None, None, 7]
+        assert all(call.kwargs['return_insert_ids'] for call in factory.query.await_args_list)
+
+        with pytest.raises(QueryBuilderException):
+            await insert.ignore().execute_chunked(max_rows=2)
+
+    @pytest.mark.asyncio
+    async def test_from_async_iterable_flushes_batches(self):
+        """Test rows from an async source are flushed in batches with one batch in flight."""
+        in_flight = []
+        max_in_flight = []
+
+        async def query(sql, route=None):
+            in_flight.append(sql)
+            max_in_flight.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(sql)
+            return DBResult(is_success=True, affected_rows=sql.count('(') - 1, insert_id=1)
+
+        factory = MagicMock()
+        factory.query = query
+
+        async def source():
+            for i in range(7):
+                yield [i]
+
+        insert = Insert(factory).into('events').set_columns(['id'])
+        result = await insert.from_async_iterable(source(), batch_rows=3)
+
+        assert result.is_success
+        assert result.chunk_count == 3
+        assert result.affected_rows == 7
+        assert max(max_in_flight) == 1
+        assert insert._rows == []
+
+    def test_ignore_and_replace(self, insert):
+        """Test INSERT IGNORE and REPLACE keywords and their exclusivity."""
+        assert insert.ignore().compile().get_query().startswith("INSERT IGNORE INTO `users` (`id`, `name`) VALUES ")
+        with pytest.raises(QueryBuilderException):
+            insert.replace()
+        assert insert.ignore(False).replace().compile().get_query().startswith("REPLACE INTO `users` ")
+
+    def test_from_select(self):
+        """Test INSERT ... SELECT copies rows inside the server."""
+        select = Select().from_table('users').add_columns(['id', 'name']).where('active', 1)
+        query = Insert().into('users_archive').set_columns(['id', 'name']).ignore().from_select(select).compile()
+        assert query.get_query() == (
+            "INSERT IGNORE INTO `users_archive` (`id`, `name`) "
+            "SELECT `id`, `name` FROM `users`  WHERE (`active` = 1)"
+        )
+
+    def test_from_select_with_rows(self, insert):
+        """Test rows and select can't be combined."""
+        with pytest.raises(QueryBuilderException):
+            insert.from_select(Select().from_table('users'))
+
+    def test_return_insert_ids_requires_plain_insert(self, insert):
+        """Test insert ids are refused for INSERT IGNORE."""
+        with pytest.raises(QueryBuilderException):
+            insert.return_insert_ids().ignore().compile()
@@ -0,0 +1,60 @@
+import re
+import pytest
+from unittest.mock import MagicMock
+from src.query_builder.clauses.load_data import LoadData
+from src.query_builder.core.db_result import DBResult
+from src.query_builder.core.local_infile import LocalInfile
+
+
+class TestLoadData:
+    """Test suite for the LOAD DATA LOCAL INFILE bulk loader."""
+
+    @staticmethod
+    def _capturing_factory(sent: list):
+        """Return a factory whose query() drains the registered stream like the server would."""
+        async def query(sql, route=None):
+            name = re.search(r"INFILE '([^']+)'", sql).group(1)
+            async for chunk in LocalInfile.get(name):
+                sent.append(chunk)
+            return DBResult(is_success=True, affected_rows=3, warning_count=0, message=sql)
+
+        factory = MagicMock()
+        factory.query = query
+        return factory
+
+    @pytest.mark.asyncio
+    async def test_streams_encoded_rows(self):
+        """Test rows are encoded in the LOAD DATA format and the stream is unregistered afterwards."""
+        sent = []
+
+        async def rows():
+            yield [1, 'tab\there', None]
+            yield [2, 'new\nline', True]
+            yield [3, 'back\\slash', 1.5]
+
+        result = await (
+            LoadData(self._capturing_factory(sent))
+            .into('events')
+            .set_columns(['id', 'name', 'flag'])
+            .set_rows(rows())
+            .execute(chunk_bytes=20)
+        )
+
+        assert result.affected_rows == 3
+        assert result.message.endswith("INTO TABLE `events` CHARACTER SET utf8mb4 (`id`, `name`, `flag`)")
+        assert len(sent) > 1
+        assert b"".join(sent) == b"1\ttab\\there\t\\N\n2\tnew\\nline\t1\n3\tback\\\\slash\t1.5\n"
+        assert LocalInfile._streams == {}
+
+    @pytest.mark.asyncio
+    async def test_csv_source(self):
+        """Test a CSV-like source with a header."""
+        sent = []
+        await (
+            LoadData(self._capturing_factory(sent))
+            .into('events')
+            .set_columns(['id', 'name'])
+            .set_csv(["id,name", "1,alpha", "2,\"be,ta\""], skip_header=True)
+            .execute()
+        )
+        assert b"".join(sent) == b"1\talpha\n2\tbe,ta\n"
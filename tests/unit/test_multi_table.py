@@ -0,0 +1,50 @@
+import pytest
+from src.query_builder.clauses.delete import Delete
+from src.query_builder.clauses.update import Update
+from src.query_builder.exceptions.query_builder_exception import QueryBuilderException
+
+
+class TestMultiTable:
+    """Test suite for UPDATE and DELETE with joins."""
+
+    def test_update_join(self):
+        """Test the joins are rendered between the table and SET."""
+        query = (
+            Update()
+            .table('orders')
+            .inner_join('users', 'orders.user_id', 'users.id')
+            .set_update('orders.status', 'blocked')
+            .where('users.banned', 1)
+            .compile()
+            .get_query()
+        )
+        assert query == (
+            "UPDATE `orders` INNER JOIN `users` ON `orders`.`user_id` = `users`.`id` "
+            "SET `orders`.`status` = 'blocked' WHERE (`users`.`banned` = 1)"
+        )
+
+    def test_delete_join(self):
+        """Test the multi-table syntax names the tables to delete from."""
+        delete = (
+            Delete()
+            .from_table('sessions')
+            .left_join('users', 'sessions.user_id', 'users.id')
+            .where_is_null('users.id')
+        )
+        assert delete.compile().get_query() == (
+            "DELETE `sessions` FROM `sessions` LEFT JOIN `users` ON `sessions`.`user_id` = `users`.`id` "
+            "WHERE (`users`.`id` IS NULL)"
+        )
+
+        delete.delete_from(['sessions', 'users'])
+        assert delete.compile().get_query().startswith("DELETE `sessions`, `users` FROM `sessions` LEFT JOIN")
+
+    def test_join_with_limit(self):
+        """Test MySQL's restriction on ORDER BY and LIMIT in multi-table writes."""
+        update = Update().table('a').inner_join('b', 'a.id', 'b.a_id').set_update('a.x', 1).where('b.y', 2)
+        with pytest.raises(QueryBuilderException):
+            update.set_limit(10).compile()
+
+        delete = Delete().from_table('a').inner_join('b', 'a.id', 'b.a_id').where('b.y', 2)
+        with pytest.raises(QueryBuilderException):
+            delete.add_order('a.id').compile()
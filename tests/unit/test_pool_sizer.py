@@ -0,0 +1,127 @@
+import asyncio
+import aiomysql
+import pytest
+from collections import deque
+from unittest.mock import MagicMock
+from src.query_builder.core.db_factory import DBFactory
+from src.query_builder.core.pool_metrics import PoolMetrics
+from src.query_builder.core.pool_sizer import AdaptivePoolSizer
+from src.query_builder.enums.priority import Priority
+from src.query_builder.exceptions.db_factory_exception import DBFactoryException
+
+
+class FakePool:
+    """Just the parts of aiomysql.Pool the sizer reads and resizes."""
+
+    def __init__(self, maxsize, free=0, used=0):
+        self._free = deque((MagicMock() for _ in range(free)), maxlen=maxsize)
+        self._used = used
+        self._cond = asyncio.Condition()
+
+    @property
+    def maxsize(self):
+        return self._free.maxlen
+
+    @property
+    def freesize(self):
+        return len(self._free)
+
+    @property
+    def size(self):
+        return self.freesize + self._used
+
+
+class TestAdaptivePoolSizer:
+    """Test suite for adaptive pool sizing."""
+
+    @staticmethod
+    def _record_wait(metrics, wait):
+        metrics._window_count += 1
+        metrics._window_wait += wait
+
+    @pytest.mark.asyncio
+    async def test_grow_on_wait_then_shrink_after_cooldown(self):
+        """Test the pool grows up to the max and shrinks idle connections only after a calm cool-down."""
+        pool = FakePool(maxsize=2, used=2)
+        metrics = PoolMetrics()
+        sizer = AdaptivePoolSizer('write', pool, metrics, min_size=2, max_size=5, target_wait=0.01, cooldown=0)
+
+        for _ in range(3):
+            self._record_wait(metrics, 0.1)
+            await sizer.tick()
+        assert pool.maxsize == 5
+        assert [decision['to'] for decision in sizer.decisions] == [4, 5]
+
+        # Within the hysteresis band nothing changes
+        pool._used = 1
+        pool._free.extend(MagicMock() for _ in range(4))
+        self._record_wait(metrics, 0.005)
+        await sizer.tick()
+        assert pool.maxsize == 5
+
+        # Calm: the first tick starts the cool-down, the next ones shrink one step each, closing idle connections
+        idle = pool._free[0]
+        for _ in range(3):
+            await sizer.tick()
+        assert pool.maxsize == 3
+        assert pool.size == 3
+        idle.close.assert_called_once()
+        assert sizer.decisions[-1]['action'] == 'shrink'
+
+    @pytest.mark.asyncio
+    async def test_grows_on_admission_queue_with_priority_lanes(self):
+        """Test callers queued by priority lanes grow the pool, and are admitted once it grew."""
+        factory = DBFactory('localhost', 'test_db', 'test_user', 'test_pass', write_instance_count=1,
+                            read_instance_count=1, priority_lanes=True, adaptive_pool_sizing=True)
+        factory._write_pool = FakePool(maxsize=1, used=1)
+        factory._read_pool = FakePool(maxsize=1)
+        factory._start_pool_sizers()
+        admission = factory._admission['write']
+        try:
+            await admission.acquire(Priority.NORMAL)
+            waiter = asyncio.ensure_future(admission.acquire(Priority.NORMAL))
+            await asyncio.sleep(0)
+            assert not waiter.done()
+
+            await factory._pool_sizers[0].tick()
+
+            assert factory._write_pool.maxsize == 3
+            await asyncio.wait_for(waiter, 1)  # Admitted without any release
+        finally:
+            for sizer in factory._pool_sizers:
+                await sizer.stop()
+
+    @pytest.mark.asyncio
+    async def test_aiomysql_pool_internals(self):
+        """Test aiomysql pools still have the private idle deque and condition the sizer resizes."""
+        pool = aiomysql.Pool(minsize=0, maxsize=2, echo=False, pool_recycle=-1, loop=asyncio.get_running_loop())
+
+        assert isinstance(pool._free, deque)
+        assert pool._free.maxlen == pool.maxsize == 2
+        assert isinstance(pool._cond, asyncio.Condition)
+        AdaptivePoolSizer('write', pool, PoolMetrics(), min_size=1, max_size=4)
+
+    def test_pool_without_internals_is_refused(self):
+        """Test a pool missing the internals fails when the sizer is created rather than silently never resizing."""
+        with pytest.raises(DBFactoryException):
+            AdaptivePoolSizer('write', MagicMock(spec=['maxsize', 'size', 'freesize']), PoolMetrics(),
+                              min_size=1, max_size=4)
+
+    @pytest.mark.asyncio
+    async def test_decisions_reach_debug_logs(self):
+        """Test sizing decisions go to the factory's logs in debug mode, and nothing is logged otherwise."""
+        for debug_mode in (True, False):
+            factory = DBFactory('localhost', 'test_db', 'test_user', 'test_pass', write_instance_count=1,
+                                read_instance_count=1, adaptive_pool_sizing=True, debug_mode=debug_mode)
+            factory._write_pool = FakePool(maxsize=1, used=1)
+            factory._read_pool = FakePool(maxsize=1)
+            factory._start_pool_sizers()
+            try:
+                factory._pool_metrics['write']._window_count, factory._pool_metrics['write']._window_wait = 1, 1.0
+                await factory._pool_sizers[0].tick()
+            finally:
+                for sizer in factory._pool_sizers:
+                    await sizer.stop()
+
+            assert factory._pool_sizers[0].decisions
+            assert factory._logs == (factory.get_pool_sizing_decisions() if debug_mode else [])
@@ -0,0 +1,58 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.query_builder.core.replica_set import Replica, ReplicaSet
+from src.query_builder.exceptions.db_factory_exception import DBFactoryException
+
+
+def _replica(host, weight=1, healthy=True):
+    """Return a replica whose pool hands out mock connections, or fails when unhealthy."""
+    replica = Replica(host, 3306, weight)
+    replica.pool = MagicMock()
+    if healthy:
+        replica.pool.acquire = AsyncMock(return_value=MagicMock())
+    else:
+        replica.pool.acquire = AsyncMock(side_effect=ConnectionError("unreachable"))
+    return replica
+
+
+class TestReplicaSet:
+    """Test suite for read replica routing and health checks."""
+
+    def test_weighted_round_robin(self):
+        """Test picks follow the weights and are interleaved."""
+        replica_set = ReplicaSet([_replica('a', 3), _replica('b', 1)], ReplicaSet.WEIGHTED)
+        picks = [replica_set.choose().host for _ in range(8)]
+        assert picks.count('a') == 6
+        assert picks[:4] == ['a', 'a', 'b', 'a']
+
+    @pytest.mark.asyncio
+    async def test_least_outstanding(self):
+        """Test a busy replica is skipped until its query is released."""
+        replica_set = ReplicaSet([_replica('a'), _replica('b')])
+
+        async with replica_set.acquire():
+            assert replica_set.choose().host == 'b'
+
+        assert [replica.outstanding for replica in replica_set.replicas] == [0, 0]
+
+    @pytest.mark.asyncio
+    async def test_ejection_and_recovery(self):
+        """Test failing replicas are ejected and come back after a successful health check."""
+        down = _replica('a', healthy=False)
+        replica_set = ReplicaSet([down], failure_threshold=2)
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                async with replica_set.acquire():
+                    pass
+
+        assert not down.is_healthy
+        with pytest.raises(DBFactoryException):
+            replica_set.choose()
+
+        connection = MagicMock()
+        connection.cursor.return_value.__aenter__.return_value.execute = AsyncMock()
+        down.pool.acquire = MagicMock()
+        down.pool.acquire.return_value.__aenter__.return_value = connection
+        await replica_set.check_health()
+        assert down.is_healthy
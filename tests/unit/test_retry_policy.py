@@ -0,0 +1,70 @@
+import pymysql
+from unittest.mock import patch
+from src.query_builder.core.circuit_breaker import CircuitBreaker
+from src.query_builder.core.db_result import DBResult
+from src.query_builder.core.db_worker import DBWorker
+from src.query_builder.core.retry_policy import RetryPolicy
+
+
+class TestRetryPolicy:
+    """Test suite for retry decisions and backoff delays."""
+
+    def test_error_code_from_exception(self):
+        """Test the MySQL error number is kept on failed results."""
+        worker = DBWorker(None)
+        assert worker.handle_exception(pymysql.err.OperationalError(1213, 'Deadlock found')).error_code == 1213
+        assert worker.handle_exception(ValueError('not a MySQL error')).error_code is None
+
+    def test_should_retry(self):
+        """Test deadlocks are retried for every statement and lost connections only for reads."""
+        policy = RetryPolicy(max_attempts=2)
+        deadlock = DBResult(is_success=False, error_code=1213)
+        lost = DBResult(is_success=False, error_code=2006)
+
+        assert policy.should_retry(deadlock, 1, is_write=True)
+        assert not policy.should_retry(deadlock, 2, is_write=True)
+        assert policy.should_retry(lost, 1, is_write=False)
+        assert not policy.should_retry(lost, 1, is_write=True)
+        assert not policy.should_retry(DBResult(is_success=False, error_code=1064), 1, is_write=False)
+
+    def test_exponential_delay_with_jitter(self):
+        """Test delays double up to the maximum, and jitter draws below them."""
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.3, jitter=False)
+        assert [policy.delay(attempt) for attempt in (1, 2, 3)] == [0.1, 0.2, 0.3]
+
+        jittered = RetryPolicy(base_delay=0.1, max_delay=0.3)
+        assert all(0 <= jittered.delay(3) <= 0.3 for _ in range(20))
+
+
+class TestCircuitBreaker:
+    """Test suite for the closed, open and half-open states."""
+
+    def test_opens_after_threshold_and_probes(self):
+        """Test the circuit opens, lets one probe through after the reset timeout, and closes on its success."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10.0)
+        with patch('src.query_builder.core.circuit_breaker.time.monotonic', return_value=100.0):
+            breaker.record_failure()
+            assert breaker.allow()
+            breaker.record_failure()
+            assert breaker.state == CircuitBreaker.OPEN
+            assert not breaker.allow()
+
+        with patch('src.query_builder.core.circuit_breaker.time.monotonic', return_value=110.0):
+            assert breaker.allow()
+            assert not breaker.allow()  # Only one probe at a time
+            breaker.record_success()
+            assert breaker.state == CircuitBreaker.CLOSED
+
+        assert breaker.rejected == 2
+
+    def test_failed_probe_reopens(self):
+        """Test a failing probe opens the circuit again without reaching the threshold."""
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=10.0)
+        with patch('src.query_builder.core.circuit_breaker.time.monotonic', return_value=100.0):
+            for _ in range(5):
+                breaker.record_failure()
+
+        with patch('src.query_builder.core.circuit_breaker.time.monotonic', return_value=110.0):
+            assert breaker.allow()
+            breaker.record_failure()
+            assert breaker.state == CircuitBreaker.OPEN
@@ -0,0 +1,192 @@
+import pytest
+from src.query_builder.clauses.select import Select
+from src.query_builder.core.transaction import Transaction
+from src.query_builder.exceptions.query_builder_exception import QueryBuilderException
+
+
+class TestSelectClause:
+    """Test suite for Select clause compilation."""
+
+    def test_having_after_group_by(self):
+        """Test HAVING is rendered after GROUP BY using the WHERE operator set."""
+        query = (
+            Select()
+            .from_table('orders')
+            .add_column('user_id')
+            .add_column_sum('amount', 'total')
+            .group_by('user_id')
+            .having_greater('total', 100)
+            .having_lesser('COUNT(*)', 10, escape_key=False)
+            .compile()
+        )
+        assert query.get_query() == (
+            "SELECT `user_id`, SUM(`amount`) AS `total` FROM `orders` "
+            " GROUP BY `user_id` HAVING (`total` > 100 AND COUNT(*) < 10)"
+        )
+
+    def test_or_having(self):
+        """Test OR groups in HAVING."""
+        query = (
+            Select()
+            .from_table('orders')
+            .group_by('user_id')
+            .having('total', 1)
+            .or_having()
+            .having_in('total', [5, 6])
+            .compile()
+        )
+        assert query.get_query().endswith(" HAVING (`total` = 1) OR (`total` IN (5, 6))")
+
+    def test_count_distinct(self):
+        """Test COUNT(DISTINCT ...) over one and several columns."""
+        query = (
+            Select()
+            .from_table('orders')
+            .add_column_count_distinct('user_id', 'buyers')
+            .add_column_count_distinct(['user_id', 'product_id'])
+            .compile()
+        )
+        assert query.get_query().startswith(
+            "SELECT COUNT(DISTINCT `user_id`) AS `buyers`, COUNT(DISTINCT `user_id`, `product_id`)"
+        )
+
+    def test_count_distinct_empty_column(self):
+        """Test COUNT(DISTINCT ...) rejects empty columns."""
+        with pytest.raises(QueryBuilderException):
+            Select().add_column_count_distinct([])
+
+    def test_group_by_with_rollup(self):
+        """Test GROUP BY ... WITH ROLLUP."""
+        query = (
+            Select()
+            .from_table('orders')
+            .add_column('category')
+            .add_column_sum('amount')
+            .group_by('category')
+            .with_rollup()
+            .compile()
+        )
+        assert query.get_query().endswith(" GROUP BY `category` WITH ROLLUP")
+
+    def test_index_hints_on_from_and_join(self):
+        """Test index hints are rendered after the main table and after joined tables."""
+        query = (
+            Select()
+            .from_table('orders')
+            .inner_join('users', 'orders.user_id', 'u.id', alias='u')
+            .force_index('idx_created', scope='ORDER BY')
+            .use_index(['PRIMARY', 'idx_email'], table='u')
+            .compile()
+        )
+        assert query.get_query() == (
+            "SELECT * FROM `orders` FORCE INDEX FOR ORDER BY (`idx_created`) "
+            "INNER JOIN `users` AS u USE INDEX (`PRIMARY`, `idx_email`) ON `orders`.`user_id` = `u`.`id`"
+        )
+
+    def test_index_hint_unknown_join_target(self):
+        """Test an index hint on a table that is not joined is rejected at compile time."""
+        select = Select().from_table('orders').ignore_index('idx_a', table='users')
+        with pytest.raises(QueryBuilderException):
+            select.compile()
+
+    def test_optimizer_hints_and_straight_join(self):
+        """Test optimizer hint comment and STRAIGHT_JOIN placement."""
+        query = (
+            Select()
+            .from_table('orders')
+            .set_distinct()
+            .set_straight_join()
+            .max_execution_time(500)
+            .set_var('sort_buffer_size', '16M', escape_value=False)
+            .no_range_optimization('orders', 'idx_created')
+            .add_column('user_id')
+            .compile()
+        )
+        assert query.get_query().startswith(
+            "SELECT /*+ MAX_EXECUTION_TIME(500) SET_VAR(sort_buffer_size = 16M) "
+            "NO_RANGE_OPTIMIZATION(`orders` `idx_created`) */ DISTINCT STRAIGHT_JOIN `user_id` FROM"
+        )
+
+    def test_max_execution_time_must_be_positive(self):
+        """Test MAX_EXECUTION_TIME validation."""
+        with pytest.raises(QueryBuilderException):
+            Select().max_execution_time(0)
+
+    def test_locking_read_requires_transaction(self):
+        """Test locking reads are rejected outside an active transaction."""
+        with pytest.raises(QueryBuilderException):
+            Select().from_table('jobs').lock_for_update().compile()
+
+    def test_locking_read_inside_transaction(self, mocker):
+        """Test FOR UPDATE SKIP LOCKED rendering inside an active transaction."""
+        transaction = Transaction(mocker.MagicMock())
+        transaction._is_active = True
+        query = (
+            transaction.get_query_builder()
+            .select()
+            .from_table('jobs')
+            .where('status', 'pending')
+            .set_limit(10)
+            .lock_for_update(skip_locked=True)
+            .compile()
+        )
+        assert query.factory is transaction
+        assert query.query.endswith(" LIMIT 10 FOR UPDATE SKIP LOCKED")
+
+    def test_lock_options_conflict(self):
+        """Test SKIP LOCKED and NOWAIT can't be combined."""
+        with pytest.raises(QueryBuilderException):
+            Select().lock_for_share(skip_locked=True, nowait=True)
+
+    def test_join_with_multiple_on_conditions(self):
+        """Test extra column, literal-value and range predicates stay in the ON clause."""
+        query = (
+            Select()
+            .from_table('orders')
+            .left_join('payments', 'orders.id', 'payments.order_id')
+            .on('orders.user_id', 'payments.user_id')
+            .on_value('payments.status', 'paid')
+            .on_between('payments.created_at', '2024-01-01', '2024-12-31')
+            .compile()
+        )
+        assert query.get_query() == (
+            "SELECT * FROM `orders` LEFT JOIN `payments` ON `orders`.`id` = `payments`.`order_id` "
+            "AND `orders`.`user_id` = `payments`.`user_id` AND `payments`.`status` = 'paid' "
+            "AND `payments`.`created_at` BETWEEN '2024-01-01' AND '2024-12-31'"
+        )
+
+    def test_join_using_cross_and_straight(self):
+        """Test USING, CROSS JOIN and STRAIGHT_JOIN rendering."""
+        query = (
+            Select()
+            .from_table('orders')
+            .join_using('users', 'user_id', 'LEFT')
+            .cross_join('regions')
+            .straight_join('products', 'orders.product_id', 'products.id')
+            .compile()
+        )
+        assert query.get_query() == (
+            "SELECT * FROM `orders` LEFT JOIN `users` USING (`user_id`) CROSS JOIN `regions` "
+            "STRAIGHT_JOIN `products` ON `orders`.`product_id` = `products`.`id`"
+        )
+
+    def test_join_derived_table(self):
+        """Test joining a derived table built from another select."""
+        totals = Select().from_table('payments').add_column('order_id').add_column_sum('amount', 'paid')
+        totals.group_by('order_id')
+        query = Select().from_table('orders').join_sub(totals, 't', 'orders.id', 't.order_id').compile()
+        assert query.get_query() == (
+            "SELECT * FROM `orders` INNER JOIN (SELECT `order_id`, SUM(`amount`) AS `paid` FROM `payments` "
+            " GROUP BY `order_id`) AS t ON `orders`.`id` = `t`.`order_id`"
+        )
+
+    def test_full_join_rejected(self):
+        """Test FULL JOIN is rejected at compile time since MySQL doesn't support it."""
+        select = Select().from_table('orders').full_join('users', 'orders.user_id', 'users.id')
+        with pytest.raises(QueryBuilderException):
+            select.compile()
+
+    def test_on_without_join(self):
+        """Test ON conditions require a join."""
+        with pytest.raises(QueryBuilderException):
+            Select().on('a.id', 'b.id')
@@ -0,0 +1,120 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from src.query_builder.core.db_result import DBResult
+from src.query_builder.core.shard_function import HashShardFunction, LookupShardFunction, RangeShardFunction
+from src.query_builder.core.sharded_factory import ShardedFactory
+from src.query_builder.exceptions.db_factory_exception import DBFactoryException
+from src.query_builder.exceptions.query_builder_exception import QueryBuilderException
+
+
+class TestShardFunctions:
+    """Test suite for the hash, range and lookup shard functions."""
+
+    def test_hash_is_stable(self):
+        """Test a key always maps to the same shard, whatever its type."""
+        shard_function = HashShardFunction(['a', 'b', 'c'])
+        assert shard_function(42) == shard_function('42')
+        assert {shard_function(key) for key in range(100)} == {'a', 'b', 'c'}
+
+    def test_range(self):
+        """Test upper bounds are exclusive and the last range may be unbounded."""
+        shard_function = RangeShardFunction([(100, 'a'), (200, 'b'), (None, 'c')])
+        assert [shard_function(key) for key in (0, 99, 100, 199, 200, 10 ** 9)] == ['a', 'a', 'b', 'b', 'c', 'c']
+
+        with pytest.raises(DBFactoryException):
+            RangeShardFunction([(100, 'a')])(100)
+
+    def test_lookup(self):
+        """Test keys missing from the directory go to the default shard, or fail without one."""
+        assert LookupShardFunction({'acme': 'a'}, default='b')('other') == 'b'
+        with pytest.raises(DBFactoryException):
+            LookupShardFunction({'acme': 'a'})('other')
+
+
+class TestShardedFactory:
+    """Test suite for routing by shard key and scatter-gather."""
+
+    @pytest.fixture
+    def factory(self):
+        shards = {}
+        for name in ('a', 'b'):
+            shard = MagicMock()
+            shard.query = AsyncMock(return_value=DBResult(
+                is_success=True, rows=[{'shard': name}], count=1, affected_rows=1
+            ))
+            shards[name] = shard
+
+        return ShardedFactory(shards, LookupShardFunction({1: 'a', 2: 'b'}))
+
+    @pytest.mark.asyncio
+    async def test_shard_key_routes_to_one_shard(self, factory):
+        """Test a builder with a shard key only runs on the owning shard."""
+        select = factory.get_query_builder().select().from_table('orders').shard_key(2).where('tenant_id', 2)
+        result = await select.compile().commit()
+
+        assert result.rows == [{'shard': 'b'}]
+        factory.shards['a'].query.assert_not_called()
+
+    def test_shard_key_set_twice(self, factory):
+        """Test the shard key can only be given once."""
+        with pytest.raises(QueryBuilderException):
+            factory.get_query_builder().update().shard_key(1).shard_key(2)
+
+    @pytest.mark.asyncio
+    async def test_scatter_gather(self, factory):
+        """Test a read without shard key runs on every shard and the rows are merged."""
+        result = await factory.get_query_builder().select().from_table('orders').compile().commit()
+
+        assert result.is_success
+        assert result.rows == [{'shard': 'a'}, {'shard': 'b'}]
+        assert result.count == 2
+
+    @pytest.mark.asyncio
+    async def test_scatter_failure(self, factory):
+        """Test the merged result fails when one shard fails."""
+        factory.shards['b'].query.return_value = DBResult(is_success=False, message='Deadlock', error_code=1213)
+        result = await factory.query("UPDATE orders SET status = 'done'")
+
+        assert not result.is_success
+        assert result.error_code == 1213
+        assert result.message == 'b: Deadlock'
+
+    @pytest.mark.asyncio
+    async def test_insert_needs_shard_key(self, factory):
+        """Test inserts aren't scattered, they would duplicate the rows."""
+        with pytest.raises(DBFactoryException):
+            await factory.query("INSERT INTO orders (id) VALUES (1)")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('query', [
+        "SELECT * FROM orders ORDER BY id",
+        "SELECT * FROM orders LIMIT 10",
+        "SELECT COUNT(*) AS total FROM orders",
+        "SELECT status, SUM(amount) FROM orders GROUP BY status",
+        "DELETE FROM orders WHERE status = 'done' LIMIT 100",
+    ])
+    async def test_unmergeable_scatter_needs_shard_key(self, factory, query):
+        """Test ordered, limited and aggregated queries aren't scattered, concatenating them gives wrong results."""
+        with pytest.raises(DBFactoryException):
+            await factory.query(query)
+
+        factory.shards['a'].query.assert_not_called()
+        factory.shards['b'].query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unmergeable_query_runs_with_shard_key(self, factory):
+        """Test an ordered, limited query runs on the owning shard once a shard key is given."""
+        result = await factory.get_query_builder().select().from_table('orders').shard_key(2) \
+            .add_order('id', 'DESC').set_limit(10).compile().commit()
+
+        assert result.is_success
+        assert result.rows == [{'shard': 'b'}]
+        factory.shards['a'].query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_scatter_ignores_keywords_in_literals(self, factory):
+        """Test clause keywords inside strings and quoted identifiers don't block a scatter."""
+        result = await factory.query("SELECT * FROM `limit` WHERE note = 'order by count(*)'")
+
+        assert result.is_success
+        assert result.count == 2